@@ -14,6 +14,11 @@ from app.core.config import settings
 from app.db.base import Base # Asegura que los modelos se cargan
 # Importa explícitamente los modelos para asegurarte de que Alembic los vea
 from app.db.models import User, ResourceLink, BlogPost, NewsItem, Item, ContactMessage, Project, ResourceVote
+from app.db.models import IngestionRun, IngestionEvent
+from app.db.models import NewsItemContent, BackfillJob, NewsFeedEntry
+from app.db.models import CollectionVersion, NewsItemSector, SectorCount
+from app.db.models import SearchDocument, ResourceLinkTag, ResourceSubmission, NewsSubmission
+from app.db.models import IdempotencyKey
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
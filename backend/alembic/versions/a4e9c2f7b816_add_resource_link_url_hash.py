@@ -0,0 +1,47 @@
+"""Add resource_links.url_normalized and the unique url_hash index
+
+Revision ID: a4e9c2f7b816
+Revises: f2c8a6d4b319
+Create Date: 2026-10-23 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.urls import normalize_url, url_hash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e9c2f7b816'
+down_revision: Union[str, None] = 'f2c8a6d4b319'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resource_links', sa.Column('url_normalized', sa.String(length=2048), nullable=True))
+    op.add_column('resource_links', sa.Column('url_hash', sa.String(length=64), nullable=True))
+
+    # Backfill oldest first: a later link whose URL normalizes to one already seen
+    # is a duplicate and keeps a NULL hash, so the unique index can be built.
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, url FROM resource_links ORDER BY created_at, id")).fetchall()
+    seen = set()
+    for link_id, url in rows:
+        digest = url_hash(url)
+        values = {"id": link_id, "url_normalized": normalize_url(url), "url_hash": None if digest in seen else digest}
+        seen.add(digest)
+        bind.execute(
+            sa.text("UPDATE resource_links SET url_normalized = :url_normalized, url_hash = :url_hash WHERE id = :id"),
+            values,
+        )
+
+    op.create_index('ix_resource_links_url_hash', 'resource_links', ['url_hash'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resource_links_url_hash', table_name='resource_links')
+    op.drop_column('resource_links', 'url_hash')
+    op.drop_column('resource_links', 'url_normalized')
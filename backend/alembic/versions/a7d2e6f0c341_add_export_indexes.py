@@ -0,0 +1,34 @@
+"""Add resource_links.updated_at and the export ordering indexes
+
+Revision ID: a7d2e6f0c341
+Revises: f3c9d5a1b268
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d2e6f0c341'
+down_revision: Union[str, None] = 'f3c9d5a1b268'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without a server default: SQLite cannot add a column defaulting to CURRENT_TIMESTAMP.
+    op.add_column('resource_links', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE resource_links SET updated_at = created_at")
+    op.create_index('ix_resource_links_updated_at_id', 'resource_links', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_news_items_updated_at_id', 'news_items', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_resource_votes_created_at_id', 'resource_votes', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resource_votes_created_at_id', table_name='resource_votes')
+    op.drop_index('ix_news_items_updated_at_id', table_name='news_items')
+    op.drop_index('ix_resource_links_updated_at_id', table_name='resource_links')
+    op.drop_column('resource_links', 'updated_at')
@@ -0,0 +1,76 @@
+"""Add news_feed read model
+
+Revision ID: a8c4e2f95b17
+Revises: f1d6b8e24a93
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.models.news_item import GUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c4e2f95b17'
+down_revision: Union[str, None] = 'f1d6b8e24a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    news_feed = op.create_table('news_feed',
+    sa.Column('id', GUID(), nullable=False),
+    sa.Column('title', sa.String(length=512), nullable=False),
+    sa.Column('url', sa.String(length=2048), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('imageUrl', sa.String(length=2048), nullable=True),
+    sa.Column('sourceName', sa.String(length=255), nullable=True),
+    sa.Column('sourceId', sa.String(length=255), nullable=True),
+    sa.Column('sectors', sa.JSON(), nullable=True),
+    sa.Column('relevance_rating', sa.Float(), nullable=True),
+    sa.Column('is_community', sa.Boolean(), nullable=False),
+    sa.Column('publishedAt', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('submitted_by_user_id', sa.Integer(), nullable=True),
+    sa.Column('submitter_full_name', sa.String(length=255), nullable=True),
+    sa.Column('submitter_avatar_path', sa.String(length=512), nullable=True),
+    sa.Column('submitter_website_url', sa.String(length=512), nullable=True),
+    sa.Column('promotion_level', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['id'], ['news_items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_news_feed_published_at_id', 'news_feed', ['publishedAt', 'id'], unique=False)
+
+    # Backfill from news_items. Weekly top-20% promotion (level 2) is applied by the
+    # re-rank that runs with the seed reconciliation on startup.
+    news_items = sa.table('news_items',
+        sa.column('id'), sa.column('title'), sa.column('url'), sa.column('description'),
+        sa.column('imageUrl'), sa.column('sourceName'), sa.column('sourceId'), sa.column('sectors'),
+        sa.column('relevance_rating'), sa.column('is_community'), sa.column('publishedAt'),
+        sa.column('created_at'), sa.column('updated_at'), sa.column('submitted_by_user_id'),
+    )
+    user = sa.table('user',
+        sa.column('id'), sa.column('full_name'), sa.column('avatar_url'), sa.column('website_url'),
+    )
+    source = sa.select(
+        news_items.c.id, news_items.c.title, news_items.c.url, news_items.c.description,
+        news_items.c.imageUrl, news_items.c.sourceName, news_items.c.sourceId, news_items.c.sectors,
+        news_items.c.relevance_rating, news_items.c.is_community, news_items.c.publishedAt,
+        news_items.c.created_at, news_items.c.updated_at, news_items.c.submitted_by_user_id,
+        user.c.full_name, user.c.avatar_url, user.c.website_url,
+        sa.case((news_items.c.relevance_rating > 3.5, 1), else_=0),
+    ).select_from(news_items.outerjoin(user, user.c.id == news_items.c.submitted_by_user_id))
+    op.execute(news_feed.insert().from_select([
+        'id', 'title', 'url', 'description', 'imageUrl', 'sourceName', 'sourceId', 'sectors',
+        'relevance_rating', 'is_community', 'publishedAt', 'created_at', 'updated_at', 'submitted_by_user_id',
+        'submitter_full_name', 'submitter_avatar_path', 'submitter_website_url', 'promotion_level',
+    ], source))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_news_feed_published_at_id', table_name='news_feed')
+    op.drop_table('news_feed')
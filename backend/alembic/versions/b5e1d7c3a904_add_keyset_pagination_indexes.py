@@ -0,0 +1,27 @@
+"""Add keyset pagination indexes
+
+Revision ID: b5e1d7c3a904
+Revises: a8c4e2f95b17
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1d7c3a904'
+down_revision: Union[str, None] = 'a8c4e2f95b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_blog_posts_published_date_id', 'blog_posts', ['published_date', 'id'], unique=False)
+    op.create_index('ix_resource_links_pinned_created_at_id', 'resource_links', ['is_pinned', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resource_links_pinned_created_at_id', table_name='resource_links')
+    op.drop_index('ix_blog_posts_published_date_id', table_name='blog_posts')
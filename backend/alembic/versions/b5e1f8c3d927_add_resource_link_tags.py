@@ -0,0 +1,55 @@
+"""Add resource_link_tags
+
+Revision ID: b5e1f8c3d927
+Revises: a7d2e6f0c341
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.tags import canonical_tags
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1f8c3d927'
+down_revision: Union[str, None] = 'a7d2e6f0c341'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 500
+
+
+def upgrade() -> None:
+    resource_link_tags = op.create_table('resource_link_tags',
+    sa.Column('resource_link_id', sa.String(length=100), nullable=False),
+    sa.Column('tag', sa.String(length=100), nullable=False),
+    sa.ForeignKeyConstraint(['resource_link_id'], ['resource_links.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('resource_link_id', 'tag')
+    )
+    op.create_index('ix_resource_link_tags_tag_resource', 'resource_link_tags', ['tag', 'resource_link_id'], unique=False)
+
+    # Backfill from the comma-separated strings, canonicalized the same way as at write time.
+    resource_links = sa.table('resource_links',
+        sa.column('id', sa.String()),
+        sa.column('tags', sa.String()),
+    )
+    result = op.get_bind().execute(sa.select(resource_links.c.id, resource_links.c.tags))
+    while True:
+        chunk = result.fetchmany(CHUNK_SIZE)
+        if not chunk:
+            break
+        rows = [
+            {'resource_link_id': resource_id, 'tag': tag}
+            for resource_id, tags in chunk
+            for tag in canonical_tags(tags)
+        ]
+        if rows:
+            op.bulk_insert(resource_link_tags, rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resource_link_tags_tag_resource', table_name='resource_link_tags')
+    op.drop_table('resource_link_tags')
@@ -0,0 +1,32 @@
+"""Add resource_votes.updated_at and order the votes export by it
+
+Revision ID: b5f3d8e1c742
+Revises: a4e9c2f7b816
+Create Date: 2026-10-19 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5f3d8e1c742'
+down_revision: Union[str, None] = 'a4e9c2f7b816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without a server default: SQLite cannot add a column defaulting to CURRENT_TIMESTAMP.
+    op.add_column('resource_votes', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE resource_votes SET updated_at = created_at")
+    op.create_index('ix_resource_votes_updated_at_id', 'resource_votes', ['updated_at', 'id'], unique=False)
+    op.drop_index('ix_resource_votes_created_at_id', table_name='resource_votes')
+
+
+def downgrade() -> None:
+    op.create_index('ix_resource_votes_created_at_id', 'resource_votes', ['created_at', 'id'], unique=False)
+    op.drop_index('ix_resource_votes_updated_at_id', table_name='resource_votes')
+    op.drop_column('resource_votes', 'updated_at')
@@ -0,0 +1,78 @@
+"""Add ingestion_runs and ingestion_events tables
+
+Revision ID: c41e7a9d2b10
+Revises: fd416b96bc20
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7a9d2b10'
+down_revision: Union[str, None] = 'fd416b96bc20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ingestion_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('trigger', sa.String(length=50), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('articles_fetched', sa.Integer(), nullable=False),
+    sa.Column('articles_processed', sa.Integer(), nullable=False),
+    sa.Column('articles_stored', sa.Integer(), nullable=False),
+    sa.Column('articles_dropped', sa.Integer(), nullable=False),
+    sa.Column('fetch_ms', sa.Integer(), nullable=False),
+    sa.Column('extract_ms', sa.Integer(), nullable=False),
+    sa.Column('llm_ms', sa.Integer(), nullable=False),
+    sa.Column('image_ms', sa.Integer(), nullable=False),
+    sa.Column('insert_ms', sa.Integer(), nullable=False),
+    sa.Column('total_ms', sa.Integer(), nullable=False),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=False),
+    sa.Column('completion_tokens', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ingestion_runs_id'), 'ingestion_runs', ['id'], unique=False)
+    op.create_index(op.f('ix_ingestion_runs_status'), 'ingestion_runs', ['status'], unique=False)
+    op.create_index(op.f('ix_ingestion_runs_started_at'), 'ingestion_runs', ['started_at'], unique=False)
+
+    op.create_table('ingestion_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('run_id', sa.Integer(), nullable=False),
+    sa.Column('url', sa.String(length=2048), nullable=False),
+    sa.Column('outcome', sa.String(length=20), nullable=False),
+    sa.Column('drop_reason', sa.String(length=32), nullable=True),
+    sa.Column('provider', sa.String(length=20), nullable=True),
+    sa.Column('extract_ms', sa.Integer(), nullable=True),
+    sa.Column('llm_ms', sa.Integer(), nullable=True),
+    sa.Column('image_ms', sa.Integer(), nullable=True),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=True),
+    sa.Column('completion_tokens', sa.Integer(), nullable=True),
+    sa.Column('relevance_rating', sa.Float(), nullable=True),
+    sa.Column('credibility_score', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['run_id'], ['ingestion_runs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ingestion_events_id'), 'ingestion_events', ['id'], unique=False)
+    op.create_index(op.f('ix_ingestion_events_run_id'), 'ingestion_events', ['run_id'], unique=False)
+    op.create_index(op.f('ix_ingestion_events_drop_reason'), 'ingestion_events', ['drop_reason'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ingestion_events_drop_reason'), table_name='ingestion_events')
+    op.drop_index(op.f('ix_ingestion_events_run_id'), table_name='ingestion_events')
+    op.drop_index(op.f('ix_ingestion_events_id'), table_name='ingestion_events')
+    op.drop_table('ingestion_events')
+    op.drop_index(op.f('ix_ingestion_runs_started_at'), table_name='ingestion_runs')
+    op.drop_index(op.f('ix_ingestion_runs_status'), table_name='ingestion_runs')
+    op.drop_index(op.f('ix_ingestion_runs_id'), table_name='ingestion_runs')
+    op.drop_table('ingestion_runs')
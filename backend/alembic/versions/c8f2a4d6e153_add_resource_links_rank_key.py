@@ -0,0 +1,49 @@
+"""Add resource_links.rank_key and its ordering indexes
+
+Revision ID: c8f2a4d6e153
+Revises: b5e1f8c3d927
+Create Date: 2026-10-20 00:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.resource_ranking import rank_key_expression
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f2a4d6e153'
+down_revision: Union[str, None] = 'b5e1f8c3d927'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resource_links', sa.Column('rank_key', sa.BigInteger(), server_default='0', nullable=False))
+
+    resource_links = sa.table('resource_links',
+        sa.column('is_pinned', sa.Boolean()),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+        sa.column('likes', sa.Integer()),
+        sa.column('dislikes', sa.Integer()),
+        sa.column('rank_key', sa.BigInteger()),
+    )
+    op.execute(resource_links.update().values(rank_key=rank_key_expression(
+        is_pinned=resource_links.c.is_pinned, created_at=resource_links.c.created_at,
+        likes=resource_links.c.likes, dislikes=resource_links.c.dislikes,
+        now=datetime.now(timezone.utc),
+    )))
+
+    op.create_index('ix_resource_links_rank', 'resource_links', ['rank_key', 'created_at', 'id'], unique=False)
+    op.create_index('ix_resource_links_type_rank', 'resource_links', ['resource_type', 'rank_key', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_resource_links_pinned_created_at_id', table_name='resource_links')
+
+
+def downgrade() -> None:
+    op.create_index('ix_resource_links_pinned_created_at_id', 'resource_links', ['is_pinned', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_resource_links_type_rank', table_name='resource_links')
+    op.drop_index('ix_resource_links_rank', table_name='resource_links')
+    op.drop_column('resource_links', 'rank_key')
@@ -0,0 +1,71 @@
+"""Add news_item_sectors and sector_counts
+
+Revision ID: d2a7e4b9c135
+Revises: c9f3a1e6d482
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from collections import Counter
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.sectors import canonical_sectors
+from app.db.models.news_item import GUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a7e4b9c135'
+down_revision: Union[str, None] = 'c9f3a1e6d482'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 500
+
+
+def upgrade() -> None:
+    news_item_sectors = op.create_table('news_item_sectors',
+    sa.Column('news_item_id', GUID(), nullable=False),
+    sa.Column('sector', sa.String(length=100), nullable=False),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['news_item_id'], ['news_items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('news_item_id', 'sector')
+    )
+    op.create_index('ix_news_item_sectors_sector_published', 'news_item_sectors', ['sector', 'published_at', 'news_item_id'], unique=False)
+    sector_counts = op.create_table('sector_counts',
+    sa.Column('sector', sa.String(length=100), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('sector')
+    )
+    op.create_index(op.f('ix_sector_counts_count'), 'sector_counts', ['count'], unique=False)
+
+    # Backfill from the JSON tags, canonicalized the same way as at write time.
+    news_items = sa.table('news_items',
+        sa.column('id', GUID()),
+        sa.column('sectors', sa.JSON()),
+        sa.column('publishedAt', sa.DateTime(timezone=True)),
+    )
+    result = op.get_bind().execute(sa.select(news_items.c.id, news_items.c.sectors, news_items.c.publishedAt))
+    counts = Counter()
+    while True:
+        chunk = result.fetchmany(CHUNK_SIZE)
+        if not chunk:
+            break
+        rows = [
+            {'news_item_id': item_id, 'sector': sector, 'published_at': published_at}
+            for item_id, sectors, published_at in chunk
+            for sector in canonical_sectors(sectors if isinstance(sectors, list) else None)
+        ]
+        if rows:
+            op.bulk_insert(news_item_sectors, rows)
+            counts.update(row['sector'] for row in rows)
+    if counts:
+        op.bulk_insert(sector_counts, [{'sector': sector, 'count': count} for sector, count in counts.items()])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_sector_counts_count'), table_name='sector_counts')
+    op.drop_table('sector_counts')
+    op.drop_index('ix_news_item_sectors_sector_published', table_name='news_item_sectors')
+    op.drop_table('news_item_sectors')
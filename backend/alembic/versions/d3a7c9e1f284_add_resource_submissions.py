@@ -0,0 +1,47 @@
+"""Add resource_submissions
+
+Revision ID: d3a7c9e1f284
+Revises: c8f2a4d6e153
+Create Date: 2026-10-21 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a7c9e1f284'
+down_revision: Union[str, None] = 'c8f2a4d6e153'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('resource_submissions',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('url', sa.String(length=2048), nullable=False),
+    sa.Column('active_url', sa.String(length=2048), nullable=True),
+    sa.Column('title', sa.String(length=255), nullable=True),
+    sa.Column('personal_note', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('resource_link_id', sa.String(length=100), nullable=True),
+    sa.Column('author_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['author_id'], ['user.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['resource_link_id'], ['resource_links.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('active_url')
+    )
+    op.create_index(op.f('ix_resource_submissions_status'), 'resource_submissions', ['status'], unique=False)
+    op.create_index(op.f('ix_resource_submissions_author_id'), 'resource_submissions', ['author_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resource_submissions_author_id'), table_name='resource_submissions')
+    op.drop_index(op.f('ix_resource_submissions_status'), table_name='resource_submissions')
+    op.drop_table('resource_submissions')
@@ -0,0 +1,30 @@
+"""Add enrichment_source to news_items
+
+Revision ID: d7b2f4a61c35
+Revises: c41e7a9d2b10
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b2f4a61c35'
+down_revision: Union[str, None] = 'c41e7a9d2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('news_items', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('enrichment_source', sa.String(length=20), nullable=True))
+        batch_op.create_index(batch_op.f('ix_news_items_enrichment_source'), ['enrichment_source'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('news_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_news_items_enrichment_source'))
+        batch_op.drop_column('enrichment_source')
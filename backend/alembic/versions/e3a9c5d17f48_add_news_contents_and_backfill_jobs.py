@@ -0,0 +1,73 @@
+"""Add prompt_version to news_items, news_item_contents and backfill_jobs
+
+Revision ID: e3a9c5d17f48
+Revises: d7b2f4a61c35
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.models.news_item import GUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a9c5d17f48'
+down_revision: Union[str, None] = 'd7b2f4a61c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('news_items', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('prompt_version', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_news_items_prompt_version'), ['prompt_version'], unique=False)
+
+    op.create_table('news_item_contents',
+    sa.Column('news_item_id', GUID(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('extracted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['news_item_id'], ['news_items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('news_item_id')
+    )
+
+    op.create_table('backfill_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('target_prompt_version', sa.Integer(), nullable=False),
+    sa.Column('published_since', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('published_until', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('batch_size', sa.Integer(), nullable=False),
+    sa.Column('max_items', sa.Integer(), nullable=True),
+    sa.Column('last_news_item_id', GUID(), nullable=True),
+    sa.Column('total_candidates', sa.Integer(), nullable=False),
+    sa.Column('processed', sa.Integer(), nullable=False),
+    sa.Column('updated', sa.Integer(), nullable=False),
+    sa.Column('skipped', sa.Integer(), nullable=False),
+    sa.Column('failed', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_by_user_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_user_id'], ['user.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('backfill_jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_backfill_jobs_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_backfill_jobs_status'), ['status'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('backfill_jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_backfill_jobs_status'))
+        batch_op.drop_index(batch_op.f('ix_backfill_jobs_id'))
+    op.drop_table('backfill_jobs')
+    op.drop_table('news_item_contents')
+
+    with op.batch_alter_table('news_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_news_items_prompt_version'))
+        batch_op.drop_column('prompt_version')
@@ -0,0 +1,76 @@
+"""Add search_documents and its full-text index
+
+Revision ID: e4b8c2d7f519
+Revises: d2a7e4b9c135
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.search import blog_document, create_search_schema, drop_search_schema, news_document, resource_document
+from app.db.models.news_item import GUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8c2d7f519'
+down_revision: Union[str, None] = 'd2a7e4b9c135'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 500
+
+
+def upgrade() -> None:
+    search_documents = op.create_table('search_documents',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('doc_type', sa.String(length=20), nullable=False),
+    sa.Column('doc_id', sa.String(length=100), nullable=False),
+    sa.Column('title', sa.String(length=512), nullable=False),
+    sa.Column('tags', sa.Text(), nullable=True),
+    sa.Column('body', sa.Text(), nullable=True),
+    sa.Column('url', sa.String(length=2048), nullable=True),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_search_documents_type_doc_id', 'search_documents', ['doc_type', 'doc_id'], unique=True)
+
+    # The FTS5 triggers / generated tsvector column index the rows as they are backfilled.
+    bind = op.get_bind()
+    create_search_schema(bind)
+
+    news_items = sa.table('news_items',
+        sa.column('id', GUID()), sa.column('title', sa.String()), sa.column('sectors', sa.JSON()),
+        sa.column('description', sa.Text()), sa.column('sourceName', sa.String()),
+        sa.column('url', sa.String()), sa.column('publishedAt', sa.DateTime(timezone=True)),
+    )
+    resource_links = sa.table('resource_links',
+        sa.column('id', sa.String()), sa.column('title', sa.String()), sa.column('tags', sa.String()),
+        sa.column('ai_generated_description', sa.Text()), sa.column('personal_note', sa.Text()),
+        sa.column('url', sa.String()), sa.column('created_at', sa.DateTime(timezone=True)),
+    )
+    blog_posts = sa.table('blog_posts',
+        sa.column('id', sa.String()), sa.column('title', sa.String()), sa.column('tags', sa.String()),
+        sa.column('excerpt', sa.Text()), sa.column('content', sa.Text()), sa.column('slug', sa.String()),
+        sa.column('published_date', sa.Date()), sa.column('status', sa.String()),
+    )
+    sources = (
+        (sa.select(*news_items.c), news_document),
+        (sa.select(*resource_links.c), resource_document),
+        (sa.select(*[c for c in blog_posts.c if c.name != 'status']).where(blog_posts.c.status == 'published'), blog_document),
+    )
+    for stmt, build in sources:
+        result = bind.execute(stmt)
+        while True:
+            chunk = result.fetchmany(CHUNK_SIZE)
+            if not chunk:
+                break
+            op.bulk_insert(search_documents, [build(row) for row in chunk])
+
+
+def downgrade() -> None:
+    drop_search_schema(op.get_bind())
+    op.drop_index('ix_search_documents_type_doc_id', table_name='search_documents')
+    op.drop_table('search_documents')
@@ -0,0 +1,50 @@
+"""Add news_submissions
+
+Revision ID: e6b4d2f8a915
+Revises: d3a7c9e1f284
+Create Date: 2026-10-21 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.models.news_item import GUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b4d2f8a915'
+down_revision: Union[str, None] = 'd3a7c9e1f284'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('news_submissions',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('url', sa.String(length=2048), nullable=False),
+    sa.Column('active_url', sa.String(length=2048), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('retryable', sa.Boolean(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('news_item_id', GUID(), nullable=True),
+    sa.Column('submitted_by_user_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['news_item_id'], ['news_items.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['submitted_by_user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('active_url')
+    )
+    op.create_index(op.f('ix_news_submissions_status'), 'news_submissions', ['status'], unique=False)
+    op.create_index(op.f('ix_news_submissions_submitted_by_user_id'), 'news_submissions', ['submitted_by_user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_news_submissions_submitted_by_user_id'), table_name='news_submissions')
+    op.drop_index(op.f('ix_news_submissions_status'), table_name='news_submissions')
+    op.drop_table('news_submissions')
@@ -0,0 +1,32 @@
+"""Add input_tokens_saved to ingestion_runs and ingestion_events
+
+Revision ID: f1d6b8e24a93
+Revises: e3a9c5d17f48
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d6b8e24a93'
+down_revision: Union[str, None] = 'e3a9c5d17f48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('ingestion_runs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('input_tokens_saved', sa.Integer(), server_default='0', nullable=False))
+    with op.batch_alter_table('ingestion_events', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('input_tokens_saved', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ingestion_events', schema=None) as batch_op:
+        batch_op.drop_column('input_tokens_saved')
+    with op.batch_alter_table('ingestion_runs', schema=None) as batch_op:
+        batch_op.drop_column('input_tokens_saved')
@@ -0,0 +1,69 @@
+"""Add idempotency_keys and normalize active submission URLs
+
+Revision ID: f2c8a6d4b319
+Revises: e6b4d2f8a915
+Create Date: 2026-10-22 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.urls import normalize_url
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8a6d4b319'
+down_revision: Union[str, None] = 'e6b4d2f8a915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('idempotency_keys',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('request_fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('response_body', sa.Text(), nullable=True),
+    sa.Column('response_headers', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'key')
+    )
+    op.create_index(op.f('ix_idempotency_keys_created_at'), 'idempotency_keys', ['created_at'], unique=False)
+
+    # Submissions still running reserve their URL as typed; reserve the normalized form instead.
+    # Oldest first: a later submission whose URL normalizes to one already seen is
+    # a duplicate and fails, freeing its URL before the others are rewritten, so
+    # the unique active_url index holds at every step.
+    bind = op.get_bind()
+    for table in ('resource_submissions', 'news_submissions'):
+        rows = bind.execute(
+            sa.text(f"SELECT id, url FROM {table} WHERE active_url IS NOT NULL ORDER BY created_at, id")
+        ).fetchall()
+        seen = set()
+        kept, duplicates = [], []
+        for submission_id, url in rows:
+            active_url = normalize_url(url)
+            (duplicates if active_url in seen else kept).append({"id": submission_id, "active_url": active_url})
+            seen.add(active_url)
+        for values in duplicates:
+            bind.execute(
+                sa.text(
+                    f"UPDATE {table} SET active_url = NULL, status = 'failed', finished_at = CURRENT_TIMESTAMP, "
+                    "error = 'This URL is already being analysed by another submission.' WHERE id = :id"
+                ),
+                {"id": values["id"]},
+            )
+        for values in kept:
+            bind.execute(sa.text(f"UPDATE {table} SET active_url = :active_url WHERE id = :id"), values)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table in ('resource_submissions', 'news_submissions'):
+        bind.execute(sa.text(f"UPDATE {table} SET active_url = url WHERE active_url IS NOT NULL"))
+    op.drop_index(op.f('ix_idempotency_keys_created_at'), table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
@@ -0,0 +1,56 @@
+"""Add pre-rendered content, toc and word_count to blog_posts
+
+Revision ID: f3c9d5a1b268
+Revises: e4b8c2d7f519
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.blog_content import make_excerpt, render_content
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9d5a1b268'
+down_revision: Union[str, None] = 'e4b8c2d7f519'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('blog_posts', sa.Column('content_html', sa.Text(), nullable=True))
+    op.add_column('blog_posts', sa.Column('toc', sa.JSON(), nullable=True))
+    op.add_column('blog_posts', sa.Column('word_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Render every existing post the way crud_blog.render_post does at write time.
+    blog_posts = sa.table('blog_posts',
+        sa.column('id', sa.String()),
+        sa.column('content', sa.Text()),
+        sa.column('excerpt', sa.Text()),
+        sa.column('content_html', sa.Text()),
+        sa.column('toc', sa.JSON()),
+        sa.column('word_count', sa.Integer()),
+    )
+    bind = op.get_bind()
+    posts = bind.execute(sa.select(blog_posts.c.id, blog_posts.c.content, blog_posts.c.excerpt)).all()
+    for post_id, content, excerpt in posts:
+        rendered = render_content(content)
+        bind.execute(
+            blog_posts.update()
+            .where(blog_posts.c.id == post_id)
+            .values(
+                content_html=rendered.html,
+                toc=rendered.toc,
+                word_count=rendered.word_count,
+                excerpt=excerpt or make_excerpt(rendered.text) or None,
+            )
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('blog_posts', 'word_count')
+    op.drop_column('blog_posts', 'toc')
+    op.drop_column('blog_posts', 'content_html')
@@ -2,13 +2,14 @@ from collections.abc import Generator
 from typing import Annotated
 
 from jose import jwt, JWTError
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import security
 from app.core.config import settings
+from app.core.response_cache import collection_versions, etag_matches, make_etag
 from app.db.session import get_db
 from app.schemas.user import User
 from app.schemas.token import TokenPayload
@@ -72,8 +73,28 @@ def get_current_active_user(current_user: CurrentUser) -> models.User:
 CurrentUserActive = Annotated[models.User, Depends(get_current_active_user)]
 
 def get_current_active_superuser(current_user: CurrentUserActive) -> models.User:
-    if not crud.user.is_superuser(current_user):
+    if not current_user.is_superuser:
         raise HTTPException(
             status_code=403, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+def conditional_get(namespace: str):
+    """
+    Dependency factory for conditional GETs on a collection. Takes the collection
+    version from memory (one primary-key lookup when it is missing or expired),
+    sets the ETag header and answers 304 Not Modified before the endpoint runs
+    when If-None-Match already holds it.
+    Returns the ETag, for endpoints that build their own Response.
+    """
+    async def check_etag(request: Request, response: Response, session: SessionDep) -> str:
+        version = collection_versions.get(namespace)
+        if version is None:
+            version = await crud.collection_version.get_version(session, namespace=namespace)
+            collection_versions.update({namespace: version})
+        etag = make_etag(namespace, version, request)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return etag
+    return check_etag
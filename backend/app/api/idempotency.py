@@ -0,0 +1,100 @@
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.crud_idempotency_key import idempotency_key as crud_idempotency_key
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+# Response headers worth replaying with the stored body.
+STORED_HEADERS = ("Location", "Retry-After")
+
+Handler = Callable[[], Awaitable[Tuple[BaseModel, Dict[str, str]]]]
+
+
+async def _fingerprint(request: Request) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {request.url.path}\n".encode())
+    digest.update(await request.body())
+    return digest.hexdigest()
+
+
+def _as_aware(moment: datetime) -> datetime:
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+async def idempotent_response(
+    db: AsyncSession,
+    request: Request,
+    *,
+    user_id: int,
+    status_code: int,
+    handler: Handler,
+) -> Response:
+    """
+    Runs `handler` (which returns the response model and headers) once per
+    `Idempotency-Key` header and user. A retry with the same key and request
+    gets the stored response, marked with `Idempotent-Replayed: true`; the same
+    key with a different request is a 422, and a retry while the first request
+    is still running a 409. Failed requests (HTTP errors included) are not
+    stored, so they can be retried with the same key. Without the header,
+    `handler` simply runs.
+    """
+    key: Optional[str] = request.headers.get(IDEMPOTENCY_HEADER)
+    if not key:
+        model, headers = await handler()
+        return Response(model.model_dump_json(), status_code=status_code, headers=headers, media_type="application/json")
+    if len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters.")
+
+    fingerprint = await _fingerprint(request)
+    expires_before = datetime.now(timezone.utc) - timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+    for _ in range(2):
+        if await crud_idempotency_key.reserve(db, user_id=user_id, key=key, fingerprint=fingerprint):
+            break
+        stored = await crud_idempotency_key.get_for_user(db, user_id=user_id, key=key)
+        if stored is None:
+            continue  # Released meanwhile: claim it again
+        if _as_aware(stored.created_at) < expires_before:
+            db.expunge(stored)  # Its identity is claimed again below
+            await crud_idempotency_key.release(db, user_id=user_id, key=key)
+            continue
+        if stored.request_fingerprint != fingerprint:
+            raise HTTPException(status_code=422, detail=f"This {IDEMPOTENCY_HEADER} was already used for a different request.")
+        if stored.status_code is None:
+            raise HTTPException(status_code=409, detail=f"A request with this {IDEMPOTENCY_HEADER} is still being processed.")
+        logger.info(f"[Idempotency] Replaying stored response for user {user_id}, key '{key}'.")
+        headers = json.loads(stored.response_headers or "{}")
+        headers[REPLAYED_HEADER] = "true"
+        return Response(stored.response_body, status_code=stored.status_code, headers=headers, media_type="application/json")
+    else:
+        raise HTTPException(status_code=409, detail=f"A request with this {IDEMPOTENCY_HEADER} is still being processed.")
+
+    try:
+        model, headers = await handler()
+    except Exception:
+        await db.rollback()
+        await crud_idempotency_key.release(db, user_id=user_id, key=key)
+        raise
+    body = model.model_dump_json()
+    stored_headers = {name: value for name, value in headers.items() if name in STORED_HEADERS}
+    await crud_idempotency_key.complete(
+        db, user_id=user_id, key=key, status_code=status_code, body=body, headers=stored_headers
+    )
+    return Response(body, status_code=status_code, headers=headers, media_type="application/json")
+
+
+async def purge_expired_keys(db: AsyncSession) -> int:
+    """Deletes stored responses older than IDEMPOTENCY_KEY_TTL_HOURS. Does not commit."""
+    before = datetime.now(timezone.utc) - timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+    return await crud_idempotency_key.purge_expired(db, before=before)
@@ -6,6 +6,9 @@ from app.api.routes import news
 from app.api.routes import contact
 from app.api.routes import resource_links
 from app.api.routes import home
+from app.api.routes import ingestion
+from app.api.routes import search
+from app.api.routes import exports
 from app.core.config import settings
 
 api_router = APIRouter()
@@ -26,6 +29,9 @@ api_router.include_router(news.router, prefix="/news", tags=["news"])
 api_router.include_router(contact.router, prefix="/contact", tags=["contact"])
 api_router.include_router(resource_links.router, prefix="/resource-links", tags=["resource-links"])
 api_router.include_router(home.router)
+api_router.include_router(ingestion.router, prefix="/ingestion", tags=["ingestion"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
 
 
 if settings.ENVIRONMENT == "local":
@@ -1,12 +1,12 @@
 # app/api/routes/blog.py
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, status
 from typing import List, Optional, Any
 from sqlalchemy.ext.asyncio import AsyncSession # Switch to AsyncSession
 # from sqlalchemy.orm import Session # No longer used
 import logging
 
 # Import necessary schemas
-from app.schemas.blog import BlogPostRead, BlogPostCreate, BlogPostUpdate # Add BlogPostCreate and Update
+from app.schemas.blog import BlogPostRead, BlogPostCreate, BlogPostUpdate, BLOG_POST_PROJECTION # Add BlogPostCreate and Update
 # from app.db_mock import blog_posts_db # No longer used
 from app import crud, schemas
 from app.db import models
@@ -14,6 +14,9 @@ from app.api import deps # For authentication dependencies
 from app.schemas.msg import Message # If used for responses
 from app.db.models.user import User # For the current_user type
 from app.core.config import settings
+from app.core.pagination import InvalidCursorError
+from app.core.projection import InvalidFieldsError
+from app.core.response_cache import response_cache
 
 router = APIRouter()
 
@@ -43,34 +46,52 @@ async def create_blog_post_route(
 @router.get("", response_model=schemas.blog.BlogPostList, include_in_schema=False)
 @router.get("/", response_model=schemas.blog.BlogPostList)
 async def read_blog_posts(
+    request: Request,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None, # Opaque cursor from `next_cursor` of the previous page
     show_automated: bool = False, # New parameter to control visibility
+    fields: Optional[str] = None, # Comma-separated item fields to return (e.g. id,title,slug,excerpt); all by default
     current_user: models.User = Depends(deps.get_current_user_or_none),
+    etag: str = Depends(deps.conditional_get("blog")),
 ):
     """
     Retrieve blog posts.
     - By default, only returns posts with a LinkedIn URL (human-created).
     - Set show_automated=true to include all posts.
+    - Pass the returned `next_cursor` as `cursor` to get the next page.
+    - Set `fields` to trim each item to the listed fields (e.g. leave out `content`).
     """
-    logger.info(f"[API Blog] Reading blog posts with skip={skip}, limit={limit}, show_automated={show_automated}")
+    logger.info(f"[API Blog] Reading blog posts with skip={skip}, limit={limit}, cursor={cursor}, show_automated={show_automated}")
+    cache_key = response_cache.key_for("blog", request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
         # If show_automated is False, we require a linkedin_post_url
         require_linkedin = not show_automated
-        posts = await crud.blog_post.get_multi(
-            db=db, skip=skip, limit=limit, require_linkedin_url=require_linkedin
+        selected_fields = BLOG_POST_PROJECTION.parse_fields(fields)
+        rows, next_cursor = await crud.blog_post.get_page_rows(
+            db=db, columns=BLOG_POST_PROJECTION.columns(selected_fields),
+            skip=skip, limit=limit, cursor=cursor, require_linkedin_url=require_linkedin
         )
-        logger.info(f"[API Blog] Found {len(posts)} blog posts with require_linkedin_url={require_linkedin}.")
-        if posts is None:
-            posts = []
-        return {"items": posts}
+        logger.info(f"[API Blog] Found {len(rows)} blog posts with require_linkedin_url={require_linkedin}.")
+        return response_cache.store_json(
+            cache_key,
+            {"items": BLOG_POST_PROJECTION.render(rows, selected_fields), "next_cursor": next_cursor},
+            headers={"ETag": etag},
+        )
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
     except Exception as e:
         logger.error(f"[API Blog] Error reading blog posts: {e}", exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error retrieving blog posts")
 
 # Route to read a specific blog post by SLUG
-@router.get("/{slug}", response_model=BlogPostRead)
+@router.get("/{slug}", response_model=BlogPostRead, dependencies=[Depends(deps.conditional_get("blog"))])
 async def read_blog_post_by_slug_route(slug: str, db: AsyncSession = Depends(deps.get_db)):
     """Retrieve a specific blog post by slug."""
     logger.info(f"[API Blog] Reading blog post by slug: {slug}")
@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Literal, Optional
+from datetime import datetime
+import logging
+
+from app.api import deps
+from app import crud
+from app.core.exports import export_response
+
+router = APIRouter(dependencies=[Depends(deps.get_current_active_superuser)])
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["ndjson", "csv"]
+
+
+def _wants_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def _export(request: Request, crud_obj, name: str, export_format: str, since: Optional[datetime]) -> StreamingResponse:
+    statement, columns = crud_obj.export_statement(since=since)
+    logger.info(f"[API Exports] Streaming {name} as {export_format} (since={since}).")
+    return export_response(
+        statement, columns=columns, export_format=export_format, filename=name, gzip=_wants_gzip(request)
+    )
+
+
+@router.get("/news")
+async def export_news(
+    request: Request,
+    format: ExportFormat = Query("ndjson", description="ndjson (one JSON object per line) or csv"),
+    updated_since: Optional[datetime] = Query(None, description="Only items created or changed at or after this time"),
+) -> StreamingResponse:
+    """
+    Streams every news item, oldest change first (ordered by updated_at, id).
+    Gzip-compressed when the client sends `Accept-Encoding: gzip`. Superuser only.
+    """
+    return _export(request, crud.news_item, "news", format, updated_since)
+
+
+@router.get("/resources")
+async def export_resources(
+    request: Request,
+    format: ExportFormat = Query("ndjson", description="ndjson (one JSON object per line) or csv"),
+    updated_since: Optional[datetime] = Query(None, description="Only resources created or changed at or after this time"),
+) -> StreamingResponse:
+    """Streams every resource link, oldest change first (ordered by updated_at, id). Superuser only."""
+    return _export(request, crud.resource_link, "resources", format, updated_since)
+
+
+@router.get("/votes")
+async def export_votes(
+    request: Request,
+    format: ExportFormat = Query("ndjson", description="ndjson (one JSON object per line) or csv"),
+    updated_since: Optional[datetime] = Query(None, description="Only votes cast or switched at or after this time"),
+) -> StreamingResponse:
+    """Streams every resource vote, oldest change first (ordered by updated_at, id). Superuser only."""
+    return _export(request, crud.resource_vote, "votes", format, updated_since)
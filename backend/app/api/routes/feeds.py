@@ -0,0 +1,58 @@
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from email.utils import format_datetime, parsedate_to_datetime
+import logging
+
+from app.core.response_cache import etag_matches
+from app.services import feed_service
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Readers and crawlers may reuse a copy for a few minutes, then revalidate with the ETag.
+CACHE_CONTROL = "public, max-age=300"
+
+
+def _not_modified_since(request: Request, feed_file: feed_service.FeedFile) -> bool:
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or request.headers.get("if-none-match"):
+        return False  # If-None-Match takes precedence (RFC 9110)
+    try:
+        return feed_file.last_modified <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+async def _serve(request: Request, name: str) -> Response:
+    feed_file = feed_service.feed_store.get(name)
+    if feed_file is None:
+        # First hit before the startup generation finished.
+        await feed_service.regenerate({name})
+        feed_file = feed_service.feed_store.get(name)
+        if feed_file is None:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Feed not available yet.")
+    headers = {
+        "ETag": feed_file.etag,
+        "Last-Modified": format_datetime(feed_file.last_modified, usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+    if etag_matches(request.headers.get("if-none-match"), feed_file.etag) or _not_modified_since(request, feed_file):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=feed_file.body, media_type=feed_service.MEDIA_TYPES[name], headers=headers)
+
+
+@router.get("/feeds/news.xml")
+async def news_feed(request: Request) -> Response:
+    """RSS 2.0 feed of the latest news, pre-generated when the news change."""
+    return await _serve(request, feed_service.NEWS_FEED)
+
+
+@router.get("/feeds/blog.xml")
+async def blog_feed(request: Request) -> Response:
+    """Atom feed of the latest blog posts, pre-generated when the blog changes."""
+    return await _serve(request, feed_service.BLOG_FEED)
+
+
+@router.get("/sitemap.xml")
+async def sitemap(request: Request) -> Response:
+    """Sitemap of the site's pages and published posts."""
+    return await _serve(request, feed_service.SITEMAP)
@@ -0,0 +1,143 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from datetime import datetime, timedelta, timezone
+import logging
+
+from app import crud
+from app.api import deps
+from app.core.config import settings
+from app.db.models.user import User
+from app.db.models.backfill import BackfillJob
+from app.schemas.ingestion import IngestionRunRead, IngestionStats, BackfillJobCreate, BackfillJobRead
+from app.services import backfill_service
+from app.services.gemini_service import PROMPT_VERSION
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/runs", response_model=List[IngestionRunRead])
+async def read_ingestion_runs(
+    limit: int = Query(20, ge=1, le=200),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_superuser)
+):
+    """Most recent news ingestion runs with per-stage timings. Superuser only."""
+    return await crud.ingestion_run.get_recent(db=db, limit=limit)
+
+
+@router.get("/stats", response_model=IngestionStats)
+async def read_ingestion_stats(
+    days: int = Query(7, ge=1, le=365),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Aggregate ingestion stats for the last `days` days: stage wall time shares,
+    drop reasons, providers and token usage. Superuser only.
+    """
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    logger.info(f"[API Ingestion] User {current_user.email} reading ingestion stats since {since}")
+    return await crud.ingestion_run.get_stats(db=db, since=since)
+
+
+# --- Backfills de re-enriquecimiento ---
+
+@router.post("/backfills", response_model=BackfillJobRead, status_code=status.HTTP_202_ACCEPTED)
+async def create_backfill(
+    job_in: BackfillJobCreate,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Starts a resumable job that re-enriches news items evaluated with a prompt
+    version older than `target_prompt_version` (by default the current one).
+    Only one backfill runs at a time. Superuser only.
+    """
+    if await crud.backfill_job.get_active(db):
+        raise HTTPException(status_code=409, detail="A backfill job is already running.")
+    job = BackfillJob(
+        target_prompt_version=job_in.target_prompt_version or PROMPT_VERSION,
+        published_since=job_in.published_since,
+        published_until=job_in.published_until,
+        batch_size=job_in.batch_size or settings.BACKFILL_BATCH_SIZE,
+        max_items=job_in.max_items,
+        created_by_user_id=current_user.id,
+    )
+    job = await backfill_service.create_job(db, job)
+    logger.info(f"[API Ingestion] User {current_user.email} started backfill {job.id} ({job.total_candidates} candidates)")
+    return job
+
+
+@router.get("/backfills", response_model=List[BackfillJobRead])
+async def read_backfills(
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_superuser)
+):
+    return await crud.backfill_job.get_recent(db=db, limit=limit)
+
+
+@router.get("/backfills/{job_id}", response_model=BackfillJobRead)
+async def read_backfill(
+    job_id: int,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_superuser)
+):
+    """Progress of a backfill job (processed/total, throughput, outcome counts)."""
+    job = await crud.backfill_job.get(db=db, id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Backfill job not found")
+    return job
+
+
+async def _set_backfill_status(db: AsyncSession, job_id: int, *, allowed_from: tuple, new_status: str) -> BackfillJob:
+    job = await crud.backfill_job.get(db=db, id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Backfill job not found")
+    if job.status not in allowed_from:
+        raise HTTPException(status_code=409, detail=f"Cannot change a '{job.status}' backfill to '{new_status}'.")
+    job.status = new_status
+    if new_status == "cancelled":
+        job.finished_at = datetime.now(timezone.utc)
+    elif new_status == "running":
+        job.error = None
+        job.finished_at = None
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+@router.post("/backfills/{job_id}/pause", response_model=BackfillJobRead)
+async def pause_backfill(
+    job_id: int,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_superuser)
+):
+    """Stops the job after the chunk in flight; its checkpoint is kept."""
+    return await _set_backfill_status(db, job_id, allowed_from=("running",), new_status="paused")
+
+
+@router.post("/backfills/{job_id}/resume", response_model=BackfillJobRead)
+async def resume_backfill(
+    job_id: int,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_superuser)
+):
+    """Continues a paused or failed job from its last committed checkpoint."""
+    active = await crud.backfill_job.get_active(db)
+    if active and active.id != job_id:
+        raise HTTPException(status_code=409, detail="Another backfill job is already running.")
+    job = await _set_backfill_status(db, job_id, allowed_from=("paused", "failed", "running"), new_status="running")
+    backfill_service.start_job(job.id)
+    return job
+
+
+@router.post("/backfills/{job_id}/cancel", response_model=BackfillJobRead)
+async def cancel_backfill(
+    job_id: int,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_superuser)
+):
+    return await _set_backfill_status(db, job_id, allowed_from=("pending", "running", "paused", "failed"), new_status="cancelled")
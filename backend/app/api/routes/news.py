@@ -1,16 +1,22 @@
 import logging # Import logging
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func
-from typing import List, Optional
-from datetime import datetime, timezone, timedelta
+from sqlalchemy.orm import selectinload
+from typing import Dict, List, Optional, Tuple
 
 # from app.schemas.news_item import NewsItemRead # Adjust according to your schema structure -> Incorrect Path
-from app.schemas.news import NewsItemRead, NewsItemCreate, NewsItemSubmit # Correct path
+from app.schemas.news import NewsItemRead, NewsItemCreate, NewsItemSubmit, NewsSubmissionRead, NEWS_FEED_PROJECTION # Correct path
 from app.api import deps # Import deps for authentication
+from app.api.idempotency import idempotent_response
+from app.api.submissions import SubmissionEndpoints
 from app import crud
+from app.core.pagination import InvalidCursorError, NEXT_CURSOR_HEADER
+from app.core.projection import InvalidFieldsError
+from app.core.response_cache import response_cache
+from app.db.models.news_item import NewsItem
 from app.db.models.user import User # User model is in app.db.models.user
-from app.services.gemini_service import GeminiService
+from app.services import news_submission_service
 
 # Configure basic logger (can be made more complex if needed)
 logging.basicConfig(level=logging.INFO)
@@ -18,19 +24,39 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+SUBMISSIONS = SubmissionEndpoints(
+    crud=crud.news_submission,
+    queue=news_submission_service.analysis_queue,
+    read_schema=NewsSubmissionRead,
+    result_model=NewsItem,
+    result_options=[selectinload(NewsItem.submitted_by)],
+    result_schema=NewsItemRead,
+    result_field="news_item",
+    read_route="read_news_submission",
+    duplicate_detail="This URL has already been submitted.",
+    queue_full_detail="Too many news submissions are being processed right now. Please try again in a moment.",
+    queue_full_finish={"retryable": True},
+)
+
 @router.get("/sectors/top", response_model=List[str])
 async def get_top_sectors_route(
+    request: Request,
     limit: int = 10,
-    db: AsyncSession = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_db),
+    etag: str = Depends(deps.conditional_get("news")),
 ):
     """
     Get the most frequent sectors from all news items.
     """
     logger.info(f"[API] Received request for top {limit} sectors.")
+    cache_key = response_cache.key_for("news", request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
         top_sectors = await crud.news_item.get_top_sectors(db=db, limit=limit)
         logger.info(f"[API] Returning top sectors: {top_sectors}")
-        return top_sectors
+        return response_cache.store(cache_key, List[str], top_sectors, headers={"ETag": etag})
     except Exception as e:
         logger.error(f"Error fetching top sectors: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error fetching sectors")
@@ -38,23 +64,45 @@ async def get_top_sectors_route(
 @router.get("", response_model=List[NewsItemRead])
 @router.get("/", response_model=List[NewsItemRead])
 async def read_news(
+    request: Request,
     skip: int = 0,
     limit: int = 10,
-    # sector: Optional[str] = None, # No longer used here
-    db: AsyncSession = Depends(deps.get_db)
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    sector: Optional[str] = Query(None, description="Only items tagged with this sector (any tag variant, e.g. 'Artificial Intelligence' or 'ai')"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return (e.g. id,title,url,publishedAt); all by default"),
+    db: AsyncSession = Depends(deps.get_db),
+    etag: str = Depends(deps.conditional_get("news")),
 ):
     """
-    Retrieve news items.
+    Retrieve news items, newest first, from the precomputed news feed.
+    Pass `cursor` (from the `X-Next-Cursor` response header) for constant-time deep
+    pagination; `skip` still works for backward compatibility. `fields` trims
+    each item to the listed fields.
     """
-    logger.info(f"[API] Received request to /news/?skip={skip}&limit={limit}")
+    logger.info(f"[API] Received request to /news/?skip={skip}&limit={limit}&cursor={cursor}&sector={sector}")
+    cache_key = response_cache.key_for("news", request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
-        news_items = await crud.news_item.get_multi(
+        selected_fields = NEWS_FEED_PROJECTION.parse_fields(fields)
+        rows, next_cursor = await crud.news_feed.get_page_rows(
             db=db, 
+            columns=NEWS_FEED_PROJECTION.columns(selected_fields),
             skip=skip, 
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            sector=sector
         ) 
-        logger.info(f"[API] Returning {len(news_items)} news items.")
-        return news_items
+        logger.info(f"[API] Returning {len(rows)} news items.")
+        headers = {"ETag": etag}
+        if next_cursor:
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+        return response_cache.store_json(cache_key, NEWS_FEED_PROJECTION.render(rows, selected_fields), headers=headers)
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except Exception as e:
         # Log the full traceback of the error
         logger.error(f"Error fetching news items: {e}", exc_info=True)
@@ -79,74 +127,73 @@ async def create_news_item_route(
         logger.error(f"Error creating news item: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error creating news item")
 
-@router.post("/submit", response_model=NewsItemRead, status_code=201)
+async def _submit_news_item(
+    request: Request, db: AsyncSession, item_in: NewsItemSubmit, current_user: User
+) -> Tuple[NewsSubmissionRead, Dict[str, str]]:
+    url = str(item_in.url)
+    logger.info(f"User {current_user.email} submitting URL: {url}")
+
+    # Check if a news item with this URL already exists or is being processed
+    followed = await SUBMISSIONS.follow_active(
+        db, request, url=url, user_id=current_user.id, exists=lambda: crud.news_item.get_by_url(db=db, url=url)
+    )
+    if followed is not None:
+        return followed
+    return await SUBMISSIONS.reserve_and_enqueue(db, request, url=url, user_id=current_user.id, enqueue=news_submission_service.enqueue)
+
+
+@router.post("/submit", response_model=NewsSubmissionRead, status_code=202)
 async def submit_news_item(
     *,
+    request: Request,
     db: AsyncSession = Depends(deps.get_db),
     item_in: NewsItemSubmit,
     current_user: User = Depends(deps.get_current_user),
-    background_tasks: BackgroundTasks
 ):
     """
     Submit a new news item from a URL. Logged-in users only.
-    The processing is done in the background.
+    The processing is done in the background: poll the submission in the
+    Location header until it is completed or failed. Resubmitting a URL still
+    being processed for the same user returns that submission, and an
+    `Idempotency-Key` header makes retries replay the first response.
     """
-    url = str(item_in.url)
-    logger.info(f"User {current_user.email} submitting URL: {url}")
-    
-    # Check if a news item with this URL already exists
-    existing_item = await crud.news_item.get_by_url(db=db, url=url)
-    if existing_item:
-        logger.warning(f"URL {url} already exists in the database.")
-        raise HTTPException(
-            status_code=409,
-            detail="This URL has already been submitted."
-        )
-
-    gemini_service = GeminiService()
-
-    try:
-        content = await gemini_service.get_content_from_url(url)
-        if not content:
-            raise HTTPException(status_code=400, detail="Could not retrieve content from the URL.")
-
-        analysis = await gemini_service.evaluate_and_summarize_content(
-            content=content,
-            is_resource=False,
-            user_prompt="Evaluate this news article for its relevance to Artificial Intelligence."
-        )
-
-        if not analysis or analysis.get('relevance_rating', 0) < 2.5:
-            logger.info(f"URL {url} deemed not relevant or analysis failed.")
-            raise HTTPException(
-                status_code=400,
-                detail="The content of the URL is not considered relevant to AI or could not be analyzed."
-            )
+    return await idempotent_response(
+        db,
+        request,
+        user_id=current_user.id,
+        status_code=202,
+        handler=lambda: _submit_news_item(request, db, item_in, current_user),
+    )
 
-        news_item_data = NewsItemCreate(
-            title=analysis.get('title', 'Title not found'),
-            url=url,
-            description=analysis.get('summary', ''),
-            relevance_rating=analysis.get('relevance_rating'),
-            sectors=analysis.get('tags', []),
-            sourceName=analysis.get('sourceName'),
-            imageUrl=analysis.get('imageUrl'),
-            is_community=True,
-            submitted_by_user_id=current_user.id,
-            publishedAt=datetime.now(timezone.utc)
-        )
-
-        new_news_item = await crud.news_item.create(db=db, obj_in=news_item_data)
-        await db.refresh(new_news_item, ["submitted_by"])
-        logger.info(f"Community news item '{new_news_item.title}' created successfully from URL {url}.")
-        
-        return new_news_item
-
-    except HTTPException as http_exc:
-        # Re-raise HTTP exceptions to be handled by FastAPI
-        raise http_exc
-    except Exception as e:
-        logger.error(f"Error processing submitted news URL {url}: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="An unexpected error occurred while processing the URL.")
+@router.get("/submissions/{submission_id}", response_model=NewsSubmissionRead)
+async def read_news_submission(
+    submission_id: str,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+):
+    """Status of a news submission, with the created news item once completed. Only for its author and superusers."""
+    submission = await crud.news_submission.get(db, id=submission_id)
+    if submission is None or (submission.submitted_by_user_id != current_user.id and not current_user.is_superuser):
+        raise HTTPException(status_code=404, detail="Submission not found")
+    return await SUBMISSIONS.response(db, submission)
 
-# ... (other routes if they exist) ... 
\ No newline at end of file
+@router.post("/submissions/{submission_id}/retry", response_model=NewsSubmissionRead, status_code=202)
+async def retry_news_submission(
+    submission_id: str,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+):
+    """Queues again a submission that failed for a transient reason (unreachable page, AI service down)."""
+    submission = await crud.news_submission.get(db, id=submission_id)
+    if submission is None or (submission.submitted_by_user_id != current_user.id and not current_user.is_superuser):
+        raise HTTPException(status_code=404, detail="Submission not found")
+    if submission.status != "failed" or not submission.retryable:
+        raise HTTPException(status_code=409, detail="Only failed submissions that can be retried are accepted.")
+    if await crud.news_item.get_by_url(db=db, url=submission.url):
+        raise SUBMISSIONS.duplicate()
+    if SUBMISSIONS.queue.full():
+        raise SUBMISSIONS.queue_full()
+    if not await crud.news_submission.reopen(db, db_obj=submission):
+        raise SUBMISSIONS.duplicate()
+    await SUBMISSIONS.enqueue(db, submission, news_submission_service.enqueue)
+    return await SUBMISSIONS.response(db, submission)
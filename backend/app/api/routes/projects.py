@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Any
 import logging
@@ -9,6 +9,7 @@ from app.schemas.project import ProjectRead, ProjectCreate
 from app.services import github_service
 from app.db.models.user import User
 from app import crud
+from app.core.response_cache import response_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -16,17 +17,24 @@ logger = logging.getLogger(__name__)
 @router.get("", response_model=List[ProjectRead], include_in_schema=False)
 @router.get("/", response_model=List[ProjectRead])
 async def read_projects(
-    db: AsyncSession = Depends(deps.get_db)
+    request: Request,
+    db: AsyncSession = Depends(deps.get_db),
+    etag: str = Depends(deps.conditional_get("projects")),
 ) -> Any:
     """
     Recupera todos los proyectos.
     """
+    cache_key = response_cache.key_for("projects", request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     logger.info("[API Projects] Leyendo todos los proyectos de la BBDD.")
     
     current_projects = await crud.project.get_multi(db=db)
     logger.info(f"[API Projects] Devolviendo {len(current_projects)} proyectos desde la BBDD.")
     
-    return current_projects
+    return response_cache.store(cache_key, List[ProjectRead], current_projects, headers={"ETag": etag})
 
 @router.post("/sync-github/", response_model=List[ProjectRead])
 async def sync_github_projects(
@@ -1,135 +1,191 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query, Path
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Path, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from typing import Dict, List, Optional, Tuple
 import logging
-from datetime import datetime, timedelta, timezone
+import math
+from datetime import timedelta
 
 from app import crud, schemas
 from app.api import deps  # Standardized dependency import
+from app.api.idempotency import idempotent_response
+from app.api.submissions import SubmissionEndpoints
 from app.db.models.user import User # For current_user type
-from app.services import gemini_service
+from app.services import resource_submission_service
 from app.db.models.resource_link import ResourceLink
 from app.db.models.resource_vote import VoteType
-import google.generativeai as genai
-from app.crud.crud_resource_link import count_resources_by_author_since
-from app.schemas.resource_link import ResourceLinkRead, ResourceLinkCreate, ResourceLinkUpdate, ResourceLinkVoteResponse
+from app.crud.crud_resource_vote import ResourceGoneError, VoteLimitError
+from app.core.quota import Quota, QuotaExceededError, quotas
+from app.core.pagination import InvalidCursorError, NEXT_CURSOR_HEADER
+from app.core.projection import InvalidFieldsError
+from app.core.response_cache import response_cache
+from app.schemas.resource_link import (
+    ResourceLinkRead, ResourceLinkCreate, ResourceLinkUpdate, ResourceLinkVoteResponse, ResourceSubmissionRead,
+    ResourceTagCount, RESOURCE_LINK_PROJECTION,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.post("/", response_model=ResourceLinkRead, status_code=status.HTTP_201_CREATED)
-async def create_resource_link_route(
-    *,
-    db: AsyncSession = Depends(deps.get_db),
-    resource_link_in: ResourceLinkCreate,
-    current_user: User = Depends(deps.get_current_user)
-):
-    """Create a new resource link after performing validations."""
-    logger.info(f"[API ResourceLink] User {current_user.email} creating resource link for URL: {resource_link_in.url}")
+SUBMISSION_QUOTA = Quota("resource_submissions", limit=3, window=timedelta(hours=24))
+
+SUBMISSIONS = SubmissionEndpoints(
+    crud=crud.resource_submission,
+    queue=resource_submission_service.analysis_queue,
+    read_schema=ResourceSubmissionRead,
+    result_model=ResourceLink,
+    result_options=[selectinload(ResourceLink.author)],
+    result_schema=ResourceLinkRead,
+    result_field="resource",
+    read_route="read_resource_submission_route",
+    duplicate_detail=resource_submission_service.DUPLICATE_MESSAGE,
+    queue_full_detail="Too many resources are being analysed right now. Please try again in a moment.",
+)
+
+
+async def _submit_resource(
+    request: Request, db: AsyncSession, resource_link_in: ResourceLinkCreate, current_user: User
+) -> Tuple[ResourceSubmissionRead, Dict[str, str]]:
+    url = str(resource_link_in.url)
+    logger.info(f"[API ResourceLink] User {current_user.email} submitting resource link for URL: {url}")
 
     # --- 1. Check for duplicates ---
-    existing_resource = await crud.resource_link.get_by_url(db, url=str(resource_link_in.url))
-    if existing_resource:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="This resource has already been added. Thank you for your contribution.",
-        )
+    followed = await SUBMISSIONS.follow_active(
+        db, request, url=url, user_id=current_user.id, exists=lambda: crud.resource_link.get_by_url(db, url=url)
+    )
+    if followed is not None:
+        return followed
 
     # --- 2. Submission limit for non-admin users ---
+    ticket = None
     if not current_user.is_superuser:
-        submission_limit = 3
-        twenty_four_hours_ago = datetime.now(timezone.utc) - timedelta(hours=24)
-        recent_submissions = await count_resources_by_author_since(
-            db=db, author_id=current_user.id, since=twenty_four_hours_ago
-        )
-        if recent_submissions >= submission_limit:
+        try:
+            ticket = await quotas.acquire(
+                SUBMISSION_QUOTA,
+                current_user.id,
+                history=lambda since: crud.resource_submission.get_times_by_author_since(
+                    db, author_id=current_user.id, since=since
+                ),
+            )
+        except QuotaExceededError as e:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"You have reached the limit of {submission_limit} submissions per day. Please try again tomorrow!",
+                detail=f"You have reached the limit of {SUBMISSION_QUOTA.limit} submissions per day. Please try again tomorrow!",
+                headers={"Retry-After": str(math.ceil(e.retry_after))},
             )
 
-    # --- 3. Validation and enrichment with Gemini ---
-    generated_details = None
-    try:
-        logger.debug(f"Calling gemini_service for URL: {resource_link_in.url}")
-        generated_details = await gemini_service.generate_resource_details(
-            url=str(resource_link_in.url), # Ensure it's a string
-            user_title=resource_link_in.title,
-            user_personal_note=resource_link_in.personal_note
-        )
-        logger.debug(f"Received Gemini details: {generated_details}")
-    except ValueError as e:
-        # Catches the specific error if the content is not relevant or the JSON is invalid
-        logger.warning(f"Gemini validation failed for {resource_link_in.url}: {e}")
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error calling gemini_service.generate_resource_details for {resource_link_in.url}: {e}", exc_info=True)
-        # Generic error if the Gemini service fails for another reason (API down, etc.)
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="The AI analysis service is currently unavailable.")
-
-    if not generated_details:
-        # This shouldn't happen if the service works and doesn't raise an exception, but it's a safeguard.
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not generate resource details.")
-
-    # Create a new object to avoid mutating the input, combining original and generated data
-    db_obj_data = resource_link_in.model_dump(exclude_unset=True)
-    db_obj_data.update(generated_details)
+    async def release_ticket() -> None:
+        if ticket is not None:
+            await quotas.release(ticket)
 
-    if not db_obj_data:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Could not extract data from the provided URL.")
+    # --- 3. Reserve the URL and queue the analysis ---
+    return await SUBMISSIONS.reserve_and_enqueue(
+        db,
+        request,
+        url=url,
+        user_id=current_user.id,
+        enqueue=lambda submission_id: resource_submission_service.enqueue(submission_id, ticket),
+        on_abort=release_ticket,
+        title=resource_link_in.title,
+        personal_note=resource_link_in.personal_note,
+    )
 
-    # Convert tags to string if it's a list
-    if isinstance(db_obj_data.get("tags"), list):
-        db_obj_data["tags"] = ", ".join(db_obj_data["tags"])
-    
-    # --- 4. Add creation timestamp ---
-    db_obj_data["created_at"] = datetime.now(timezone.utc)
-    
-    # Validate and assign thumbnail_url
-    thumbnail_url_suggestion = db_obj_data.get("thumbnail_url_suggestion")
-    if thumbnail_url_suggestion:
-        try:
-            from pydantic import HttpUrl
-            HttpUrl(thumbnail_url_suggestion) # Validate
-            db_obj_data["thumbnail_url"] = thumbnail_url_suggestion
-        except Exception:
-            logger.warning(f"AI suggested thumbnail URL is not valid: {thumbnail_url_suggestion}.")
-            db_obj_data["thumbnail_url"] = None
-    
-    # Create the final schema instance for the DB
-    db_obj_in = ResourceLinkCreate(**db_obj_data)
 
-    logger.info(f"Final data to create ResourceLink (after Gemini): Title: '{db_obj_in.title}', Type: {db_obj_in.resource_type}")
+@router.post("/", response_model=ResourceSubmissionRead, status_code=status.HTTP_202_ACCEPTED)
+async def create_resource_link_route(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(deps.get_db),
+    resource_link_in: ResourceLinkCreate,
+    current_user: User = Depends(deps.get_current_user)
+):
+    """
+    Submit a resource link. The URL is checked and reserved, and the analysis
+    (content download and AI enrichment) runs in the background: poll the
+    submission in the Location header until it is completed or failed.
+    Resubmitting a URL that is still being analysed for the same user returns
+    that submission, and an `Idempotency-Key` header makes retries replay the
+    first response.
+    """
+    return await idempotent_response(
+        db,
+        request,
+        user_id=current_user.id,
+        status_code=status.HTTP_202_ACCEPTED,
+        handler=lambda: _submit_resource(request, db, resource_link_in, current_user),
+    )
 
-    try:
-        resource_link = await crud.resource_link.create_with_author(
-            db=db, 
-            obj_in=db_obj_in, 
-            author_id=current_user.id
-        )
-        return resource_link
-    except Exception as e:
-        logger.error(f"[API ResourceLink] Error creating resource link '{resource_link_in.title}': {e}", exc_info=True)
-        # We might want to return a more specific error if the insertion fails due to incorrect data from Gemini
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error creating resource link: {str(e)}")
+@router.get("/submissions/{submission_id}", response_model=ResourceSubmissionRead)
+async def read_resource_submission_route(
+    submission_id: str,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+):
+    """Status of a resource submission, with the created resource link once completed. Only for its author and superusers."""
+    submission = await crud.resource_submission.get(db, id=submission_id)
+    if submission is None or (submission.author_id != current_user.id and not current_user.is_superuser):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Submission not found")
+    return await SUBMISSIONS.response(db, submission)
 
 @router.get("/", response_model=List[ResourceLinkRead])
 async def read_resource_links_route(
+    request: Request,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     resource_type: Optional[str] = Query(None, description="Filter by resource type (e.g., Video, GitHub, Article)"),
-    tags: Optional[str] = Query(None, description="Comma-separated tags to filter by (e.g., python,fastapi)")
+    tags: Optional[str] = Query(None, description="Comma-separated tags to filter by (e.g., python,fastapi); links must carry all of them"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return (e.g. id,title,url); all by default"),
+    etag: str = Depends(deps.conditional_get("resources")),
 ):
-    """Retrieve a list of resource links."""
-    logger.info(f"[API ResourceLink] Reading resource links: skip={skip}, limit={limit}, type={resource_type}, tags={tags}")
+    """
+    Retrieve a list of resource links. Use `cursor` for keyset pagination; `skip` is kept for compatibility.
+    `fields` trims each item to the listed fields.
+    """
+    logger.info(f"[API ResourceLink] Reading resource links: skip={skip}, limit={limit}, cursor={cursor}, type={resource_type}, tags={tags}")
+    cache_key = response_cache.key_for("resources", request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
     tags_list = tags.split(',') if tags else None
-    db_resource_links = await crud.resource_link.get_multi(
-        db=db, skip=skip, limit=limit, resource_type=resource_type, tags_contain=tags_list
-    )
-    return db_resource_links
+    try:
+        selected_fields = RESOURCE_LINK_PROJECTION.parse_fields(fields)
+        rows, next_cursor = await crud.resource_link.get_page_rows(
+            db=db, columns=RESOURCE_LINK_PROJECTION.columns(selected_fields),
+            skip=skip, limit=limit, cursor=cursor, resource_type=resource_type, tags_contain=tags_list
+        )
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    headers = {"ETag": etag}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response_cache.store_json(cache_key, RESOURCE_LINK_PROJECTION.render(rows, selected_fields), headers=headers)
+
+@router.get("/tags", response_model=List[ResourceTagCount])
+async def read_resource_tags_route(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_db),
+    limit: int = Query(50, ge=1, le=500),
+    resource_type: Optional[str] = Query(None, description="Only count resource links of this type"),
+    etag: str = Depends(deps.conditional_get("resources")),
+):
+    """Most used resource tags with their number of links, read from the tag index."""
+    cache_key = response_cache.key_for("resources", request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    counts = await crud.resource_link_tag.get_counts(db, limit=limit, resource_type=resource_type)
+    return response_cache.store(cache_key, List[ResourceTagCount], counts, headers={"ETag": etag})
 
-@router.get("/{resource_id}", response_model=ResourceLinkRead)
+@router.get(
+    "/{resource_id}",
+    response_model=ResourceLinkRead,
+    dependencies=[Depends(deps.conditional_get("resources"))],
+)
 async def read_resource_link_route(resource_id: str, db: AsyncSession = Depends(deps.get_db)):
     """Retrieve a specific resource link by ID."""
     logger.info(f"[API ResourceLink] Reading resource link by ID: {resource_id}")
@@ -154,9 +210,13 @@ async def update_resource_link_route(
     if not db_resource_link:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource link not found")
     
-    updated_resource_link = await crud.resource_link.update(
-        db=db, db_obj=db_resource_link, obj_in=resource_link_in
-    )
+    try:
+        updated_resource_link = await crud.resource_link.update(
+            db=db, db_obj=db_resource_link, obj_in=resource_link_in
+        )
+    except IntegrityError:  # The new URL (in any spelling) belongs to another resource link
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Another resource link already uses this URL.")
     return updated_resource_link
 
 @router.delete("/{resource_id}", response_model=ResourceLinkRead)
@@ -210,6 +270,18 @@ async def unpin_resource_link_route(
     
     return unpinned_link
 
+async def _vote(db: AsyncSession, resource_id: str, user: User, vote_type: VoteType) -> ResourceLinkVoteResponse:
+    try:
+        return await crud.resource_vote.vote_on_resource(db, user_id=user.id, resource_id=resource_id, vote_type=vote_type)
+    except ResourceGoneError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource link not found")
+    except VoteLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))}
+        )
+    except PermissionError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
 @router.post(
     "/{resource_id}/like",
     response_model=ResourceLinkVoteResponse,
@@ -224,21 +296,7 @@ async def like_resource_link_route(
     """
     Adds a 'like' vote to a resource link. If the user has already disliked it, the dislike is removed.
     """
-    db_resource_link = await crud.resource_link.get(db=db, id=resource_id)
-    if not db_resource_link:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource link not found")
-
-    updated_link = await crud.resource_vote.add_vote(
-        db, 
-        resource_id=db_resource_link.id, 
-        user_id=current_user.id, 
-        vote_type=VoteType.LIKE
-        )
-    return {
-        "message": "Like vote added successfully.",
-        "likes": updated_link.likes,
-        "dislikes": updated_link.dislikes,
-    }
+    return await _vote(db, resource_id, current_user, VoteType.like)
 
 @router.post(
     "/{resource_id}/dislike",
@@ -254,18 +312,4 @@ async def dislike_resource_link_route(
     """
     Adds a 'dislike' vote to a resource link. If the user has already liked it, the like is removed.
     """
-    db_resource_link = await crud.resource_link.get(db=db, id=resource_id)
-    if not db_resource_link:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource link not found")
-    
-    updated_link = await crud.resource_vote.add_vote(
-        db, 
-        resource_id=db_resource_link.id, 
-        user_id=current_user.id, 
-        vote_type=VoteType.DISLIKE
-        )
-    return {
-        "message": "Dislike vote added successfully.",
-        "likes": updated_link.likes,
-        "dislikes": updated_link.dislikes,
-    }
\ No newline at end of file
+    return await _vote(db, resource_id, current_user, VoteType.dislike)
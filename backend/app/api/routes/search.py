@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Literal, Optional
+import logging
+
+from app.api import deps
+from app import crud
+from app.core.pagination import InvalidCursorError
+from app.schemas.search import SearchResults
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("", response_model=SearchResults, include_in_schema=False)
+@router.get("/", response_model=SearchResults)
+async def search(
+    db: AsyncSession = Depends(deps.get_db),
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms; the last one also matches as a prefix"),
+    type: Optional[Literal["news", "resource", "blog"]] = Query(None, description="Restrict results to one content type"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from `next_cursor` of the previous page"),
+) -> Any:
+    """
+    Full-text search across news, resources and published blog posts, ranked by
+    relevance (title matches weigh most, then tags, then body).
+    """
+    try:
+        items, next_cursor = await crud.search_document.search(db, query=q, doc_type=type, limit=limit, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return SearchResults(items=items, next_cursor=next_cursor)
@@ -1,9 +1,9 @@
-from typing import Any, List
+from typing import Any, List, Optional
 import uuid
 import os
 from pathlib import Path
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError # To catch unique constraint violations
 
@@ -13,21 +13,29 @@ from app.core.config import settings
 from app.db import models
 from app.utils import send_email, generate_new_account_email
 from app.core import security
+from app.core.pagination import InvalidCursorError, NEXT_CURSOR_HEADER
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[schemas.User])
 async def read_users(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     current_user: models.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
-    Retrieve users.
+    Retrieve users, by id. The next page's cursor is in the X-Next-Cursor header.
     """
-    users = await crud.user.get_multi(db, skip=skip, limit=limit)
+    try:
+        users, next_cursor = await crud.user.get_page(db, skip=skip, limit=limit, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return users
 
 
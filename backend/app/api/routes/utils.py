@@ -1,7 +1,10 @@
+from typing import Any, Dict
+
 from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
 
 from app.api.deps import get_current_active_superuser
+from app.core.response_cache import response_cache
 from app.schemas import Message
 from app.utils import generate_test_email, send_email
 
@@ -29,3 +32,26 @@ def test_email(email_to: EmailStr) -> Message:
 @router.get("/health-check/")
 def health_check() -> bool:
     return True
+
+
+@router.get(
+    "/response-cache/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def response_cache_stats() -> Dict[str, Any]:
+    """
+    Size, hit rate and per-namespace counters of the in-process response cache.
+    """
+    return response_cache.stats()
+
+
+@router.delete(
+    "/response-cache/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def clear_response_cache() -> Message:
+    """
+    Drops every cached response of this process.
+    """
+    response_cache.clear()
+    return Message(message="Response cache cleared")
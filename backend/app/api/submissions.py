@@ -0,0 +1,121 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.task_queue import QueueFullError, TaskQueue
+from app.crud.crud_submission import CRUDSubmission
+
+logger = logging.getLogger(__name__)
+
+# Suggested wait when an analysis queue is full.
+QUEUE_FULL_RETRY_AFTER_SECONDS = 30
+QUEUE_FULL_ERROR = "The analysis queue was full."
+
+SubmissionResponse = Tuple[BaseModel, Dict[str, str]]
+
+
+@dataclass(frozen=True)
+class SubmissionEndpoints:
+    """
+    The request side of a background-analysed submission (resource links,
+    news): duplicate checks, URL reservation, queueing, the 503 when the queue
+    is full and the response with its Location header. The routes only add
+    their own checks (quotas) and how a submission is queued.
+    """
+    crud: CRUDSubmission
+    queue: TaskQueue
+    read_schema: Type[BaseModel]
+    result_model: Any
+    result_options: Sequence[Any]  # Loader options for the created row
+    result_schema: Type[BaseModel]
+    result_field: str  # Field of `read_schema` holding the created row
+    read_route: str  # Route name of the submission status endpoint
+    duplicate_detail: str
+    queue_full_detail: str
+    # Values given to `crud.finish` for a submission failed by a full queue.
+    queue_full_finish: Optional[Dict[str, Any]] = None
+
+    async def response(self, db: AsyncSession, submission: Any) -> BaseModel:
+        response = self.read_schema.model_validate(submission)
+        result_id = getattr(submission, self.crud.result_column)
+        if result_id:
+            result = await db.get(self.result_model, result_id, options=list(self.result_options))
+            if result is not None:
+                setattr(response, self.result_field, self.result_schema.model_validate(result, from_attributes=True))
+        return response
+
+    def location(self, request: Request, submission: Any) -> Dict[str, str]:
+        return {"Location": str(request.url_for(self.read_route, submission_id=submission.id))}
+
+    def duplicate(self) -> HTTPException:
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=self.duplicate_detail)
+
+    def queue_full(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=self.queue_full_detail,
+            headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER_SECONDS)},
+        )
+
+    async def follow_active(
+        self, db: AsyncSession, request: Request, *, url: str, user_id: int, exists: Callable[[], Awaitable[Any]]
+    ) -> Optional[SubmissionResponse]:
+        """
+        The submission of `user_id` still analysing `url` (double click, retry),
+        to follow instead of starting another; None when a new one can start.
+        Raises 409 when `exists()` finds the URL stored or someone else is
+        analysing it, and 503 when the queue is full.
+        """
+        active_submission = await self.crud.get_active_by_url(db, url=url)
+        if active_submission is not None and self.crud.owner_id(active_submission) == user_id:
+            return await self.response(db, active_submission), self.location(request, active_submission)
+        if active_submission is not None or await exists():
+            logger.info(f"[Submissions] {url} is already stored or being analysed.")
+            raise self.duplicate()
+        if self.queue.full():
+            raise self.queue_full()
+        return None
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        submission: Any,
+        enqueue: Callable[[str], None],
+        on_abort: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """Queues a reserved submission; when the queue is full, fails it, runs `on_abort` and raises 503."""
+        try:
+            enqueue(submission.id)
+        except QueueFullError:
+            await self.crud.finish(db, db_obj=submission, error=QUEUE_FULL_ERROR, **(self.queue_full_finish or {}))
+            if on_abort is not None:
+                await on_abort()
+            raise self.queue_full()
+
+    async def reserve_and_enqueue(
+        self,
+        db: AsyncSession,
+        request: Request,
+        *,
+        url: str,
+        user_id: int,
+        enqueue: Callable[[str], None],
+        on_abort: Optional[Callable[[], Awaitable[None]]] = None,
+        **values: Any,
+    ) -> SubmissionResponse:
+        """
+        Reserves `url` for a new submission of `user_id` (with the extra column
+        `values`) and queues it. `on_abort` runs when it cannot go ahead: 409
+        when someone else reserved the URL meanwhile, 503 when the queue is full.
+        """
+        submission = await self.crud.reserve(db, url=url, owner_id=user_id, **values)
+        if submission is None:  # Submitted concurrently by someone else
+            if on_abort is not None:
+                await on_abort()
+            raise self.duplicate()
+        await self.enqueue(db, submission, enqueue, on_abort)
+        return await self.response(db, submission), self.location(request, submission)
@@ -0,0 +1,145 @@
+import html
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+# Length of the excerpts generated for posts that do not provide one.
+EXCERPT_LENGTH = 200
+
+# Content with any of these tags is stored HTML; anything else is plain text
+# with light markdown (headings, bullet lists, **bold**, bare links).
+_HTML_RE = re.compile(r"<(p|div|h[1-6]|ul|ol|li|br|a|strong|em|b|i|img|blockquote|pre|code|span)\b", re.IGNORECASE)
+_HEADING_RE = re.compile(r"<h([23])([^>]*)>(.*?)</h\1\s*>", re.IGNORECASE | re.DOTALL)
+_ID_ATTR_RE = re.compile(r"""\bid\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_MD_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_MD_BULLET_RE = re.compile(r"^\s*[-*•]\s+(.+)$")
+_MD_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_URL_RE = re.compile(r"""https?://(?:(?!&[lg]t;)[^\s<>"'])*(?:(?!&[lg]t;)[^\s<>"'.,;:!?)\]])""")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class RenderedContent:
+    html: str
+    text: str
+    word_count: int
+    toc: List[Dict[str, object]] = field(default_factory=list)  # [{"level": 2, "id": "intro", "title": "Intro"}]
+
+
+class _TextExtractor(HTMLParser):
+    _BLOCK_TAGS = {"p", "div", "br", "li", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "tr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+        elif tag in self._BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+        elif tag in self._BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def html_to_text(content: str) -> str:
+    """Visible text of an HTML fragment, whitespace collapsed."""
+    extractor = _TextExtractor()
+    extractor.feed(content or "")
+    extractor.close()
+    return " ".join("".join(extractor.parts).split())
+
+
+def _anchor(title: str, used: Dict[str, int]) -> str:
+    slug = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode().lower()
+    slug = re.sub(r"[^a-z0-9]+", "-", slug).strip("-") or "section"
+    count = used.get(slug, 0)
+    used[slug] = count + 1
+    return slug if count == 0 else f"{slug}-{count}"
+
+
+def _link(match: re.Match) -> str:
+    # The match is already escaped text (&amp;); the href is escaped again for the attribute.
+    href = html.escape(html.unescape(match.group(0)), quote=True)
+    return f'<a href="{href}" rel="noopener noreferrer" target="_blank">{match.group(0)}</a>'
+
+
+def _inline(text: str) -> str:
+    escaped = html.escape(text, quote=False)
+    escaped = _MD_BOLD_RE.sub(r"<strong>\1</strong>", escaped)
+    return _URL_RE.sub(_link, escaped)
+
+
+def _render_text(content: str) -> str:
+    blocks: List[str] = []
+    for block in re.split(r"\n\s*\n", content.replace("\r\n", "\n").strip()):
+        lines = [line.rstrip() for line in block.split("\n") if line.strip()]
+        if not lines:
+            continue
+        heading = _MD_HEADING_RE.match(lines[0].strip())
+        if heading and len(lines) == 1:
+            # The page title is the h1: content headings start at h2.
+            level = min(max(len(heading.group(1)), 2), 6)
+            blocks.append(f"<h{level}>{_inline(heading.group(2).strip())}</h{level}>")
+        elif all(_MD_BULLET_RE.match(line) for line in lines):
+            items = "".join(f"<li>{_inline(_MD_BULLET_RE.match(line).group(1))}</li>" for line in lines)
+            blocks.append(f"<ul>{items}</ul>")
+        else:
+            blocks.append(f"<p>{'<br>'.join(_inline(line.strip()) for line in lines)}</p>")
+    return "\n".join(blocks)
+
+
+def _add_heading_anchors(content_html: str) -> Tuple[str, List[Dict[str, object]]]:
+    """Gives every h2/h3 an id (keeping existing ones) and returns the HTML and its table of contents."""
+    toc: List[Dict[str, object]] = []
+    used: Dict[str, int] = {}
+
+    def replace(match: re.Match) -> str:
+        level, attrs, inner = match.group(1), match.group(2), match.group(3)
+        title = html.unescape(" ".join(_TAG_RE.sub(" ", inner).split()))
+        existing = _ID_ATTR_RE.search(attrs)
+        if existing:
+            anchor = existing.group(1)
+            used[anchor] = used.get(anchor, 0) + 1
+        else:
+            anchor = _anchor(title, used)
+            attrs = f' id="{anchor}"{attrs}'
+        if title:
+            toc.append({"level": int(level), "id": anchor, "title": title})
+        return f"<h{level}{attrs}>{inner}</h{level}>"
+
+    return _HEADING_RE.sub(replace, content_html), toc
+
+
+def render_content(content: Optional[str]) -> RenderedContent:
+    """
+    Pre-rendered form of a post body, computed once at write time: HTML with
+    anchored h2/h3 headings, their table of contents, the plain text and its
+    word count. Stored HTML is kept as written (posts are authored by admins).
+    """
+    content = content or ""
+    content_html = content if _HTML_RE.search(content) else _render_text(content)
+    content_html, toc = _add_heading_anchors(content_html)
+    text = html_to_text(content_html)
+    return RenderedContent(html=content_html, text=text, word_count=len(_WORD_RE.findall(text)), toc=toc)
+
+
+def make_excerpt(text: str, max_length: int = EXCERPT_LENGTH) -> str:
+    """First `max_length` characters of the plain text, cut at a word boundary."""
+    text = " ".join((text or "").split())
+    if len(text) <= max_length:
+        return text
+    cut = text[:max_length].rsplit(" ", 1)[0].rstrip(" ,;:.-–—")
+    return f"{cut}…"
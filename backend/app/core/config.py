@@ -105,6 +105,10 @@ class Settings(BaseSettings):
 
     # --- YouTube API --- #
     YOUTUBE_API_KEY: Optional[str] = None
+    # Video and channel details are reused this long before asking the Data API again.
+    YOUTUBE_CACHE_TTL_SECONDS: int = 6 * 3600
+    # Stored YouTube resource links get their metadata re-pulled this often.
+    YOUTUBE_REFRESH_INTERVAL_HOURS: int = 24
 
     # --- Añadir claves para GNews y Currents ---
     GNEWS_API_KEY: Optional[str] = None
@@ -115,6 +119,64 @@ class Settings(BaseSettings):
     APITUBE_API_KEY: Optional[str] = None
     MEDIASTACK_API_KEY: Optional[str] = None
 
+    # --- Ingesta de noticias ---
+    # Number of accepted articles written per multi-row INSERT/commit.
+    NEWS_INSERT_BATCH_SIZE: int = 25
+    # Seconds an LLM provider is skipped after exhausting its quota or failing a call.
+    LLM_PROVIDER_COOLDOWN_SECONDS: int = 900
+    # Enrich with the local extractive summarizer when no LLM provider can answer.
+    LOCAL_ENRICHMENT_FALLBACK: bool = True
+    # Estimated tokens of article text sent to the LLM after condensation (~4 chars per token).
+    LLM_CONTENT_TOKEN_BUDGET: int = 2000
+
+    # --- Backfills de re-enriquecimiento ---
+    # Items per chunk; each chunk and its checkpoint are committed together.
+    BACKFILL_BATCH_SIZE: int = 20
+    # Articles evaluated in parallel and LLM calls allowed per minute across a job.
+    BACKFILL_CONCURRENCY: int = 2
+    BACKFILL_MAX_CALLS_PER_MINUTE: int = 20
+
+    # --- Caché de respuestas ---
+    # In-process cache of the public list endpoints, dropped on every committed write to their tables.
+    RESPONSE_CACHE_ENABLED: bool = True
+    # Upper bound on staleness for writes made by other worker processes.
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    # How long a worker trusts its in-memory collection versions (ETags) before
+    # re-reading them, to see the writes of other worker processes.
+    COLLECTION_VERSION_TTL_SECONDS: int = 5
+
+    # --- Feeds RSS/Atom y sitemap ---
+    # Pre-generated XML files, rewritten shortly after the news or blog data changes.
+    FEEDS_DIR: str = "generated/feeds"
+    FEED_MAX_ITEMS: int = 50
+    # Writes within this window (e.g. one ingestion run) trigger a single regeneration.
+    FEEDS_REGENERATE_DELAY_SECONDS: float = 5.0
+
+    # --- Cuotas por usuario (votos, envíos de recursos) ---
+    # "memory": per-process store, exact with a single worker. "redis": shared by
+    # every worker through REDIS_URL.
+    QUOTA_BACKEND: Literal["memory", "redis"] = "memory"
+    REDIS_URL: Optional[str] = None
+
+    # --- Análisis en segundo plano de recursos enviados ---
+    # Submissions are analysed (page download, Playwright, LLM) by this many workers.
+    RESOURCE_ANALYSIS_WORKERS: int = 2
+    # Submissions waiting for a worker; beyond it new submissions are refused with a 503.
+    RESOURCE_ANALYSIS_QUEUE_SIZE: int = 100
+
+    # --- Noticias enviadas por la comunidad ---
+    NEWS_SUBMISSION_WORKERS: int = 2
+    NEWS_SUBMISSION_QUEUE_SIZE: int = 100
+    # Attempts per submission when the page or the LLM providers fail; the delay doubles after each one.
+    NEWS_SUBMISSION_MAX_ATTEMPTS: int = 3
+    NEWS_SUBMISSION_RETRY_DELAY_SECONDS: float = 60.0
+
+    # --- Idempotency-Key en los envíos ---
+    # How long a stored response is replayed for a repeated key.
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
+
     # --- Control de ejecución de scripts ---
     RUN_DB_RESET_ON_STARTUP: bool = False
 
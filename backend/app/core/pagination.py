@@ -0,0 +1,78 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import tuple_
+
+# Response header carrying the cursor of the next page on list endpoints that return a bare list.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"u": value.hex}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "u" in value:
+            return uuid.UUID(value["u"])
+        raise InvalidCursorError("Unknown cursor value.")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for the sort key of the last row of a page."""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decodes a cursor produced by `encode_cursor` for a sort key of `size` columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise InvalidCursorError("Malformed cursor.")
+        return [_decode_value(v) for v in values]
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, ValueError, TypeError) as e:
+        if isinstance(e, InvalidCursorError):
+            raise
+        raise InvalidCursorError("Malformed cursor.") from e
+
+
+def before(columns: Sequence[Any], values: Sequence[Any]):
+    """
+    Keyset condition for a sort key ordered descending on every column: rows
+    strictly after the cursor row. A row-value comparison, so a matching
+    composite index serves it as a single range scan.
+    """
+    return tuple_(*columns) < tuple_(*values)
+
+
+def after(columns: Sequence[Any], values: Sequence[Any]):
+    """Keyset condition for a sort key ordered ascending on every column."""
+    return tuple_(*columns) > tuple_(*values)
+
+
+def next_cursor(rows: Sequence[Any], limit: int, key) -> Optional[str]:
+    """Cursor for the page after `rows` (fetched with `limit + 1`), or None if it was the last page."""
+    if len(rows) <= limit or limit <= 0:
+        return None
+    return encode_cursor(key(rows[limit - 1]))
@@ -0,0 +1,174 @@
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Past actions of a subject since a given time, used to warm up an empty in-process store.
+History = Callable[[datetime], Awaitable[List[datetime]]]
+
+
+@dataclass(frozen=True)
+class Quota:
+    """At most `limit` actions per subject in any sliding window of `window`."""
+    name: str
+    limit: int
+    window: timedelta
+
+
+@dataclass(frozen=True)
+class QuotaTicket:
+    """One slot taken from a quota; release it if the action does not happen after all."""
+    key: str
+    token: str
+
+
+class QuotaExceededError(Exception):
+    def __init__(self, quota: Quota, retry_after: float):
+        super().__init__(f"Quota '{quota.name}' exceeded.")
+        self.quota = quota
+        self.retry_after = retry_after  # Seconds until the oldest counted action leaves the window
+
+
+class InMemoryQuotaBackend:
+    """
+    Sliding log per key: the timestamps of at most `limit` recent actions, so a
+    check is O(limit) whatever the user's history. Per process; each key is
+    warmed up from the database the first time it is seen, so a restart does not
+    reset anyone's limits.
+    """
+
+    SWEEP_EVERY = 10_000
+
+    def __init__(self):
+        self._entries: Dict[str, Deque[Tuple[float, str]]] = {}
+        self._operations = 0
+
+    def needs_history(self, key: str) -> bool:
+        return key not in self._entries
+
+    async def seed(self, key: str, timestamps: List[float]) -> None:
+        if key in self._entries:  # Warmed up by a concurrent request meanwhile
+            return
+        self._entries[key] = deque((ts, uuid.uuid4().hex) for ts in sorted(timestamps))
+
+    async def acquire(self, key: str, limit: int, window: float, now: float) -> Tuple[Optional[str], float]:
+        """Takes a slot: (token, 0) when granted, (None, seconds to wait) when the window is full."""
+        self._operations += 1
+        if self._operations % self.SWEEP_EVERY == 0:
+            self._sweep(window, now)
+        entries = self._entries.setdefault(key, deque())
+        while entries and entries[0][0] <= now - window:
+            entries.popleft()
+        if len(entries) >= limit:
+            return None, entries[len(entries) - limit][0] + window - now
+        token = uuid.uuid4().hex
+        entries.append((now, token))
+        return token, 0.0
+
+    async def release(self, key: str, token: str) -> None:
+        entries = self._entries.get(key)
+        if entries:
+            for entry in entries:
+                if entry[1] == token:
+                    entries.remove(entry)
+                    break
+
+    def _sweep(self, window: float, now: float) -> None:
+        # Keys with no action in the window are dropped; they are warmed up again if seen later.
+        for key in [key for key, entries in self._entries.items() if not entries or entries[-1][0] <= now - window]:
+            del self._entries[key]
+
+
+class RedisQuotaBackend:
+    """
+    Sliding log in a sorted set per key (score = timestamp), shared by every
+    worker. Takes any redis.asyncio-compatible client and only uses ZADD, ZCARD,
+    ZRANGE, ZREM, ZREMRANGEBYSCORE and EXPIRE in a MULTI pipeline. A slot is
+    added first and taken back if the window was already full, so two requests
+    racing for the last slot may both be refused, never both granted.
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    def needs_history(self, key: str) -> bool:
+        return False  # Shared and durable: nothing to warm up
+
+    async def seed(self, key: str, timestamps: List[float]) -> None:
+        pass
+
+    async def acquire(self, key: str, limit: int, window: float, now: float) -> Tuple[Optional[str], float]:
+        token = f"{now:.6f}:{uuid.uuid4().hex}"
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(key, 0, now - window)
+            pipe.zadd(key, {token: now})
+            pipe.zcard(key)
+            pipe.expire(key, int(window) + 1)
+            _, _, count, _ = await pipe.execute()
+        if count <= limit:
+            return token, 0.0
+        await self._client.zrem(key, token)
+        oldest = await self._client.zrange(key, 0, 0, withscores=True)
+        return None, (oldest[0][1] + window - now) if oldest else window
+
+    async def release(self, key: str, token: str) -> None:
+        await self._client.zrem(key, token)
+
+
+class QuotaService:
+    def __init__(self, backend: Any):
+        self.backend = backend
+
+    @staticmethod
+    def key_for(quota: Quota, subject: Any) -> str:
+        return f"quota:{quota.name}:{subject}"
+
+    async def acquire(self, quota: Quota, subject: Any, *, history: Optional[History] = None) -> QuotaTicket:
+        """
+        Takes one slot of `quota` for `subject` (e.g. a user id) or raises
+        QuotaExceededError. `history` lists the subject's past actions and is only
+        called when the backend has nothing on the subject yet.
+        """
+        key = self.key_for(quota, subject)
+        window = quota.window.total_seconds()
+        now = time.time()
+        if history is not None and self.backend.needs_history(key):
+            since = datetime.fromtimestamp(now - window, tz=timezone.utc)
+            past = await history(since)
+            await self.backend.seed(key, [_timestamp(moment) for moment in past])
+        token, retry_after = await self.backend.acquire(key, quota.limit, window, now)
+        if token is None:
+            raise QuotaExceededError(quota, max(retry_after, 0.0))
+        return QuotaTicket(key=key, token=token)
+
+    async def release(self, ticket: QuotaTicket) -> None:
+        """Gives back a slot whose action did not happen."""
+        try:
+            await self.backend.release(ticket.key, ticket.token)
+        except Exception as e:
+            logger.warning(f"Could not release quota slot {ticket.key}: {e}")
+
+
+def _timestamp(moment: datetime) -> float:
+    # SQLite returns naive datetimes; they are stored in UTC.
+    return (moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def _backend_from_settings() -> Any:
+    if settings.QUOTA_BACKEND == "redis":
+        if not settings.REDIS_URL:
+            raise ValueError("QUOTA_BACKEND=redis requires REDIS_URL.")
+        import redis.asyncio as redis_asyncio  # Only needed with the shared backend
+
+        return RedisQuotaBackend(redis_asyncio.from_url(settings.REDIS_URL))
+    return InMemoryQuotaBackend()
+
+
+quotas = QuotaService(_backend_from_settings())
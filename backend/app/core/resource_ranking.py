@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import BigInteger, case, func, literal
+
+# Resource links are listed by one stored integer, `rank_key`, descending:
+#   pinned (bit 33) > created in the last NEW_WINDOW (bit 32) > likes - dislikes,
+# the score offset by 2**31 so it stays positive. Votes and pins change the key
+# by a constant (+1/-1, +/-PINNED_RANK), so they can be applied as relative
+# updates; leaving the "new" bucket is applied by a periodic rollover.
+PINNED_RANK = 1 << 33
+NEW_RANK = 1 << 32
+SCORE_OFFSET = 1 << 31
+NEW_WINDOW = timedelta(days=7)
+
+
+def _big(value: int) -> Any:
+    return literal(value, BigInteger)
+
+
+def rank_key_expression(*, is_pinned: Any, created_at: Any, likes: Any, dislikes: Any, now: datetime) -> Any:
+    """SQL expression computing `rank_key` from a row's columns, for bulk (re)computation."""
+    return (
+        case((is_pinned, _big(PINNED_RANK)), else_=_big(0))
+        + case((created_at >= now - NEW_WINDOW, _big(NEW_RANK)), else_=_big(0))
+        + func.coalesce(likes, 0) - func.coalesce(dislikes, 0)
+        + _big(SCORE_OFFSET)
+    )
+
+
+def in_new_bucket(rank_key: Any) -> Any:
+    """SQL condition: the key still carries the "new" bit."""
+    return rank_key.op("&")(_big(NEW_RANK)) != 0
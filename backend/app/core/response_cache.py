@@ -0,0 +1,366 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from sqlalchemy import event, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.projection import dump_json, response_adapter
+from app.db.models.collection_version import CollectionVersion
+
+logger = logging.getLogger(__name__)
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+# Cache namespaces affected by writes to each table. Any committed write to one
+# of these tables drops every cached response of the listed namespaces and bumps
+# their collection version.
+TABLE_NAMESPACES: Dict[str, Tuple[str, ...]] = {
+    "news_items": ("news",),
+    "news_feed": ("news",),
+    "news_item_sectors": ("news",),
+    "sector_counts": ("news",),
+    "blog_posts": ("blog",),
+    "projects": ("projects",),
+    "resource_links": ("resources",),
+    "resource_link_tags": ("resources",),
+    "resource_votes": ("resources",),
+    # Author / submitter names and avatars are embedded in the cached lists.
+    "user": ("news", "blog", "resources"),
+}
+
+
+@dataclass
+class _Entry:
+    namespace: str
+    body: bytes
+    headers: Dict[str, str]
+    expires_at: float
+
+
+@dataclass
+class _Stats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    stale_stores: int = 0
+    namespace_hits: Dict[str, int] = field(default_factory=dict)
+    namespace_misses: Dict[str, int] = field(default_factory=dict)
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of rendered JSON responses, bounded by entry count and
+    total body size, with a per-entry TTL. Entries are grouped in namespaces so a
+    write can drop everything it may have made stale.
+
+    The cache is per process: with several workers, a write only invalidates the
+    worker that committed it and the others catch up when their entries expire.
+
+    Each namespace has a generation, bumped by `invalidate` and embedded in the
+    keys from `key_for`. A route takes its key before querying, so a body read
+    before a write committed is not stored once the write has invalidated it.
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int, ttl_seconds: int, enabled: bool = True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._namespaces: Dict[str, Set[str]] = {}
+        self._generations: Dict[str, int] = {}
+        self._size = 0
+        self._stats = _Stats()
+        self._lock = threading.Lock()
+
+    def key_for(self, namespace: str, request: Request) -> str:
+        """
+        Namespace, its current generation, then the route path and query parameters
+        in a canonical order. Must be taken before the route reads the database.
+        """
+        with self._lock:
+            generation = self._generations.get(namespace, 0)
+        return f"{namespace}:{generation}:{_request_path(request)}"
+
+    def get(self, key: str) -> Optional[Response]:
+        """The cached response for `key`, or None on a miss."""
+        if not self.enabled:
+            return None
+        namespace = key.split(":", 1)[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._drop(key)
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                self._stats.namespace_misses[namespace] = self._stats.namespace_misses.get(namespace, 0) + 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            self._stats.namespace_hits[namespace] = self._stats.namespace_hits.get(namespace, 0) + 1
+        return Response(
+            content=entry.body,
+            media_type="application/json",
+            headers={**entry.headers, CACHE_STATUS_HEADER: "HIT"},
+        )
+
+    def store(
+        self,
+        key: str,
+        response_model: Any,
+        content: Any,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """
+        Serializes `content` through `response_model` (as FastAPI would), caches the
+        bytes under `key` and returns them as the response.
+        """
+        adapter = response_adapter(response_model)
+        body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+        return self._put(key, body, headers)
+
+    def store_json(self, key: str, content: Any, *, headers: Optional[Dict[str, str]] = None) -> Response:
+        """Like `store` for content that is already plain data shaped like the response (projections): no validation."""
+        return self._put(key, dump_json(content), headers)
+
+    def _put(self, key: str, body: bytes, headers: Optional[Dict[str, str]]) -> Response:
+        headers = dict(headers or {})
+        if self.enabled and len(body) <= self.max_bytes:
+            namespace, generation, _ = key.split(":", 2)
+            with self._lock:
+                if int(generation) != self._generations.get(namespace, 0):
+                    # Invalidated while the route was reading: the body may predate the write.
+                    self._stats.stale_stores += 1
+                    return Response(content=body, media_type="application/json", headers={**headers, CACHE_STATUS_HEADER: "MISS"})
+                if key in self._entries:
+                    self._drop(key)
+                self._entries[key] = _Entry(namespace, body, headers, time.monotonic() + self.ttl_seconds)
+                self._namespaces.setdefault(namespace, set()).add(key)
+                self._size += len(body)
+                self._stats.stores += 1
+                while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+                    self._stats.evictions += 1
+        return Response(content=body, media_type="application/json", headers={**headers, CACHE_STATUS_HEADER: "MISS"})
+
+    def invalidate(self, namespaces: Iterable[str]) -> int:
+        """
+        Drops every entry of the given namespaces and bumps their generation, so
+        bodies read before the invalidation are not stored. Returns the number of
+        entries dropped.
+        """
+        dropped = 0
+        with self._lock:
+            for namespace in namespaces:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+                keys = self._namespaces.pop(namespace, set())
+                for key in keys:
+                    self._drop(key)
+                dropped += len(keys)
+                self._stats.invalidations += 1
+        return dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._namespaces.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats.hits + self._stats.misses
+            namespaces = set(self._stats.namespace_hits) | set(self._stats.namespace_misses) | set(self._namespaces)
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._stats.hits,
+                "misses": self._stats.misses,
+                "hit_rate": round(self._stats.hits / lookups, 4) if lookups else None,
+                "stores": self._stats.stores,
+                "evictions": self._stats.evictions,
+                "expirations": self._stats.expirations,
+                "invalidations": self._stats.invalidations,
+                "stale_stores": self._stats.stale_stores,
+                "namespaces": {
+                    namespace: {
+                        "entries": len(self._namespaces.get(namespace, ())),
+                        "hits": self._stats.namespace_hits.get(namespace, 0),
+                        "misses": self._stats.namespace_misses.get(namespace, 0),
+                    }
+                    for namespace in sorted(namespaces)
+                },
+            }
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= len(entry.body)
+        keys = self._namespaces.get(entry.namespace)
+        if keys is not None:
+            keys.discard(key)
+
+
+def _request_path(request: Request) -> str:
+    """Route path plus query parameters in a canonical order."""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+class CollectionVersions:
+    """
+    In-memory copy of the collection versions behind the ETags, so a conditional
+    GET does not need a database lookup. This process's commits set the new
+    versions; values older than `ttl_seconds` are re-read, to see the writes of
+    other workers. Versions only grow: a stale read never replaces a newer value.
+    """
+
+    def __init__(self, *, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._versions: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str) -> Optional[int]:
+        """The known version of `namespace`, or None when it must be read from the database."""
+        entry = self._versions.get(namespace)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def update(self, versions: Dict[str, int]) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for namespace, version in versions.items():
+                current = self._versions.get(namespace)
+                self._versions[namespace] = (max(version, current[0]) if current else version, expires_at)
+
+    def forget(self, namespaces: Iterable[str]) -> None:
+        with self._lock:
+            for namespace in namespaces:
+                self._versions.pop(namespace, None)
+
+
+def make_etag(namespace: str, version: int, request: Request) -> str:
+    """Strong ETag for a response of a collection: its version plus the route and query."""
+    digest = hashlib.sha1(f"{namespace}:{_request_path(request)}".encode()).hexdigest()[:16]
+    return f'"{namespace}-{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match semantics: `*` or any listed tag, with weak comparison as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+)
+collection_versions = CollectionVersions(ttl_seconds=settings.COLLECTION_VERSION_TTL_SECONDS)
+
+
+# --- Write-driven invalidation ---
+# Sessions collect the namespaces touched by their flushes and bulk statements.
+# After the commit, the namespaces' rows in collection_versions are bumped in one
+# short statement of their own (bumping them inside the writing transaction
+# would hold their row locks, serializing every concurrent write to a
+# collection), and the in-process cache drops them. Nothing happens for a
+# rollback, and a concurrent read cannot re-cache data not yet visible.
+
+_PENDING_KEY = "response_cache_namespaces"
+
+# Called after each commit with the namespaces it changed (e.g. to rebuild derived files).
+_commit_listeners: List[Callable[[Set[str]], None]] = []
+
+
+def add_commit_listener(listener: Callable[[Set[str]], None]) -> None:
+    if listener not in _commit_listeners:
+        _commit_listeners.append(listener)
+
+
+def _bump_versions(session: Session, namespaces: Set[str]) -> None:
+    """Bumps the versions of `namespaces` in their own transaction and records the new values in memory."""
+    table = CollectionVersion.__table__
+    try:
+        with session.get_bind().begin() as connection:
+            dialect_insert = pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+            stmt = dialect_insert(table).values([{"namespace": namespace, "version": 1} for namespace in sorted(namespaces)])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.namespace],
+                set_={"version": table.c.version + 1, "updated_at": func.now()},
+            ).returning(table.c.namespace, table.c.version)
+            collection_versions.update(dict(connection.execute(stmt).all()))
+    except Exception as e:
+        # The write is committed: its ETags change at the next bump of these collections.
+        collection_versions.forget(namespaces)
+        logger.error(f"Could not bump the collection versions of {sorted(namespaces)}: {e}", exc_info=True)
+
+
+def _mark_tables(session: Session, table_names: Iterable[str]) -> None:
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    pending.update(namespace for table_name in table_names for namespace in TABLE_NAMESPACES.get(table_name, ()))
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    objects = list(session.new) + list(session.dirty) + list(session.deleted)
+    _mark_tables(session, {getattr(obj, "__tablename__", None) for obj in objects})
+
+
+def _do_orm_execute(state: Any) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None:
+            _mark_tables(state.session, [table.name])
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        _bump_versions(session, pending)
+        response_cache.invalidate(pending)
+        for listener in _commit_listeners:
+            try:
+                listener(pending)
+            except Exception as e:
+                logger.error(f"Commit listener {listener!r} failed: {e}", exc_info=True)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def install_invalidation_hooks(session_class: type = Session) -> None:
+    """Registers the invalidation and versioning listeners on a Session class (idempotent)."""
+    for name, listener in (
+        ("after_flush", _after_flush),
+        ("do_orm_execute", _do_orm_execute),
+        ("after_commit", _after_commit),
+        ("after_rollback", _after_rollback),
+    ):
+        if not event.contains(session_class, name, listener):
+            event.listen(session_class, name, listener)
@@ -0,0 +1,161 @@
+import html
+import re
+from datetime import date, datetime, time, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+# Document types indexed in search_documents.
+DOC_TYPES = ("news", "resource", "blog")
+
+# Terms of a query that are used; the last one also matches as a prefix.
+MAX_QUERY_TERMS = 8
+
+# Snippet highlight markers: control characters that cannot appear in indexed
+# text, swapped for <mark> tags after the snippet has been HTML-escaped.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+# --- Dialect-specific full-text index over search_documents ---
+# SQLite: an external-content FTS5 table kept in sync by triggers (BM25 ranking).
+# Postgres: a stored, weighted tsvector column with a GIN index (ts_rank_cd ranking).
+SEARCH_SCHEMA_DDL: Dict[str, List[str]] = {
+    "sqlite": [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts USING fts5(
+            title, tags, body,
+            content='search_documents', content_rowid='id',
+            tokenize='porter unicode61 remove_diacritics 2'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS search_documents_ai AFTER INSERT ON search_documents BEGIN
+            INSERT INTO search_documents_fts(rowid, title, tags, body) VALUES (new.id, new.title, new.tags, new.body);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS search_documents_ad AFTER DELETE ON search_documents BEGIN
+            INSERT INTO search_documents_fts(search_documents_fts, rowid, title, tags, body)
+            VALUES ('delete', old.id, old.title, old.tags, old.body);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS search_documents_au AFTER UPDATE ON search_documents BEGIN
+            INSERT INTO search_documents_fts(search_documents_fts, rowid, title, tags, body)
+            VALUES ('delete', old.id, old.title, old.tags, old.body);
+            INSERT INTO search_documents_fts(rowid, title, tags, body) VALUES (new.id, new.title, new.tags, new.body);
+        END""",
+        "INSERT INTO search_documents_fts(search_documents_fts) VALUES ('rebuild')",
+    ],
+    "postgresql": [
+        """ALTER TABLE search_documents ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(body, '')), 'C')
+            ) STORED""",
+        "CREATE INDEX IF NOT EXISTS ix_search_documents_search_vector ON search_documents USING GIN (search_vector)",
+    ],
+}
+
+DROP_SEARCH_SCHEMA_DDL: Dict[str, List[str]] = {
+    "sqlite": [
+        "DROP TRIGGER IF EXISTS search_documents_au",
+        "DROP TRIGGER IF EXISTS search_documents_ad",
+        "DROP TRIGGER IF EXISTS search_documents_ai",
+        "DROP TABLE IF EXISTS search_documents_fts",
+    ],
+    "postgresql": [
+        "DROP INDEX IF EXISTS ix_search_documents_search_vector",
+        "ALTER TABLE search_documents DROP COLUMN IF EXISTS search_vector",
+    ],
+}
+
+
+def create_search_schema(connection: Any) -> None:
+    """Creates the full-text index for the connection's dialect (sync connection)."""
+    for statement in SEARCH_SCHEMA_DDL.get(connection.dialect.name, []):
+        connection.execute(text(statement))
+
+
+def drop_search_schema(connection: Any) -> None:
+    for statement in DROP_SEARCH_SCHEMA_DDL.get(connection.dialect.name, []):
+        connection.execute(text(statement))
+
+
+# --- Queries ---
+
+def query_terms(query: str) -> List[str]:
+    """Word terms of a user query; punctuation and search operators are dropped."""
+    return _TERM_RE.findall((query or "").lower())[:MAX_QUERY_TERMS]
+
+
+def fts5_match(terms: List[str]) -> str:
+    """FTS5 MATCH expression: all terms (quoted, so never parsed as syntax), last one as a prefix."""
+    return " ".join(f'"{term}"' for term in terms) + "*"
+
+
+def tsquery(terms: List[str]) -> str:
+    """to_tsquery input with the same semantics as `fts5_match`."""
+    return " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+
+
+def render_snippet(snippet: Optional[str]) -> Optional[str]:
+    """HTML-escapes a snippet and turns the highlight markers into <mark> tags."""
+    if not snippet:
+        return None
+    escaped = html.escape(" ".join(snippet.split()))
+    return escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+
+
+# --- Documents ---
+
+def _join(*parts: Optional[str]) -> str:
+    return "\n\n".join(part.strip() for part in parts if part and part.strip())
+
+
+def _tags_text(tags: Any) -> str:
+    if isinstance(tags, list):
+        return ", ".join(str(tag) for tag in tags if tag)
+    return tags or ""
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, date):
+        return datetime.combine(value, time.min, tzinfo=timezone.utc)
+    return None
+
+
+def news_document(item: Any) -> Dict[str, Any]:
+    """Search document of a news item (`item` exposes the NewsItem columns)."""
+    return {
+        "doc_type": "news",
+        "doc_id": str(item.id),
+        "title": item.title or "",
+        "tags": _tags_text(item.sectors),
+        "body": _join(item.description, item.sourceName),
+        "url": item.url,
+        "published_at": _as_datetime(item.publishedAt),
+    }
+
+
+def resource_document(link: Any) -> Dict[str, Any]:
+    return {
+        "doc_type": "resource",
+        "doc_id": str(link.id),
+        "title": link.title or "",
+        "tags": _tags_text(link.tags),
+        "body": _join(link.ai_generated_description, link.personal_note),
+        "url": link.url,
+        "published_at": _as_datetime(link.created_at),
+    }
+
+
+def blog_document(post: Any) -> Dict[str, Any]:
+    """Blog posts link to their slug; the frontend builds the page URL."""
+    return {
+        "doc_type": "blog",
+        "doc_id": str(post.id),
+        "title": post.title or "",
+        "tags": _tags_text(post.tags),
+        "body": _join(post.excerpt, post.content),
+        "url": post.slug,
+        "published_at": _as_datetime(post.published_date),
+    }
@@ -0,0 +1,82 @@
+import re
+from typing import Iterable, List, Optional
+
+# Longest canonical sector name stored in the sector index.
+MAX_SECTOR_LENGTH = 100
+
+# Tag variants produced by the LLM prompts, the local enricher and older
+# seeds -> canonical sector. Canonical names follow the local enricher's
+# vocabulary; anything not listed is kept as its normalized self.
+SECTOR_ALIASES = {
+    "artificial intelligence": "ai",
+    "a i": "ai",
+    "generative ai": "ai",
+    "gen ai": "ai",
+    "genai": "ai",
+    "ai models": "ai",
+    "ml": "machine learning",
+    "deep learning": "machine learning",
+    "neural networks": "machine learning",
+    "llms": "llm",
+    "large language model": "llm",
+    "large language models": "llm",
+    "language models": "llm",
+    "chatbots": "llm",
+    "robots": "robotics",
+    "automation": "robotics",
+    "autonomous vehicles": "robotics",
+    "cv": "computer vision",
+    "software": "software development",
+    "software engineering": "software development",
+    "programming": "software development",
+    "developer tools": "software development",
+    "dev tools": "software development",
+    "open source": "software development",
+    "cloud computing": "cloud",
+    "semiconductors": "hardware",
+    "chips": "hardware",
+    "gpus": "hardware",
+    "cyber security": "cybersecurity",
+    "security": "cybersecurity",
+    "infosec": "cybersecurity",
+    "ethics": "ai ethics",
+    "ai safety": "ai ethics",
+    "ai regulation": "ai ethics",
+    "regulation": "ai ethics",
+    "science": "research",
+    "startups": "business",
+    "startup": "business",
+    "enterprise": "business",
+    "healthtech": "healthcare",
+    "health tech": "healthcare",
+    "health": "healthcare",
+    "medicine": "healthcare",
+    "biotech": "healthcare",
+}
+
+_SEPARATORS_RE = re.compile(r"[\s_\-/.]+")
+_STRIP_RE = re.compile(r"^[^\w+#]+|[^\w+#]+$")
+
+
+def canonicalize_sector(name: Optional[str]) -> Optional[str]:
+    """
+    Canonical index key for a sector tag: lowercase, separators collapsed to
+    single spaces, hashtags and surrounding punctuation dropped, then mapped through the
+    alias table. Returns None for tags that normalize to nothing.
+    """
+    if not name or not isinstance(name, str):
+        return None
+    normalized = _STRIP_RE.sub("", _SEPARATORS_RE.sub(" ", name.lower()).strip().lstrip("#"))
+    if not normalized:
+        return None
+    return SECTOR_ALIASES.get(normalized, normalized)[:MAX_SECTOR_LENGTH]
+
+
+def canonical_sectors(names: Optional[Iterable[str]]) -> List[str]:
+    """Distinct canonical sectors of a tag list, in first-seen order."""
+    sectors: List[str] = []
+    for name in names or ():
+        sector = canonicalize_sector(name)
+        if sector and sector not in sectors:
+            sectors.append(sector)
+    return sectors
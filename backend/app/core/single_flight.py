@@ -0,0 +1,30 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Collapses concurrent calls with the same key into one: the first caller
+    runs `fn`, later callers await the same task and get its result (or its
+    exception). Nothing is cached once the task is done. Per process.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Any, "asyncio.Task[T]"] = {}
+
+    async def do(self, key: Any, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug(f"[SingleFlight {self.name}] Joining in-flight call for {key}")
+        # Shielded: a waiter that is cancelled does not cancel the work of the others.
+        return await asyncio.shield(task)
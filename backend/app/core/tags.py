@@ -0,0 +1,27 @@
+import re
+from typing import Iterable, List, Optional, Union
+
+# Longest canonical tag stored in the resource tag index.
+MAX_TAG_LENGTH = 100
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def canonicalize_tag(name: Optional[str]) -> Optional[str]:
+    """Canonical index key for a resource tag: lowercase, whitespace collapsed, leading '#' dropped. None if empty."""
+    if not name or not isinstance(name, str):
+        return None
+    normalized = _WHITESPACE_RE.sub(" ", name.lower()).strip().lstrip("#").strip()
+    return normalized[:MAX_TAG_LENGTH] or None
+
+
+def canonical_tags(tags: Union[str, Iterable[str], None]) -> List[str]:
+    """Distinct canonical tags of a comma-separated string (as stored in `ResourceLink.tags`) or a list, in first-seen order."""
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    canonical: List[str] = []
+    for name in tags or ():
+        tag = canonicalize_tag(name)
+        if tag and tag not in canonical:
+            canonical.append(tag)
+    return canonical
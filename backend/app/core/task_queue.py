@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class TaskQueue:
+    """
+    Bounded pool of `workers` tasks draining a queue of at most `max_size`
+    jobs, so slow jobs (page downloads, LLM calls) run outside the requests
+    that enqueue them and never more than `workers` at a time. The workers are
+    started by the first submit in a running event loop. Jobs are not
+    persisted: callers keep their own state and re-submit after a restart.
+    """
+
+    def __init__(self, name: str, *, workers: int, max_size: int):
+        self.name = name
+        self.workers = max(1, workers)
+        self._queue: "asyncio.Queue[Job]" = asyncio.Queue(maxsize=max(1, max_size))
+        self._tasks: List[asyncio.Task] = []
+
+    def full(self) -> bool:
+        return self._queue.full()
+
+    def submit(self, job: Job) -> None:
+        """Enqueues `job` or raises QueueFullError when the backlog is at its limit."""
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(f"Task queue '{self.name}' is full.")
+
+    def _ensure_workers(self) -> None:
+        self._tasks = [task for task in self._tasks if not task.done()]
+        for i in range(len(self._tasks), self.workers):
+            self._tasks.append(asyncio.get_running_loop().create_task(self._work(), name=f"{self.name}-worker-{i}"))
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await job()
+            except Exception as e:
+                logger.error(f"[TaskQueue {self.name}] Job failed: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def join(self, timeout: Optional[float] = None) -> None:
+        """Waits until every queued job has run."""
+        await asyncio.wait_for(self._queue.join(), timeout)
+
+    async def stop(self) -> None:
+        """Cancels the workers; queued jobs are dropped (their owners resume them on startup)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
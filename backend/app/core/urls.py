@@ -0,0 +1,52 @@
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from; they never change the page.
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "ref_url", "si", "_hsenc", "_hsmi", "yclid",
+})
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for duplicate detection (not for fetching): https
+    scheme, lowercase host without "www." or default port, no fragment, no
+    trailing slash, tracking parameters (utm_*, fbclid, ...) dropped and the
+    remaining ones sorted. youtu.be and m.youtube.com links map to
+    youtube.com/watch?v=... Returns the input stripped if it cannot be parsed.
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower().rstrip(".")
+    if not host or scheme not in _DEFAULT_PORTS:
+        return url
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path or "/"
+    query = [
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+    ]
+
+    if host == "youtu.be" and len(path) > 1:
+        host, query, path = "youtube.com", [("v", path.lstrip("/").split("/")[0])] + query, "/watch"
+    elif host == "m.youtube.com":
+        host = "youtube.com"
+
+    netloc = host if port is None or str(port) == _DEFAULT_PORTS[scheme] else f"{host}:{port}"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+    return urlunsplit(("https", netloc, path, urlencode(sorted(query)), ""))
+
+
+def url_hash(url: str) -> str:
+    """SHA-256 (hex) of the normalized URL: a fixed-width key for unique indexes on URLs."""
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
@@ -5,4 +5,14 @@ from .crud_blog import blog_post
 from .crud_resource_link import resource_link
 from .crud_resource_vote import resource_vote
 from .crud_news import news_item
-from .crud_contact import contact_message 
\ No newline at end of file
+from .crud_news_feed import news_feed
+from .crud_news_sector import news_sector
+from .crud_contact import contact_message 
+from .crud_ingestion import ingestion_run
+from .crud_backfill import backfill_job
+from .crud_collection_version import collection_version
+from .crud_search import search_document
+from .crud_resource_link_tag import resource_link_tag
+from .crud_resource_submission import resource_submission
+from .crud_news_submission import news_submission
+from .crud_idempotency_key import idempotency_key
@@ -1,7 +1,9 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, HttpUrl
+from sqlalchemy import Select
 from sqlalchemy.orm import Session
 from sqlalchemy.future import select
 
@@ -13,6 +15,9 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    # Column the bulk exports are ordered and filtered (`updated_since`) by.
+    export_timestamp_column: str = "created_at"
+
     def __init__(self, model: Type[ModelType]):
         """
         CRUD object with default methods to Create, Read, Update, Delete (CRUD).
@@ -21,6 +26,19 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    def export_statement(self, *, since: Optional[datetime] = None) -> Tuple[Select, List[str]]:
+        """
+        Every column of the table, oldest change first, keyed on
+        (`export_timestamp_column`, id) so a consumer can resume from the last
+        timestamp it saw. Returns the statement and its column names.
+        """
+        table = self.model.__table__
+        timestamp = table.c[self.export_timestamp_column]
+        statement = select(table).order_by(timestamp, table.c.id)
+        if since is not None:
+            statement = statement.where(timestamp >= since)
+        return statement, [column.name for column in table.columns]
+
     async def get(self, db: Session, id: Any) -> Optional[ModelType]:
         result = await db.execute(select(self.model).filter(self.model.id == id))
         return result.scalars().first()
@@ -33,7 +51,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         )
         return result.scalars().all()
 
-    async def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
+    async def create(self, db: Session, *, obj_in: CreateSchemaType, commit: bool = True) -> ModelType:
+        """With `commit=False` the row is only flushed, for overrides that write related rows in the same transaction."""
         # Use model_dump() to preserve Python types like datetime
         obj_in_data = obj_in.model_dump()
 
@@ -44,8 +63,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await self._save(db, db_obj, commit)
         return db_obj
 
     async def update(
@@ -53,7 +71,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db: Session,
         *,
         db_obj: ModelType,
-        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        commit: bool = True,
     ) -> ModelType:
         obj_data = jsonable_encoder(db_obj)
         if isinstance(obj_in, dict):
@@ -64,10 +83,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await self._save(db, db_obj, commit)
         return db_obj
 
+    @staticmethod
+    async def _save(db: Session, db_obj: ModelType, commit: bool) -> None:
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
+        await db.refresh(db_obj)
+
     async def remove(self, db: Session, *, id: int) -> ModelType:
         result = await db.execute(select(self.model).filter(self.model.id == id))
         obj = result.scalars().first()
@@ -0,0 +1,32 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import desc
+from typing import List, Optional
+import logging
+
+from app.db.models.backfill import BackfillJob
+from app.crud.base import CRUDBase
+
+logger = logging.getLogger(__name__)
+
+
+class CRUDBackfillJob(CRUDBase[BackfillJob, None, None]):  # Jobs are built by the backfill service
+    async def get_recent(self, db: AsyncSession, *, limit: int = 20) -> List[BackfillJob]:
+        result = await db.execute(
+            select(self.model).order_by(desc(self.model.created_at)).limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_by_status(self, db: AsyncSession, *, status: str) -> List[BackfillJob]:
+        result = await db.execute(select(self.model).where(self.model.status == status))
+        return result.scalars().all()
+
+    async def get_active(self, db: AsyncSession) -> Optional[BackfillJob]:
+        """The job currently pending or running, if any. Only one runs at a time."""
+        result = await db.execute(
+            select(self.model).where(self.model.status.in_(("pending", "running"))).limit(1)
+        )
+        return result.scalars().first()
+
+
+backfill_job = CRUDBackfillJob(BackfillJob)
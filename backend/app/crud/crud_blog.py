@@ -3,14 +3,19 @@ import uuid
 from datetime import date # Asegúrate que date esté importado de datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc # Asegúrate que desc esté importado
-from typing import List, Optional
+from sqlalchemy import Select, desc # Asegúrate que desc esté importado
+from sqlalchemy.engine import RowMapping
+from typing import Any, List, Optional, Sequence, Tuple
 import logging
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
+from app.core import pagination
+from app.core.blog_content import make_excerpt, render_content
 from app.db.models.blog_post import BlogPost
+from app.db.models.user import User
 from app.schemas.blog import BlogPostCreate, BlogPostUpdate
 from app.crud.base import CRUDBase
+from app.crud.crud_search import search_document
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,20 @@ def generate_slug(title: str) -> str:
     s = re.sub(r'^-+|-+$', '', s)
     return s
 
+def render_post(post: BlogPost, *, previous_content: Optional[str] = None) -> None:
+    """
+    Stores the pre-rendered HTML, table of contents and word count of a post's
+    content, and generates its excerpt when it has none or still has the one
+    generated from `previous_content`. Call after changing `content`; does not flush.
+    """
+    rendered = render_content(post.content)
+    post.content_html = rendered.html
+    post.toc = rendered.toc
+    post.word_count = rendered.word_count
+    generated_before = make_excerpt(render_content(previous_content).text) if previous_content is not None else None
+    if not post.excerpt or post.excerpt == generated_before:
+        post.excerpt = make_excerpt(rendered.text) or None
+
 async def get_blog_posts(db: AsyncSession, skip: int = 0, limit: int = 100, status: str = "published") -> List[BlogPost]:
     """Retrieve published blog posts, ordered by date descending."""
     logger.info(f"[CRUD] get_blog_posts llamado con skip={skip}, limit={limit}, status={status}")
@@ -96,9 +115,12 @@ async def create_blog_post(db: AsyncSession, *, blog_post_in: BlogPostCreate, au
         author_id=author_id,
         published_date=date.today()
     )
+    render_post(db_blog_post)
 
     db.add(db_blog_post)
     try:
+        await db.flush()
+        await search_document.refresh(db, doc_type="blog", ids=[db_blog_post.id])
         await db.commit()
     except Exception as e:
         await db.rollback()
@@ -114,6 +136,7 @@ async def update_blog_post(
     blog_post_in: BlogPostUpdate
 ) -> BlogPost:
     update_data = blog_post_in.dict(exclude_unset=True)
+    previous_content = db_blog_post.content
 
     # Si se actualiza el título, opcionalmente se podría regenerar y actualizar el slug
     # Esto requiere cuidado por el impacto en SEO y enlaces existentes.
@@ -128,6 +151,8 @@ async def update_blog_post(
 
     for field, value in update_data.items():
         setattr(db_blog_post, field, value)
+    if "content" in update_data or "excerpt" in update_data:
+        render_post(db_blog_post, previous_content=previous_content)
     
     # Actualizar last_modified_date si el modelo no lo hace automáticamente con onupdate
     # El modelo tiene onupdate=date.today para last_modified_date, pero es para tipo Date.
@@ -137,11 +162,14 @@ async def update_blog_post(
 
 
     db.add(db_blog_post)
+    await db.flush()
+    await search_document.refresh(db, doc_type="blog", ids=[db_blog_post.id])
     await db.commit()
     await db.refresh(db_blog_post)
     return db_blog_post
 
 async def delete_blog_post(db: AsyncSession, *, db_blog_post: BlogPost):
+    await search_document.remove(db, doc_type="blog", ids=[db_blog_post.id])
     await db.delete(db_blog_post)
     await db.commit()
 
@@ -151,27 +179,91 @@ class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
     async def get_multi(
         self, db: AsyncSession, *, skip: int = 0, limit: int = 100, status: Optional[str] = None, require_linkedin_url: bool = False
     ) -> list[BlogPost]:
-        statement = (
-            select(self.model)
-            .offset(skip)
-            .limit(limit)
-            .options(selectinload(self.model.author))
-            .order_by(self.model.published_date.desc())
+        items, _ = await self.get_page(
+            db, skip=skip, limit=limit, status=status, require_linkedin_url=require_linkedin_url
         )
+        return items
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        require_linkedin_url: bool = False
+    ) -> Tuple[List[BlogPost], Optional[str]]:
+        """Newest first, keyed on (published_date, id). With a `cursor`, `skip` is ignored."""
+        statement = self._page_statement(
+            select(self.model).options(selectinload(self.model.author)),
+            skip=skip, limit=limit, cursor=cursor, status=status, require_linkedin_url=require_linkedin_url,
+        )
+        result = await db.execute(statement)
+        items = result.scalars().all()
+        return items[:limit], pagination.next_cursor(items, limit, lambda post: (post.published_date, post.id))
+
+    async def get_page_rows(
+        self,
+        db: AsyncSession,
+        *,
+        columns: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        require_linkedin_url: bool = False
+    ) -> Tuple[List[RowMapping], Optional[str]]:
+        """
+        Same page as `get_page`, reading only `columns` as plain rows (no ORM
+        entities, so no `content` unless asked for). `author_full_name` is
+        available as a column.
+        """
+        selected = dict.fromkeys([*columns, "published_date", "id"])
+        selected.pop("author_full_name", None)
+        statement = select(*(getattr(self.model, name) for name in selected))
+        if "author_full_name" in columns:
+            statement = statement.add_columns(User.full_name.label("author_full_name")).outerjoin(
+                User, User.id == self.model.author_id
+            )
+        statement = self._page_statement(
+            statement, skip=skip, limit=limit, cursor=cursor, status=status, require_linkedin_url=require_linkedin_url
+        )
+        rows = (await db.execute(statement)).all()
+        return (
+            [row._mapping for row in rows[:limit]],
+            pagination.next_cursor(rows, limit, lambda post: (post.published_date, post.id)),
+        )
+
+    def _page_statement(
+        self,
+        statement: Select,
+        *,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        status: Optional[str],
+        require_linkedin_url: bool,
+    ) -> Select:
+        sort_columns = (self.model.published_date, self.model.id)
+        statement = statement.limit(limit + 1).order_by(*(desc(column) for column in sort_columns))
+        if cursor:
+            statement = statement.where(pagination.before(sort_columns, pagination.decode_cursor(cursor, 2)))
+        else:
+            statement = statement.offset(skip)
+
         if status:
             statement = statement.where(self.model.status == status)
         
         if require_linkedin_url:
             statement = statement.where(self.model.linkedin_post_url.isnot(None))
-            
-        result = await db.execute(statement)
-        return result.scalars().all()
+        return statement
 
     async def get_by_slug(self, db: AsyncSession, *, slug: str) -> Optional[BlogPost]:
         statement = (
             select(self.model)
             .where(self.model.slug == slug)
-            .options(selectinload(self.model.author))
+            .options(joinedload(self.model.author))  # One round trip: the body is pre-rendered
         )
         result = await db.execute(statement)
         return result.scalar_one_or_none()
@@ -181,9 +273,52 @@ class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
     ) -> BlogPost:
         slug = generate_slug(obj_in.title)
         db_obj = self.model(**obj_in.model_dump(), author_id=author_id, slug=slug)
+        render_post(db_obj)
         db.add(db_obj)
+        await db.flush()
+        await search_document.refresh(db, doc_type="blog", ids=[db_obj.id])
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
 
+    # --- Writes keep the rendered content and the search index in sync ---
+
+    async def create(self, db: AsyncSession, *, obj_in: BlogPostCreate) -> BlogPost:
+        db_obj = await super().create(db, obj_in=obj_in, commit=False)
+        render_post(db_obj)
+        await db.flush()
+        await search_document.refresh(db, doc_type="blog", ids=[db_obj.id])
+        await db.commit()
+        return db_obj
+
+    async def update(self, db: AsyncSession, *, db_obj: BlogPost, obj_in: Any) -> BlogPost:
+        previous_content = db_obj.content
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in, commit=False)
+        if db_obj.content != previous_content or db_obj.content_html is None:
+            render_post(db_obj, previous_content=previous_content)
+            await db.flush()
+        await search_document.refresh(db, doc_type="blog", ids=[db_obj.id])
+        await db.commit()
+        return db_obj
+
+    async def rerender(self, db: AsyncSession, *, only_missing: bool = True) -> int:
+        """
+        Renders posts written outside the CRUD layer (seeding, import scripts):
+        those never rendered, or all of them. Returns the number rendered. Does not commit.
+        """
+        statement = select(self.model)
+        if only_missing:
+            statement = statement.where(self.model.content_html.is_(None))
+        posts = (await db.execute(statement)).scalars().all()
+        for post in posts:
+            render_post(post)
+        if posts:
+            await db.flush()
+            logger.info(f"[CRUD] Rendered the content of {len(posts)} blog posts.")
+        return len(posts)
+
+    async def remove(self, db: AsyncSession, *, id: str) -> BlogPost:
+        await search_document.remove(db, doc_type="blog", ids=[id])
+        return await super().remove(db, id=id)
+
 blog_post = CRUDBlogPost(BlogPost) 
\ No newline at end of file
@@ -0,0 +1,27 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import Dict, Iterable
+import logging
+
+from app.db.models.collection_version import CollectionVersion
+from app.crud.base import CRUDBase
+
+logger = logging.getLogger(__name__)
+
+
+class CRUDCollectionVersion(CRUDBase[CollectionVersion, None, None]):  # Bumped by the session write hooks
+    async def get_version(self, db: AsyncSession, *, namespace: str) -> int:
+        """Current version of a collection; 0 until its first recorded write."""
+        result = await db.execute(select(self.model.version).where(self.model.namespace == namespace))
+        return result.scalar_one_or_none() or 0
+
+    async def get_versions(self, db: AsyncSession, *, namespaces: Iterable[str]) -> Dict[str, int]:
+        namespaces = list(namespaces)
+        result = await db.execute(
+            select(self.model.namespace, self.model.version).where(self.model.namespace.in_(namespaces))
+        )
+        versions = dict(result.all())
+        return {namespace: versions.get(namespace, 0) for namespace in namespaces}
+
+
+collection_version = CRUDCollectionVersion(CollectionVersion)
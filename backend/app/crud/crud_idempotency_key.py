@@ -0,0 +1,59 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.future import select
+from sqlalchemy import delete, update
+from typing import Dict, Optional
+from datetime import datetime
+import json
+import logging
+
+from app.db.models.idempotency_key import IdempotencyKey
+from app.crud.base import CRUDBase
+
+logger = logging.getLogger(__name__)
+
+_BULK = {"synchronize_session": False}
+
+
+class CRUDIdempotencyKey(CRUDBase[IdempotencyKey, None, None]):  # Written by app.api.idempotency
+    async def get_for_user(self, db: AsyncSession, *, user_id: int, key: str) -> Optional[IdempotencyKey]:
+        result = await db.execute(
+            select(self.model).where(self.model.user_id == user_id, self.model.key == key)
+        )
+        return result.scalars().first()
+
+    async def reserve(self, db: AsyncSession, *, user_id: int, key: str, fingerprint: str) -> bool:
+        """Claims the key for a request about to run. False if another request holds it already."""
+        db.add(self.model(user_id=user_id, key=key, request_fingerprint=fingerprint))
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            return False
+        return True
+
+    async def complete(
+        self, db: AsyncSession, *, user_id: int, key: str, status_code: int, body: str, headers: Dict[str, str]
+    ) -> None:
+        await db.execute(
+            update(self.model)
+            .where(self.model.user_id == user_id, self.model.key == key)
+            .values(status_code=status_code, response_body=body, response_headers=json.dumps(headers))
+            .execution_options(**_BULK)
+        )
+        await db.commit()
+
+    async def release(self, db: AsyncSession, *, user_id: int, key: str) -> None:
+        """Forgets the key, so the request can be retried with it."""
+        await db.execute(
+            delete(self.model).where(self.model.user_id == user_id, self.model.key == key).execution_options(**_BULK)
+        )
+        await db.commit()
+
+    async def purge_expired(self, db: AsyncSession, *, before: datetime) -> int:
+        """Deletes keys created before `before`. Does not commit."""
+        result = await db.execute(delete(self.model).where(self.model.created_at < before).execution_options(**_BULK))
+        return result.rowcount
+
+
+idempotency_key = CRUDIdempotencyKey(IdempotencyKey)
@@ -0,0 +1,113 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import desc, func
+from typing import Any, Dict, List
+from datetime import datetime
+import logging
+
+from app.db.models.ingestion import IngestionRun, IngestionEvent
+from app.crud.base import CRUDBase
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("fetch", "extract", "llm", "image", "insert")
+
+
+class CRUDIngestionRun(CRUDBase[IngestionRun, None, None]):  # Written by the ingestion recorder, no schemas
+    async def get_recent(self, db: AsyncSession, *, limit: int = 20) -> List[IngestionRun]:
+        result = await db.execute(
+            select(self.model).order_by(desc(self.model.started_at)).limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_stats(self, db: AsyncSession, *, since: datetime) -> Dict[str, Any]:
+        """Aggregates finished runs (and their article events) started after `since`."""
+        finished = (self.model.started_at >= since, self.model.status != "running")
+
+        totals_stmt = select(
+            func.count(self.model.id),
+            func.coalesce(func.sum(self.model.articles_fetched), 0),
+            func.coalesce(func.sum(self.model.articles_processed), 0),
+            func.coalesce(func.sum(self.model.articles_stored), 0),
+            func.coalesce(func.sum(self.model.articles_dropped), 0),
+            func.coalesce(func.sum(self.model.total_ms), 0),
+            func.coalesce(func.sum(self.model.prompt_tokens), 0),
+            func.coalesce(func.sum(self.model.completion_tokens), 0),
+            func.coalesce(func.sum(self.model.input_tokens_saved), 0),
+            *[func.coalesce(func.sum(getattr(self.model, f"{stage}_ms")), 0) for stage in STAGES],
+        ).where(*finished)
+        row = (await db.execute(totals_stmt)).one()
+        runs, fetched, processed, stored, dropped, total_ms, prompt_tokens, completion_tokens, tokens_saved = row[:9]
+        stage_totals = dict(zip(STAGES, row[9:]))
+        stage_sum = sum(stage_totals.values()) or 1
+
+        run_ids = select(self.model.id).where(*finished)
+        reasons_stmt = (
+            select(IngestionEvent.drop_reason, func.count(IngestionEvent.id))
+            .where(IngestionEvent.run_id.in_(run_ids), IngestionEvent.drop_reason.isnot(None))
+            .group_by(IngestionEvent.drop_reason)
+            .order_by(desc(func.count(IngestionEvent.id)))
+        )
+        drop_reasons = {reason: count for reason, count in (await db.execute(reasons_stmt)).all()}
+
+        providers_stmt = (
+            select(
+                IngestionEvent.provider,
+                func.count(IngestionEvent.id),
+                func.coalesce(func.sum(IngestionEvent.prompt_tokens), 0),
+                func.coalesce(func.sum(IngestionEvent.completion_tokens), 0),
+                func.coalesce(func.sum(IngestionEvent.input_tokens_saved), 0),
+                func.avg(IngestionEvent.llm_ms),
+            )
+            .where(IngestionEvent.run_id.in_(run_ids), IngestionEvent.provider.isnot(None))
+            .group_by(IngestionEvent.provider)
+        )
+        providers = {
+            provider: {
+                "articles": count,
+                "prompt_tokens": p_tokens,
+                "completion_tokens": c_tokens,
+                "input_tokens_saved": saved,
+                "avg_llm_ms": round(float(avg_llm_ms or 0), 1),
+            }
+            for provider, count, p_tokens, c_tokens, saved, avg_llm_ms in (await db.execute(providers_stmt)).all()
+        }
+
+        per_article_stmt = select(
+            func.avg(IngestionEvent.extract_ms),
+            func.avg(IngestionEvent.llm_ms),
+            func.avg(IngestionEvent.image_ms),
+        ).where(IngestionEvent.run_id.in_(run_ids))
+        avg_extract, avg_llm, avg_image = (await db.execute(per_article_stmt)).one()
+
+        return {
+            "since": since,
+            "runs": runs,
+            "articles_fetched": fetched,
+            "articles_processed": processed,
+            "articles_stored": stored,
+            "articles_dropped": dropped,
+            "total_ms": total_ms,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "input_tokens_saved": tokens_saved,
+            "stages": [
+                {
+                    "stage": stage,
+                    "total_ms": stage_totals[stage],
+                    "avg_ms_per_run": round(stage_totals[stage] / runs, 1) if runs else 0.0,
+                    "share": round(stage_totals[stage] / stage_sum, 3),
+                }
+                for stage in STAGES
+            ],
+            "avg_article_ms": {
+                "extract": round(float(avg_extract or 0), 1),
+                "llm": round(float(avg_llm or 0), 1),
+                "image": round(float(avg_image or 0), 1),
+            },
+            "drop_reasons": drop_reasons,
+            "providers": providers,
+        }
+
+
+ingestion_run = CRUDIngestionRun(IngestionRun)
@@ -1,19 +1,28 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc, asc, func
+from sqlalchemy import desc, asc, func, or_, update, delete
 from sqlalchemy.orm import selectinload
-from typing import List, Optional, Sequence
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 from datetime import datetime, timezone, timedelta
+from pydantic import HttpUrl
 import logging
+import uuid
 
-from app.db.models.news_item import NewsItem
+from app.db.models.news_item import NewsItem, NewsItemContent
 from app.schemas.news import NewsItemCreate, NewsItemUpdate
 from app.crud.base import CRUDBase
+from app.crud.crud_news_feed import news_feed
+from app.crud.crud_news_sector import news_sector
+from app.crud.crud_search import search_document
 
 logger = logging.getLogger(__name__)
 
 
 class CRUDNewsItem(CRUDBase[NewsItem, NewsItemCreate, NewsItemUpdate]):
+    export_timestamp_column = "updated_at"
+
     async def get_multi(
         self,
         db: AsyncSession,
@@ -78,6 +87,37 @@ class CRUDNewsItem(CRUDBase[NewsItem, NewsItemCreate, NewsItemUpdate]):
 
         return news_items
 
+    # --- Writes keep the news_feed read model, the sector index and the search index in sync (same transaction where possible) ---
+
+    async def refresh_derived(self, db: AsyncSession, *, ids: Iterable[uuid.UUID]) -> None:
+        """Re-syncs the feed rows, sector index and search documents of the given items. Does not commit."""
+        ids = list(ids)
+        await news_feed.refresh(db, ids=ids)
+        await news_sector.refresh(db, ids=ids)
+        await search_document.refresh(db, doc_type="news", ids=ids)
+
+    async def create(self, db: AsyncSession, *, obj_in: NewsItemCreate) -> NewsItem:
+        db_obj = await super().create(db, obj_in=obj_in, commit=False)
+        await self.refresh_derived(db, ids=[db_obj.id])
+        await db.commit()
+        return db_obj
+
+    async def update(
+        self, db: AsyncSession, *, db_obj: NewsItem, obj_in: Union[NewsItemUpdate, Dict[str, Any]]
+    ) -> NewsItem:
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in, commit=False)
+        await self.refresh_derived(db, ids=[db_obj.id])
+        await db.commit()
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> NewsItem:
+        await db.execute(
+            delete(news_feed.model).where(news_feed.model.id == id).execution_options(synchronize_session=False)
+        )
+        await news_sector.clear(db, ids=[id])
+        await search_document.remove(db, doc_type="news", ids=[id])
+        return await super().remove(db, id=id)
+
     async def get_by_url(self, db: AsyncSession, *, url: str) -> Optional[NewsItem]:
         result = await db.execute(select(self.model).filter(self.model.url == url))
         return result.scalars().first()
@@ -87,28 +127,109 @@ class CRUDNewsItem(CRUDBase[NewsItem, NewsItemCreate, NewsItemUpdate]):
     ) -> List[NewsItem]:
         db_objs = [self.model(**item.model_dump()) for item in objs_in]
         db.add_all(db_objs)
+        await db.flush()
+        await self.refresh_derived(db, ids=[obj.id for obj in db_objs])
         await db.commit()
         # Note: Refreshing is not performed on bulk creation for performance.
         # The returned objects will not have DB-assigned defaults (like ID).
         return db_objs
 
-    async def get_top_sectors(self, db: AsyncSession, *, limit: int = 10) -> list[str]:
-        """Get the most frequent sectors from all news items."""
-        # Using a subquery for the unnested sectors
-        sector_subquery = func.jsonb_array_elements_text(self.model.sectors).alias("sector")
-        
-        # Constructing the main query
+    async def get_existing_urls(self, db: AsyncSession, *, urls: Iterable[str]) -> Set[str]:
+        """Returns the subset of `urls` that are already stored, in a single query."""
+        urls = list(urls)
+        if not urls:
+            return set()
+        result = await db.execute(select(self.model.url).where(self.model.url.in_(urls)))
+        return set(result.scalars().all())
+
+    def _row_from_schema(self, obj_in: NewsItemCreate) -> Dict[str, Any]:
+        row = obj_in.model_dump()
+        for key, value in row.items():
+            if isinstance(value, HttpUrl):
+                row[key] = str(value)
+        row["id"] = uuid.uuid4()
+        if row.get("publishedAt") is None:
+            row["publishedAt"] = datetime.now(timezone.utc)
+        if row.get("is_community") is None:
+            row["is_community"] = False
+        return row
+
+    async def insert_many_ignore_duplicates(
+        self, db: AsyncSession, *, objs_in: List[NewsItemCreate]
+    ) -> List[Tuple[uuid.UUID, str]]:
+        """
+        Inserts all items in one multi-row `INSERT ... ON CONFLICT (url) DO NOTHING
+        RETURNING id, url` statement. Rows whose URL already exists are skipped by
+        the database instead of raising an IntegrityError.
+
+        Does not commit; returns the (id, url) pairs that were actually inserted.
+        """
+        if not objs_in:
+            return []
+        rows = [self._row_from_schema(obj_in) for obj_in in objs_in]
+        dialect_insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
         stmt = (
-            select(sector_subquery)
-            .where(self.model.sectors.isnot(None))  # Ensure sectors column is not null
-            .group_by(sector_subquery)
-            .order_by(func.count().desc())
+            dialect_insert(self.model)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[self.model.url])
+            .returning(self.model.id, self.model.url)
+        )
+        result = await db.execute(stmt)
+        inserted = [(row.id, row.url) for row in result.all()]
+        await self.refresh_derived(db, ids=[item_id for item_id, _ in inserted])
+        return inserted
+
+    def _reenrichment_filters(
+        self,
+        *,
+        target_prompt_version: int,
+        published_since: Optional[datetime] = None,
+        published_until: Optional[datetime] = None,
+    ) -> List[Any]:
+        filters = [or_(self.model.prompt_version.is_(None), self.model.prompt_version < target_prompt_version)]
+        if published_since:
+            filters.append(self.model.publishedAt >= published_since)
+        if published_until:
+            filters.append(self.model.publishedAt < published_until)
+        return filters
+
+    async def count_reenrichment_candidates(self, db: AsyncSession, **filters: Any) -> int:
+        stmt = select(func.count(self.model.id)).where(*self._reenrichment_filters(**filters))
+        return (await db.execute(stmt)).scalar_one()
+
+    async def get_reenrichment_page(
+        self,
+        db: AsyncSession,
+        *,
+        after_id: Optional[uuid.UUID],
+        limit: int,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Next page of items evaluated with an older prompt version, by keyset on id
+        (`id > after_id`), with the stored extracted content when there is one.
+        """
+        stmt = (
+            select(self.model.id, self.model.title, self.model.url, NewsItemContent.content)
+            .outerjoin(NewsItemContent, NewsItemContent.news_item_id == self.model.id)
+            .where(*self._reenrichment_filters(**filters))
+            .order_by(self.model.id)
             .limit(limit)
         )
-        
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
         result = await db.execute(stmt)
-        top_sectors = result.scalars().all()
-        return top_sectors
+        return [row._asdict() for row in result.all()]
+
+    async def bulk_update_enrichment(self, db: AsyncSession, *, rows: List[Dict[str, Any]]) -> None:
+        """ORM bulk UPDATE by primary key; each row holds `id` plus the columns to set. Does not commit."""
+        if rows:
+            await db.execute(update(self.model), rows)
+            await self.refresh_derived(db, ids=[row["id"] for row in rows])
+
+    async def get_top_sectors(self, db: AsyncSession, *, limit: int = 10) -> list[str]:
+        """Get the most frequent (canonical) sectors from all news items."""
+        return await news_sector.get_top(db, limit=limit)
 
 
 news_item = CRUDNewsItem(NewsItem)
@@ -0,0 +1,231 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import Select, desc, func, case, update, delete
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone, timedelta
+import logging
+import uuid
+
+from app.core import pagination
+from app.core.sectors import canonicalize_sector
+from app.db.models.news_feed import NewsFeedEntry
+from app.db.models.news_item import NewsItem
+from app.db.models.news_sector import NewsItemSector
+from app.db.models.user import User
+from app.crud.base import CRUDBase
+
+logger = logging.getLogger(__name__)
+
+# Bulk statements on the feed skip ORM session synchronization: feed rows are not edited in-session.
+_BULK = {"synchronize_session": False}
+
+# Columns copied verbatim from news_items.
+_NEWS_COLUMNS = (
+    "id", "title", "url", "description", "imageUrl", "sourceName", "sourceId", "sectors",
+    "relevance_rating", "is_community", "publishedAt", "created_at", "updated_at", "submitted_by_user_id",
+)
+REBUILD_CHUNK_SIZE = 200
+
+
+def start_of_week(now: Optional[datetime] = None) -> datetime:
+    now = now or datetime.now(timezone.utc)
+    start = now - timedelta(days=now.weekday())
+    return start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def base_promotion_level(rating: Optional[float]) -> int:
+    """Level without the weekly top-20% promotion, which `rerank` applies."""
+    return 1 if rating and rating > 3.5 else 0
+
+
+class CRUDNewsFeed(CRUDBase[NewsFeedEntry, None, None]):  # Derived from news_items, never written directly
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        sector: Optional[str] = None,
+    ) -> Tuple[List[NewsFeedEntry], Optional[str]]:
+        """
+        Newest first, keyed on (publishedAt, id); one range scan on
+        ix_news_feed_published_at_id, or on the sector index when filtering by
+        `sector` (any tag variant; it is canonicalized). With a `cursor` the page
+        starts after it and `skip` is ignored. Returns the items and the cursor of
+        the next page.
+        """
+        stmt = self._page_statement(select(self.model), skip=skip, limit=limit, cursor=cursor, sector=sector)
+        if stmt is None:
+            return [], None
+        items = (await db.execute(stmt)).scalars().all()
+        return items[:limit], pagination.next_cursor(items, limit, lambda item: (item.publishedAt, item.id))
+
+    async def get_page_rows(
+        self,
+        db: AsyncSession,
+        *,
+        columns: Sequence[str],
+        skip: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        sector: Optional[str] = None,
+    ) -> Tuple[List[RowMapping], Optional[str]]:
+        """Same page as `get_page`, reading only `columns` as plain rows (no ORM entities)."""
+        selected = dict.fromkeys([*columns, "publishedAt", "id"])
+        stmt = self._page_statement(
+            select(*(getattr(self.model, name) for name in selected)),
+            skip=skip, limit=limit, cursor=cursor, sector=sector,
+        )
+        if stmt is None:
+            return [], None
+        rows = (await db.execute(stmt)).all()
+        return (
+            [row._mapping for row in rows[:limit]],
+            pagination.next_cursor(rows, limit, lambda row: (row.publishedAt, row.id)),
+        )
+
+    def _page_statement(
+        self, stmt: Select, *, skip: int, limit: int, cursor: Optional[str], sector: Optional[str]
+    ) -> Optional[Select]:
+        """Ordering, filter and keyset of a feed page on `stmt`; None when `sector` cannot match anything."""
+        if sector is None:
+            sort_columns = (self.model.publishedAt, self.model.id)
+        else:
+            canonical = canonicalize_sector(sector)
+            if canonical is None:
+                return None
+            sort_columns = (NewsItemSector.published_at, NewsItemSector.news_item_id)
+            stmt = (
+                stmt.join(NewsItemSector, NewsItemSector.news_item_id == self.model.id)
+                .where(NewsItemSector.sector == canonical)
+            )
+        stmt = stmt.order_by(*(desc(column) for column in sort_columns)).limit(limit + 1)
+        if cursor:
+            return stmt.where(pagination.before(sort_columns, pagination.decode_cursor(cursor, 2)))
+        return stmt.offset(skip)
+
+    def _source_select(self):
+        return (
+            select(
+                *(getattr(NewsItem, column) for column in _NEWS_COLUMNS),
+                User.full_name.label("submitter_full_name"),
+                User.avatar_path.label("submitter_avatar_path"),
+                User.website_url.label("submitter_website_url"),
+            )
+            .outerjoin(User, User.id == NewsItem.submitted_by_user_id)
+        )
+
+    @staticmethod
+    def _row_values(row: Any) -> Dict[str, Any]:
+        values = row._asdict()
+        values["promotion_level"] = base_promotion_level(values["relevance_rating"])
+        return values
+
+    async def _upsert(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        dialect_insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(self.model).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.id],
+            set_={key: stmt.excluded[key] for key in rows[0] if key != "id"},
+        )
+        await db.execute(stmt)
+
+    async def refresh(self, db: AsyncSession, *, ids: Iterable[uuid.UUID]) -> None:
+        """
+        Upserts the feed rows of the given news items (deleting rows whose item is
+        gone) and re-ranks the current week if any of them falls in it. Does not commit.
+        """
+        ids = list(ids)
+        if not ids:
+            return
+        result = await db.execute(self._source_select().where(NewsItem.id.in_(ids)))
+        rows = [self._row_values(row) for row in result.all()]
+        found = {row["id"] for row in rows}
+        missing = [item_id for item_id in ids if item_id not in found]
+        if missing:
+            await db.execute(delete(self.model).where(self.model.id.in_(missing)).execution_options(**_BULK))
+        if rows:
+            await self._upsert(db, rows)
+            week_start = start_of_week()
+            if any(self._as_utc(row["publishedAt"]) >= week_start for row in rows if row["publishedAt"]):
+                await self.rerank(db)
+
+    async def refresh_submitter(self, db: AsyncSession, *, user: User) -> None:
+        """Copies a user's display fields to the feed rows they submitted. Does not commit."""
+        await db.execute(
+            update(self.model)
+            .where(self.model.submitted_by_user_id == user.id)
+            .values(
+                submitter_full_name=user.full_name,
+                submitter_avatar_path=user.avatar_path,
+                submitter_website_url=user.website_url,
+            )
+            .execution_options(**_BULK)
+        )
+
+    async def rerank(self, db: AsyncSession, *, now: Optional[datetime] = None) -> None:
+        """
+        Recomputes weekly promotion: items of the current week with rating > 4.0 in
+        the top 20% by rating get level 2; level-2 items from earlier weeks drop
+        back to their base level. Touches only the current week. Does not commit.
+        """
+        week_start = start_of_week(now)
+        await db.execute(
+            update(self.model)
+            .where(self.model.promotion_level == 2, self.model.publishedAt < week_start)
+            .values(promotion_level=1)
+            .execution_options(**_BULK)
+        )
+        await db.execute(
+            update(self.model)
+            .where(self.model.publishedAt >= week_start)
+            .values(promotion_level=case((self.model.relevance_rating > 3.5, 1), else_=0))
+            .execution_options(**_BULK)
+        )
+        count_stmt = select(func.count(self.model.id)).where(
+            self.model.publishedAt >= week_start, self.model.relevance_rating > 4.0
+        )
+        top_limit = int(((await db.execute(count_stmt)).scalar_one() or 0) * 0.2)
+        if top_limit > 0:
+            top_ids = (
+                select(self.model.id)
+                .where(self.model.publishedAt >= week_start, self.model.relevance_rating > 4.0)
+                .order_by(desc(self.model.relevance_rating))
+                .limit(top_limit)
+                .scalar_subquery()
+            )
+            await db.execute(
+                update(self.model).where(self.model.id.in_(top_ids)).values(promotion_level=2).execution_options(**_BULK)
+            )
+
+    async def reconcile(self, db: AsyncSession) -> int:
+        """
+        Brings the feed in line with news_items after writes that bypass the CRUD
+        layer (seeding, maintenance scripts): drops orphan rows, adds missing ones
+        and re-ranks. Returns the number of rows added. Does not commit.
+        """
+        await db.execute(delete(self.model).where(~self.model.id.in_(select(NewsItem.id))).execution_options(**_BULK))
+        missing_stmt = self._source_select().where(~NewsItem.id.in_(select(self.model.id)))
+        result = await db.execute(missing_stmt)
+        added = 0
+        while True:
+            chunk = result.fetchmany(REBUILD_CHUNK_SIZE)
+            if not chunk:
+                break
+            await self._upsert(db, [self._row_values(row) for row in chunk])
+            added += len(chunk)
+        await self.rerank(db)
+        if added:
+            logger.info(f"News feed reconciled: {added} missing rows added.")
+        return added
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+news_feed = CRUDNewsFeed(NewsFeedEntry)
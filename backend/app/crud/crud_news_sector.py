@@ -0,0 +1,117 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import desc, delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from collections import Counter
+from typing import Any, Dict, Iterable, List
+import logging
+import uuid
+
+from app.core.sectors import canonical_sectors
+from app.db.models.news_item import NewsItem
+from app.db.models.news_sector import NewsItemSector, SectorCount
+from app.crud.base import CRUDBase
+
+logger = logging.getLogger(__name__)
+
+# Bulk statements on the index skip ORM session synchronization: its rows are not edited in-session.
+_BULK = {"synchronize_session": False}
+REBUILD_CHUNK_SIZE = 500
+
+
+class CRUDNewsSector(CRUDBase[NewsItemSector, None, None]):  # Derived from news_items.sectors, never written directly
+    async def get_top(self, db: AsyncSession, *, limit: int = 10) -> List[str]:
+        """Most frequent canonical sectors, read from the maintained counts."""
+        result = await db.execute(
+            select(SectorCount.sector)
+            .where(SectorCount.count > 0)
+            .order_by(desc(SectorCount.count), SectorCount.sector)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def refresh(self, db: AsyncSession, *, ids: Iterable[uuid.UUID]) -> None:
+        """
+        Re-indexes the sectors of the given news items (items that no longer exist
+        lose their rows) and adjusts the counts by the difference. Does not commit.
+        """
+        ids = list(ids)
+        if not ids:
+            return
+        result = await db.execute(
+            select(NewsItem.id, NewsItem.sectors, NewsItem.publishedAt).where(NewsItem.id.in_(ids))
+        )
+        await self._replace(db, ids, self._index_rows(result.all()))
+
+    async def clear(self, db: AsyncSession, *, ids: Iterable[uuid.UUID]) -> None:
+        """Drops the index rows of news items about to be deleted. Does not commit."""
+        ids = list(ids)
+        if ids:
+            await self._replace(db, ids, [])
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Recomputes the whole index and the counts from news_items, for writes that
+        bypass the CRUD layer (seeding, maintenance scripts). Returns the number of
+        index rows. Does not commit.
+        """
+        await db.execute(delete(self.model).execution_options(**_BULK))
+        await db.execute(delete(SectorCount).execution_options(**_BULK))
+        result = await db.execute(select(NewsItem.id, NewsItem.sectors, NewsItem.publishedAt))
+        counts: Counter = Counter()
+        while True:
+            chunk = result.fetchmany(REBUILD_CHUNK_SIZE)
+            if not chunk:
+                break
+            rows = self._index_rows(chunk)
+            if rows:
+                await db.execute(insert(self.model), rows)
+                counts.update(row["sector"] for row in rows)
+        if counts:
+            await db.execute(insert(SectorCount), [{"sector": s, "count": c} for s, c in counts.items()])
+        total = sum(counts.values())
+        logger.info(f"Sector index rebuilt: {total} rows across {len(counts)} sectors.")
+        return total
+
+    @staticmethod
+    def _index_rows(items: Iterable[Any]) -> List[Dict[str, Any]]:
+        return [
+            {"news_item_id": item_id, "sector": sector, "published_at": published_at}
+            for item_id, sectors, published_at in items
+            for sector in canonical_sectors(sectors if isinstance(sectors, list) else None)
+        ]
+
+    async def _replace(self, db: AsyncSession, ids: List[uuid.UUID], rows: List[Dict[str, Any]]) -> None:
+        old = Counter(
+            (await db.execute(select(self.model.sector).where(self.model.news_item_id.in_(ids)))).scalars().all()
+        )
+        await db.execute(delete(self.model).where(self.model.news_item_id.in_(ids)).execution_options(**_BULK))
+        if rows:
+            await db.execute(insert(self.model), rows)
+        delta = Counter(row["sector"] for row in rows)
+        delta.subtract(old)
+        await self._adjust_counts(db, {sector: change for sector, change in delta.items() if change})
+
+    async def _adjust_counts(self, db: AsyncSession, deltas: Dict[str, int]) -> None:
+        """Atomic `count = count + delta` upserts; sectors that drop to zero are removed."""
+        if not deltas:
+            return
+        dialect_insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(SectorCount).values(
+            [{"sector": sector, "count": change} for sector, change in sorted(deltas.items())]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SectorCount.sector],
+            set_={"count": SectorCount.count + stmt.excluded.count},
+        )
+        await db.execute(stmt)
+        if any(change < 0 for change in deltas.values()):
+            await db.execute(
+                delete(SectorCount)
+                .where(SectorCount.sector.in_(list(deltas)), SectorCount.count <= 0)
+                .execution_options(**_BULK)
+            )
+
+
+news_sector = CRUDNewsSector(NewsItemSector)
@@ -0,0 +1,63 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from typing import Any, Optional
+from datetime import datetime
+import logging
+
+from app.db.models.news_submission import NewsSubmission
+from app.crud.crud_submission import CRUDSubmission
+from app.core.urls import normalize_url
+
+logger = logging.getLogger(__name__)
+
+
+class CRUDNewsSubmission(CRUDSubmission[NewsSubmission]):
+    owner_column = "submitted_by_user_id"
+    result_column = "news_item_id"
+
+    async def reopen(self, db: AsyncSession, *, db_obj: NewsSubmission) -> bool:
+        """Puts a failed submission back in the queue's hands. False when its URL is being analysed again meanwhile."""
+        db_obj.status = "pending"
+        db_obj.active_url = normalize_url(db_obj.url)
+        db_obj.attempts = 0
+        db_obj.error = None
+        db_obj.retryable = False
+        db_obj.finished_at = None
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            return False
+        await db.refresh(db_obj)
+        return True
+
+    async def start_attempt(self, db: AsyncSession, *, db_obj: NewsSubmission) -> NewsSubmission:
+        db_obj.attempts += 1
+        db_obj.next_attempt_at = None
+        return await self.mark_processing(db, db_obj=db_obj)
+
+    async def schedule_retry(self, db: AsyncSession, *, db_obj: NewsSubmission, error: str, at: datetime) -> NewsSubmission:
+        """Back to pending after a transient failure; the URL stays reserved."""
+        db_obj.status = "pending"
+        db_obj.error = error
+        db_obj.next_attempt_at = at
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def finish(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: NewsSubmission,
+        result_id: Optional[Any] = None,
+        error: Optional[str] = None,
+        retryable: bool = False,
+    ) -> NewsSubmission:
+        """Like `CRUDSubmission.finish`; a failure can be marked `retryable` by its author."""
+        db_obj.retryable = bool(error) and retryable
+        db_obj.next_attempt_at = None
+        return await super().finish(db, db_obj=db_obj, result_id=result_id, error=error)
+
+
+news_submission = CRUDNewsSubmission(NewsSubmission)
@@ -1,21 +1,30 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc, func, case as sa_case
+from sqlalchemy import Select, desc, update
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import selectinload
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import logging
 import uuid # To generate IDs if they don't come from the model, although our model does it by default
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 import sqlalchemy as sa
 
+from app.core import pagination
+from app.core.urls import url_hash
+from app.core.resource_ranking import NEW_RANK, NEW_WINDOW, in_new_bucket, rank_key_expression
 from app.db.models.resource_link import ResourceLink
+from app.db.models.user import User
 from app.schemas.resource_link import ResourceLinkCreate, ResourceLinkUpdate
 from app.crud.base import CRUDBase
+from app.crud.crud_resource_link_tag import resource_link_tag
+from app.crud.crud_search import search_document
 
 logger = logging.getLogger(__name__)
 
 
 class CRUDResourceLink(CRUDBase[ResourceLink, ResourceLinkCreate, ResourceLinkUpdate]):
+    export_timestamp_column = "updated_at"
+
     async def get_multi(
         self,
         db: AsyncSession,
@@ -25,39 +34,114 @@ class CRUDResourceLink(CRUDBase[ResourceLink, ResourceLinkCreate, ResourceLinkUp
         resource_type: Optional[str] = None,
         tags_contain: Optional[List[str]] = None
     ) -> List[ResourceLink]:
-        seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
-        is_new_case = sa_case((self.model.created_at >= seven_days_ago, 1), else_=0)
-        interest_score = (
-            func.coalesce(self.model.likes, 0) - func.coalesce(self.model.dislikes, 0)
-        ).label("interest_score")
-
-        stmt = (
-            select(self.model)
-            .options(selectinload(self.model.author))
-            .order_by(
-                desc(self.model.is_pinned),
-                desc(is_new_case),
-                desc(interest_score),
-                desc(self.model.created_at)
+        items, _ = await self.get_page(
+            db, skip=skip, limit=limit, resource_type=resource_type, tags_contain=tags_contain
+        )
+        return items
+
+    def _sort_columns(self) -> Tuple[Any, ...]:
+        """(rank_key, created_at, id), all descending: one range read on ix_resource_links_rank."""
+        return (self.model.rank_key, self.model.created_at, self.model.id)
+
+    @staticmethod
+    def _sort_key(item: Any) -> List[Any]:
+        return [item.rank_key, item.created_at, item.id]
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        tags_contain: Optional[List[str]] = None
+    ) -> Tuple[List[ResourceLink], Optional[str]]:
+        """Returns a page and the cursor of the next one. With a `cursor`, `skip` is ignored."""
+        stmt = self._page_statement(
+            select(self.model).options(selectinload(self.model.author)),
+            skip=skip, limit=limit, cursor=cursor, resource_type=resource_type, tags_contain=tags_contain,
+        )
+        result = await db.execute(stmt)
+        items = result.scalars().all()
+        return items[:limit], pagination.next_cursor(items, limit, self._sort_key)
+
+    async def get_page_rows(
+        self,
+        db: AsyncSession,
+        *,
+        columns: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        tags_contain: Optional[List[str]] = None
+    ) -> Tuple[List[RowMapping], Optional[str]]:
+        """
+        Same page as `get_page`, reading only `columns` as plain rows (no ORM
+        entities). `author_full_name` is available as a column.
+        """
+        selected = dict.fromkeys([*columns, "rank_key", "created_at", "id"])
+        selected.pop("author_full_name", None)
+        stmt = select(*(getattr(self.model, name) for name in selected))
+        if "author_full_name" in columns:
+            stmt = stmt.add_columns(User.full_name.label("author_full_name")).outerjoin(
+                User, User.id == self.model.author_id
             )
-            .offset(skip)
-            .limit(limit)
+        stmt = self._page_statement(
+            stmt, skip=skip, limit=limit, cursor=cursor, resource_type=resource_type, tags_contain=tags_contain
         )
+        rows = (await db.execute(stmt)).all()
+        return [row._mapping for row in rows[:limit]], pagination.next_cursor(rows, limit, self._sort_key)
+
+    def _page_statement(
+        self,
+        stmt: Select,
+        *,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        resource_type: Optional[str],
+        tags_contain: Optional[List[str]],
+    ) -> Select:
+        """Ordering, filters and keyset of a page on `stmt`."""
+        sort_columns = self._sort_columns()
+        stmt = stmt.order_by(*(desc(column) for column in sort_columns)).limit(limit + 1)
+        if cursor:
+            stmt = stmt.where(pagination.before(sort_columns, pagination.decode_cursor(cursor, 3)))
+        else:
+            stmt = stmt.offset(skip)
 
         if resource_type:
             stmt = stmt.filter(self.model.resource_type == resource_type)
 
         if tags_contain:
-            for tag in tags_contain:
-                stmt = stmt.filter(self.model.tags.ilike(f'%{tag.strip()}%'))
-
-        result = await db.execute(stmt)
-        return result.scalars().all()
+            tagged_ids = resource_link_tag.matching_ids(tags_contain)
+            if tagged_ids is not None:
+                stmt = stmt.filter(self.model.id.in_(tagged_ids))
+        return stmt
 
     async def get_by_url(self, db: AsyncSession, *, url: str) -> Optional[ResourceLink]:
-        result = await db.execute(select(self.model).filter(self.model.url == url))
+        """The link stored for `url` or any spelling of it with the same normalized form."""
+        result = await db.execute(select(self.model).filter(self.model.url_hash == url_hash(url)))
         return result.scalars().first()
     
+    async def get_youtube_links(self, db: AsyncSession) -> List[Tuple[str, str, Optional[str]]]:
+        """(id, url, thumbnail_url) of the links to YouTube videos, found by their normalized URL."""
+        result = await db.execute(
+            select(self.model.id, self.model.url, self.model.thumbnail_url)
+            .where(self.model.url_normalized.like("https://youtube.com/watch?%"))
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def set_thumbnails(self, db: AsyncSession, *, thumbnails: Dict[str, str]) -> None:
+        """Replaces the thumbnail of each link id in `thumbnails`. Does not commit."""
+        for link_id, thumbnail_url in thumbnails.items():
+            await db.execute(
+                update(self.model).where(self.model.id == link_id).values(thumbnail_url=thumbnail_url)
+                .execution_options(synchronize_session=False)
+            )
+
     async def create_with_author(
         self, db: AsyncSession, *, obj_in: ResourceLinkCreate, author_id: Optional[int]
     ) -> ResourceLink:
@@ -70,10 +154,76 @@ class CRUDResourceLink(CRUDBase[ResourceLink, ResourceLinkCreate, ResourceLinkUp
 
         db_obj = self.model(**obj_in_data, author_id=author_id)
         db.add(db_obj)
+        await db.flush()
+        await self.refresh_derived(db, ids=[db_obj.id])
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
 
+    # --- Writes keep the tag and search indexes in sync ---
+
+    async def refresh_derived(self, db: AsyncSession, *, ids: List[str]) -> None:
+        """Recomputes the rank keys and re-indexes the tags and search documents of the given links. Does not commit."""
+        await self.refresh_rank_keys(db, ids=ids)
+        await resource_link_tag.refresh(db, ids=ids)
+        await search_document.refresh(db, doc_type="resource", ids=ids)
+
+    async def remove_derived(self, db: AsyncSession, *, ids: List[str]) -> None:
+        """Drops the derived rows of links about to be deleted. Does not commit."""
+        await resource_link_tag.clear(db, ids=ids)
+        await search_document.remove(db, doc_type="resource", ids=ids)
+
+    async def create(self, db: AsyncSession, *, obj_in: ResourceLinkCreate) -> ResourceLink:
+        db_obj = await super().create(db, obj_in=obj_in, commit=False)
+        await self.refresh_derived(db, ids=[db_obj.id])
+        await db.commit()
+        return db_obj
+
+    async def update(self, db: AsyncSession, *, db_obj: ResourceLink, obj_in: Any) -> ResourceLink:
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in, commit=False)
+        await self.refresh_derived(db, ids=[db_obj.id])
+        await db.commit()
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: str) -> ResourceLink:
+        await self.remove_derived(db, ids=[id])
+        return await super().remove(db, id=id)
+
+    # --- Stored ranking (see app.core.resource_ranking) ---
+
+    async def refresh_rank_keys(
+        self, db: AsyncSession, *, ids: Optional[List[str]] = None, now: Optional[datetime] = None
+    ) -> None:
+        """
+        Recomputes `rank_key` from the pin, age and vote columns of the given links
+        (all of them when `ids` is None). `updated_at` is left as is. Does not commit.
+        """
+        stmt = update(self.model).values(
+            rank_key=rank_key_expression(
+                is_pinned=self.model.is_pinned, created_at=self.model.created_at,
+                likes=self.model.likes, dislikes=self.model.dislikes,
+                now=now or datetime.now(timezone.utc),
+            ),
+            updated_at=self.model.updated_at,
+        )
+        if ids is not None:
+            stmt = stmt.where(self.model.id.in_(ids))
+        await db.execute(stmt.execution_options(synchronize_session=False))
+
+    async def roll_new_bucket(self, db: AsyncSession, *, now: Optional[datetime] = None) -> int:
+        """
+        Takes links older than NEW_WINDOW out of the "new" bucket of their rank
+        key. Returns how many were moved. Does not commit.
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - NEW_WINDOW
+        result = await db.execute(
+            update(self.model)
+            .where(in_new_bucket(self.model.rank_key), self.model.created_at < cutoff)
+            .values(rank_key=self.model.rank_key - NEW_RANK, updated_at=self.model.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     async def pin(self, db: AsyncSession, *, db_obj: ResourceLink) -> ResourceLink:
         if not db_obj.is_pinned:
             db_obj.is_pinned = True
@@ -89,16 +239,6 @@ class CRUDResourceLink(CRUDBase[ResourceLink, ResourceLinkCreate, ResourceLinkUp
 
 resource_link = CRUDResourceLink(ResourceLink)
 
-async def count_resources_by_author_since(db: AsyncSession, *, author_id: int, since: datetime) -> int:
-    """Counts the number of resources submitted by a user since a specific datetime."""
-    logger.debug(f"[CRUD ResourceLink] Counting resources for author_id:{author_id} since {since}")
-    stmt = select(func.count(ResourceLink.id)).filter(
-        ResourceLink.author_id == author_id,
-        ResourceLink.created_at >= since
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one()
-
 async def update_resource_link(
     db: AsyncSession,
     *, 
@@ -121,6 +261,8 @@ async def update_resource_link(
     # db_obj.last_modified_at = datetime.utcnow() 
 
     db.add(db_obj)
+    await db.flush()
+    await resource_link.refresh_derived(db, ids=[db_obj.id])
     await db.commit()
     await db.refresh(db_obj)
     logger.info(f"[CRUD ResourceLink] Resource link '{db_obj.title}' (ID: {db_obj.id}) updated.")
@@ -130,6 +272,7 @@ async def delete_resource_link(db: AsyncSession, *, db_obj: ResourceLink) -> Res
     """Delete a resource link."""
     resource_id = db_obj.id
     resource_title = db_obj.title
+    await resource_link.remove_derived(db, ids=[resource_id])
     await db.delete(db_obj)
     await db.commit()
     logger.info(f"[CRUD ResourceLink] Resource link '{resource_title}' (ID: {resource_id}) deleted.")
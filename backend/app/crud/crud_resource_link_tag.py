@@ -0,0 +1,94 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import Select, desc, delete, func, insert
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+from app.core.tags import canonical_tags
+from app.db.models.resource_link import ResourceLink
+from app.db.models.resource_link_tag import ResourceLinkTag
+from app.crud.base import CRUDBase
+
+logger = logging.getLogger(__name__)
+
+# Bulk statements on the index skip ORM session synchronization: its rows are not edited in-session.
+_BULK = {"synchronize_session": False}
+REBUILD_CHUNK_SIZE = 500
+
+
+class CRUDResourceLinkTag(CRUDBase[ResourceLinkTag, None, None]):  # Derived from resource_links.tags, never written directly
+    def matching_ids(self, tags: Iterable[str]) -> Optional[Select]:
+        """
+        Ids of the resource links carrying every given tag (canonicalized), as a
+        subquery: one index range per tag, intersected by the GROUP BY. None when
+        no tag survives canonicalization.
+        """
+        wanted = canonical_tags(list(tags))
+        if not wanted:
+            return None
+        return (
+            select(self.model.resource_link_id)
+            .where(self.model.tag.in_(wanted))
+            .group_by(self.model.resource_link_id)
+            .having(func.count() == len(wanted))
+        )
+
+    async def get_counts(
+        self, db: AsyncSession, *, limit: int = 50, resource_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Most used tags with their number of resource links, most used first."""
+        count = func.count().label("count")
+        stmt = select(self.model.tag, count).group_by(self.model.tag).order_by(desc(count), self.model.tag).limit(limit)
+        if resource_type:
+            stmt = stmt.join(ResourceLink, ResourceLink.id == self.model.resource_link_id).where(
+                ResourceLink.resource_type == resource_type
+            )
+        return [{"tag": tag, "count": n} for tag, n in (await db.execute(stmt)).all()]
+
+    async def refresh(self, db: AsyncSession, *, ids: Iterable[str]) -> None:
+        """Re-indexes the tags of the given resource links (links that no longer exist lose their rows). Does not commit."""
+        ids = list(ids)
+        if not ids:
+            return
+        result = await db.execute(select(ResourceLink.id, ResourceLink.tags).where(ResourceLink.id.in_(ids)))
+        await db.execute(delete(self.model).where(self.model.resource_link_id.in_(ids)).execution_options(**_BULK))
+        rows = self._index_rows(result.all())
+        if rows:
+            await db.execute(insert(self.model), rows)
+
+    async def clear(self, db: AsyncSession, *, ids: Iterable[str]) -> None:
+        """Drops the index rows of resource links about to be deleted. Does not commit."""
+        ids = list(ids)
+        if ids:
+            await db.execute(delete(self.model).where(self.model.resource_link_id.in_(ids)).execution_options(**_BULK))
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Recomputes the whole index from resource_links, for writes that bypass the
+        CRUD layer (seeding, maintenance scripts). Returns the number of index rows.
+        Does not commit.
+        """
+        await db.execute(delete(self.model).execution_options(**_BULK))
+        result = await db.execute(select(ResourceLink.id, ResourceLink.tags))
+        total = 0
+        while True:
+            chunk = result.fetchmany(REBUILD_CHUNK_SIZE)
+            if not chunk:
+                break
+            rows = self._index_rows(chunk)
+            if rows:
+                await db.execute(insert(self.model), rows)
+                total += len(rows)
+        logger.info(f"Resource tag index rebuilt: {total} rows.")
+        return total
+
+    @staticmethod
+    def _index_rows(items: Iterable[Any]) -> List[Dict[str, Any]]:
+        return [
+            {"resource_link_id": resource_id, "tag": tag}
+            for resource_id, tags in items
+            for tag in canonical_tags(tags)
+        ]
+
+
+resource_link_tag = CRUDResourceLinkTag(ResourceLinkTag)
@@ -0,0 +1,29 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import List
+from datetime import datetime
+import logging
+
+from app.db.models.resource_submission import ResourceSubmission
+from app.crud.crud_submission import CRUDSubmission
+
+logger = logging.getLogger(__name__)
+
+
+class CRUDResourceSubmission(CRUDSubmission[ResourceSubmission]):
+    owner_column = "author_id"
+    result_column = "resource_link_id"
+
+    async def get_times_by_author_since(self, db: AsyncSession, *, author_id: int, since: datetime) -> List[datetime]:
+        """Creation times of the user's submissions since `since` that did not fail (they count towards the quota)."""
+        result = await db.execute(
+            select(self.model.created_at).where(
+                self.model.author_id == author_id,
+                self.model.created_at >= since,
+                self.model.status != "failed",
+            )
+        )
+        return list(result.scalars().all())
+
+
+resource_submission = CRUDResourceSubmission(ResourceSubmission)
@@ -1,21 +1,45 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 
+from app.core.quota import Quota, QuotaExceededError, QuotaTicket, quotas
 from app.db.models.resource_vote import ResourceVote, VoteType
 from app.db.models.resource_link import ResourceLink
-from app.db.models.user import User
 from app.schemas.resource_link import ResourceLinkVoteResponse
 from app.crud.base import CRUDBase
-from app.schemas.resource_link import ResourceLinkUpdate  # Assuming this exists
+from app.crud.crud_resource_link import resource_link as crud_resource_link
 
 # Vote limits per day
 DAILY_LIKE_LIMIT = 5
 DAILY_DISLIKE_LIMIT = 2
 AUTODELETE_DISLIKE_THRESHOLD = 3
 
+# New votes only: switching an existing vote does not take a slot.
+VOTE_QUOTAS = {
+    VoteType.like: Quota("resource_likes", DAILY_LIKE_LIMIT, timedelta(hours=24)),
+    VoteType.dislike: Quota("resource_dislikes", DAILY_DISLIKE_LIMIT, timedelta(hours=24)),
+}
+
+
+class VoteLimitError(PermissionError):
+    """The user reached a daily vote limit."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ResourceGoneError(LookupError):
+    """The resource link was deleted before the vote could be counted."""
+
 
 class CRUDResourceVote(CRUDBase[ResourceVote, None, None]):  # No standard schemas
+    export_timestamp_column = "updated_at"
+
     async def get_vote_by_user_for_resource(
         self, db: AsyncSession, *, user_id: int, resource_link_id: str
     ) -> ResourceVote | None:
@@ -26,75 +50,140 @@ class CRUDResourceVote(CRUDBase[ResourceVote, None, None]):  # No standard schem
         result = await db.execute(stmt)
         return result.scalars().first()
 
-    async def get_daily_vote_counts(
-        self, db: AsyncSession, *, user_id: int
-    ) -> tuple[int, int]:
-        twenty_four_hours_ago = datetime.utcnow() - timedelta(hours=24)
-        stmt = select(
-            func.count(func.nullif(self.model.vote_type != VoteType.like, True)),
-            func.count(func.nullif(self.model.vote_type != VoteType.dislike, True)),
-        ).filter(
+    async def get_vote_times(
+        self, db: AsyncSession, *, user_id: int, vote_type: VoteType, since: datetime
+    ) -> List[datetime]:
+        """When the user cast their current votes of `vote_type` since `since` (warms up the vote quotas)."""
+        stmt = select(self.model.created_at).filter(
             self.model.user_id == user_id,
-            self.model.created_at >= twenty_four_hours_ago,
+            self.model.vote_type == vote_type,
+            self.model.created_at >= since,
         )
-        result = await db.execute(stmt)
-        return result.one()
+        return list((await db.execute(stmt)).scalars().all())
 
     async def vote_on_resource(
-        self, db: AsyncSession, *, user: User, resource: ResourceLink, vote_type: VoteType
+        self, db: AsyncSession, *, user_id: int, resource_id: str, vote_type: VoteType
     ) -> ResourceLinkVoteResponse:
-        existing_vote = await self.get_vote_by_user_for_resource(
-            db, user_id=user.id, resource_link_id=resource.id
-        )
-        message = ""
+        """
+        Records a user's like/dislike and applies it to the link's counters in one
+        transaction, without reading the counters first: the vote row is switched
+        or inserted with single conditional statements (the unique
+        (user_id, resource_link_id) constraint arbitrates concurrent requests), and
+        the counters move with one relative UPDATE ... RETURNING that also reports
+        whether the auto-delete threshold was crossed.
 
-        if existing_vote:
-            if existing_vote.vote_type == vote_type:
-                raise PermissionError(f"You have already voted '{vote_type.name}'.")
-            
-            if existing_vote.vote_type == VoteType.like:
-                resource.likes = max(0, resource.likes - 1)
-            else:
-                resource.dislikes = max(0, resource.dislikes - 1)
-            existing_vote.vote_type = vote_type
-            db.add(existing_vote)
+        Raises VoteLimitError when the user hit a daily limit, PermissionError when
+        they already cast this vote or the vote got the link removed, and
+        ResourceGoneError when the link no longer exists.
+        """
+        ticket: Optional[QuotaTicket] = None
+        if await self._switch_vote(db, user_id=user_id, resource_id=resource_id, vote_type=vote_type):
             message = "Your vote has been updated."
+            deltas = (1, -1) if vote_type == VoteType.like else (-1, 1)
         else:
-            likes, dislikes = await self.get_daily_vote_counts(db, user_id=user.id)
-            if vote_type == VoteType.like and likes >= DAILY_LIKE_LIMIT:
-                raise PermissionError(f"Daily limit of {DAILY_LIKE_LIMIT} 'likes' reached.")
-            if vote_type == VoteType.dislike and dislikes >= DAILY_DISLIKE_LIMIT:
-                raise PermissionError(f"Daily limit of {DAILY_DISLIKE_LIMIT} 'dislikes' reached.")
-            
-            new_vote = self.model(
-                user_id=user.id, resource_link_id=resource.id, vote_type=vote_type
-            )
-            db.add(new_vote)
+            ticket = await self._take_vote_slot(db, user_id=user_id, vote_type=vote_type)
+            try:
+                inserted = await self._insert_vote(db, user_id=user_id, resource_id=resource_id, vote_type=vote_type)
+            except Exception:
+                await quotas.release(ticket)
+                raise
+            if not inserted:
+                await quotas.release(ticket)
+                await db.rollback()
+                raise PermissionError(f"You have already voted '{vote_type.name}'.")
             message = "Thank you for your vote!"
+            deltas = (1, 0) if vote_type == VoteType.like else (0, 1)
 
-        if vote_type == VoteType.like:
-            resource.likes += 1
-        else:
-            resource.dislikes += 1
-        db.add(resource)
-        
-        if (
-            resource.dislikes >= AUTODELETE_DISLIKE_THRESHOLD
-            and resource.dislikes > resource.likes
-        ):
-            await db.delete(resource)
+        try:
+            likes, dislikes, remove = await self._apply_counts(db, resource_id=resource_id, deltas=deltas)
+        except Exception:
+            if ticket is not None:
+                await quotas.release(ticket)
+            raise
+        if remove:
+            resource = await crud_resource_link.get(db, id=resource_id)
+            await crud_resource_link.remove_derived(db, ids=[resource_id])
+            await db.delete(resource)  # Cascades to its votes
             await db.commit()
             raise PermissionError("This resource has been removed due to negative feedback.")
-
         await db.commit()
-        await db.refresh(resource)
 
         return ResourceLinkVoteResponse(
             message=message,
-            likes=resource.likes,
-            dislikes=resource.dislikes,
-            user_vote=vote_type,
+            likes=likes,
+            dislikes=dislikes,
+            user_vote=vote_type.value,
         )
 
+    async def _take_vote_slot(self, db: AsyncSession, *, user_id: int, vote_type: VoteType) -> QuotaTicket:
+        quota = VOTE_QUOTAS[vote_type]
+        try:
+            return await quotas.acquire(
+                quota, user_id,
+                history=lambda since: self.get_vote_times(db, user_id=user_id, vote_type=vote_type, since=since),
+            )
+        except QuotaExceededError as e:
+            await db.rollback()
+            raise VoteLimitError(f"Daily limit of {quota.limit} '{vote_type.name}s' reached.", retry_after=e.retry_after)
+
+    async def _switch_vote(self, db: AsyncSession, *, user_id: int, resource_id: str, vote_type: VoteType) -> bool:
+        """Turns the user's opposite vote into `vote_type`. Returns whether there was one."""
+        result = await db.execute(
+            update(self.model)
+            .where(
+                self.model.user_id == user_id,
+                self.model.resource_link_id == resource_id,
+                self.model.vote_type != vote_type,
+            )
+            .values(vote_type=vote_type, updated_at=func.now())
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.first() is not None
+
+    async def _insert_vote(self, db: AsyncSession, *, user_id: int, resource_id: str, vote_type: VoteType) -> bool:
+        """Inserts the vote unless the user already has one on the link. Returns whether it was inserted."""
+        dialect_insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = (
+            dialect_insert(self.model)
+            .values(user_id=user_id, resource_link_id=resource_id, vote_type=vote_type, created_at=func.now())
+            .on_conflict_do_nothing(index_elements=[self.model.user_id, self.model.resource_link_id])
+            .returning(self.model.id)
+        )
+        try:
+            return (await db.execute(stmt)).first() is not None
+        except IntegrityError:  # Foreign key: the link is gone
+            await db.rollback()
+            raise ResourceGoneError(resource_id)
+
+    async def _apply_counts(
+        self, db: AsyncSession, *, resource_id: str, deltas: Tuple[int, int]
+    ) -> Tuple[int, int, bool]:
+        """
+        `likes += dl, dislikes += dd` (and the rank key by dl - dd) in one statement.
+        Returns the new counts and whether the link crossed the auto-delete threshold.
+        """
+        like_delta, dislike_delta = deltas
+        likes = ResourceLink.likes + like_delta
+        dislikes = ResourceLink.dislikes + dislike_delta
+        row = (await db.execute(
+            update(ResourceLink)
+            .where(ResourceLink.id == resource_id)
+            .values(likes=likes, dislikes=dislikes, rank_key=ResourceLink.rank_key + (like_delta - dislike_delta))
+            .returning(
+                ResourceLink.likes,
+                ResourceLink.dislikes,
+                and_(
+                    ResourceLink.dislikes >= AUTODELETE_DISLIKE_THRESHOLD,
+                    ResourceLink.dislikes > ResourceLink.likes,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )).first()
+        if row is None:
+            await db.rollback()
+            raise ResourceGoneError(resource_id)
+        return row[0], row[1], bool(row[2])
+
 
 resource_vote = CRUDResourceVote(ResourceVote)
@@ -0,0 +1,253 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import delete, text, bindparam, column, Integer, Float, String, DateTime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from app.core import pagination
+from app.core.search import (
+    HIGHLIGHT_END, HIGHLIGHT_START, blog_document, fts5_match, news_document, query_terms,
+    render_snippet, resource_document, tsquery,
+)
+from app.db.models.blog_post import BlogPost
+from app.db.models.news_item import NewsItem
+from app.db.models.resource_link import ResourceLink
+from app.db.models.search_document import SearchDocument
+from app.crud.base import CRUDBase
+
+logger = logging.getLogger(__name__)
+
+# Bulk statements on the index skip ORM session synchronization: its rows are not edited in-session.
+_BULK = {"synchronize_session": False}
+RECONCILE_CHUNK_SIZE = 200
+
+# BM25 column weights (title, tags, body) on SQLite; Postgres uses the A/B/C tsvector weights.
+_BM25_WEIGHTS = "10.0, 4.0, 1.0"
+_PG_HEADLINE_OPTIONS = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=35, MinWords=15, MaxFragments=2"
+
+_RESULT_COLUMNS = (
+    column("id", Integer), column("doc_type", String), column("doc_id", String), column("title", String),
+    column("url", String), column("published_at", DateTime(timezone=True)), column("snippet", String),
+)
+
+
+class _Source:
+    """Where the documents of one type come from: columns read (not ORM entities, so
+    bulk-updated rows are never served stale from the identity map) and the builder."""
+
+    def __init__(self, model: Any, columns: Tuple[Any, ...], build: Callable[[Any], Dict[str, Any]], where: Any = None):
+        self.model = model
+        self.columns = columns
+        self.build = build
+        self.where = where
+
+    def select(self):
+        stmt = select(*self.columns)
+        return stmt.where(self.where) if self.where is not None else stmt
+
+
+_SOURCES: Dict[str, _Source] = {
+    "news": _Source(
+        NewsItem,
+        (NewsItem.id, NewsItem.title, NewsItem.sectors, NewsItem.description, NewsItem.sourceName,
+         NewsItem.url, NewsItem.publishedAt),
+        news_document,
+    ),
+    "resource": _Source(
+        ResourceLink,
+        (ResourceLink.id, ResourceLink.title, ResourceLink.tags, ResourceLink.ai_generated_description,
+         ResourceLink.personal_note, ResourceLink.url, ResourceLink.created_at),
+        resource_document,
+    ),
+    # Drafts are not searchable.
+    "blog": _Source(
+        BlogPost,
+        (BlogPost.id, BlogPost.title, BlogPost.tags, BlogPost.excerpt, BlogPost.content, BlogPost.slug,
+         BlogPost.published_date),
+        blog_document,
+        BlogPost.status == "published",
+    ),
+}
+
+
+class CRUDSearchDocument(CRUDBase[SearchDocument, None, None]):  # Derived from the indexed tables, never written directly
+    async def refresh(self, db: AsyncSession, *, doc_type: str, ids: Iterable[Any]) -> None:
+        """
+        Re-indexes the given items of one type; items that no longer exist (or are
+        no longer searchable) lose their document. Does not commit.
+        """
+        ids = list(ids)
+        if not ids:
+            return
+        source = _SOURCES[doc_type]
+        result = await db.execute(source.select().where(source.model.id.in_(ids)))
+        docs = [source.build(row) for row in result.all()]
+        found = {doc["doc_id"] for doc in docs}
+        missing = [str(item_id) for item_id in ids if str(item_id) not in found]
+        if missing:
+            await self.remove(db, doc_type=doc_type, ids=missing)
+        if docs:
+            await self._upsert(db, docs)
+
+    async def remove(self, db: AsyncSession, *, doc_type: str, ids: Iterable[Any]) -> None:
+        """Drops the documents of items about to be deleted. Does not commit."""
+        ids = [str(item_id) for item_id in ids]
+        if ids:
+            await db.execute(
+                delete(self.model)
+                .where(self.model.doc_type == doc_type, self.model.doc_id.in_(ids))
+                .execution_options(**_BULK)
+            )
+
+    async def reconcile(self, db: AsyncSession) -> int:
+        """
+        Indexes items with no document and drops documents whose item is gone, for
+        writes that bypass the CRUD layer (seeding, scripts). Returns the number of
+        documents added. Does not commit.
+        """
+        added = 0
+        for doc_type, source in _SOURCES.items():
+            indexed = set(
+                (await db.execute(select(self.model.doc_id).where(self.model.doc_type == doc_type))).scalars().all()
+            )
+            id_stmt = select(source.model.id)
+            if source.where is not None:
+                id_stmt = id_stmt.where(source.where)
+            current = {str(item_id): item_id for item_id in (await db.execute(id_stmt)).scalars().all()}
+            orphans = list(indexed - current.keys())
+            missing = [current[doc_id] for doc_id in current.keys() - indexed]
+            for start in range(0, len(orphans), RECONCILE_CHUNK_SIZE):
+                await self.remove(db, doc_type=doc_type, ids=orphans[start:start + RECONCILE_CHUNK_SIZE])
+            for start in range(0, len(missing), RECONCILE_CHUNK_SIZE):
+                await self.refresh(db, doc_type=doc_type, ids=missing[start:start + RECONCILE_CHUNK_SIZE])
+            added += len(missing)
+        if added:
+            logger.info(f"Search index reconciled: {added} missing documents added.")
+        return added
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        doc_type: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Ranked full-text search (BM25 on SQLite, ts_rank_cd on Postgres), best first,
+        keyed on (score, id). Every query term must match; the last one also matches
+        as a prefix. Snippets are HTML-escaped with the matches in <mark> tags.
+        Returns the results and the cursor of the next page.
+        """
+        terms = query_terms(query)
+        if not terms or limit <= 0:
+            return [], None
+        after = pagination.decode_cursor(cursor, 2) if cursor else None
+        if db.get_bind().dialect.name == "postgresql":
+            rows = await self._search_postgres(db, terms, doc_type, limit + 1, after)
+        else:
+            rows = await self._search_sqlite(db, terms, doc_type, limit + 1, after)
+        items = [
+            {
+                "type": row["doc_type"],
+                "id": row["doc_id"],
+                "title": row["title"],
+                "url": row["url"],
+                "snippet": render_snippet(row["snippet"]),
+                "published_at": row["published_at"],
+                "score": row["rank"],
+            }
+            for row in rows
+        ]
+        next_cursor = pagination.next_cursor(rows, limit, lambda row: (row["rank"], row["id"]))
+        return items[:limit], next_cursor
+
+    async def _search_sqlite(
+        self, db: AsyncSession, terms: List[str], doc_type: Optional[str], limit: int, after: Optional[List[Any]]
+    ) -> List[Dict[str, Any]]:
+        # Rank first, then build snippets for the page only: snippet() is the costly part.
+        params: Dict[str, Any] = {"match": fts5_match(terms), "limit": limit}
+        type_join = ""
+        if doc_type:
+            type_join = "JOIN search_documents d ON d.id = ranked.id AND d.doc_type = :doc_type"
+            params["doc_type"] = doc_type
+        keyset = ""
+        if after:
+            keyset = "WHERE (ranked.rank, ranked.id) < (:after_rank, :after_id)"
+            params["after_rank"], params["after_id"] = after
+        ranked = (await db.execute(text(f"""
+            SELECT ranked.id, ranked.rank FROM (
+                SELECT search_documents_fts.rowid AS id, -bm25(search_documents_fts, {_BM25_WEIGHTS}) AS rank
+                FROM search_documents_fts
+                WHERE search_documents_fts MATCH :match
+            ) AS ranked
+            {type_join}
+            {keyset}
+            ORDER BY ranked.rank DESC, ranked.id DESC
+            LIMIT :limit
+        """), params)).all()
+        if not ranked:
+            return []
+        details_stmt = text("""
+            SELECT d.id, d.doc_type, d.doc_id, d.title, d.url, d.published_at,
+                   snippet(search_documents_fts, -1, :hl_start, :hl_end, '…', 16) AS snippet
+            FROM search_documents_fts
+            JOIN search_documents d ON d.id = search_documents_fts.rowid
+            WHERE search_documents_fts MATCH :match AND search_documents_fts.rowid IN :ids
+        """).bindparams(bindparam("ids", expanding=True)).columns(*_RESULT_COLUMNS)
+        details = {
+            row["id"]: row
+            for row in (await db.execute(details_stmt, {
+                "match": params["match"], "ids": [row.id for row in ranked],
+                "hl_start": HIGHLIGHT_START, "hl_end": HIGHLIGHT_END,
+            })).mappings().all()
+        }
+        return [{**details[row.id], "rank": row.rank} for row in ranked if row.id in details]
+
+    async def _search_postgres(
+        self, db: AsyncSession, terms: List[str], doc_type: Optional[str], limit: int, after: Optional[List[Any]]
+    ) -> List[Dict[str, Any]]:
+        # The inner query ranks and pages; ts_headline runs only on the page rows.
+        params: Dict[str, Any] = {"query": tsquery(terms), "limit": limit, "headline_options": _PG_HEADLINE_OPTIONS}
+        type_filter = ""
+        if doc_type:
+            type_filter = "AND doc_type = :doc_type"
+            params["doc_type"] = doc_type
+        keyset = ""
+        if after:
+            keyset = "WHERE (matches.rank, matches.id) < (:after_rank, :after_id)"
+            params["after_rank"], params["after_id"] = after
+        stmt = text(f"""
+            SELECT d.id, d.doc_type, d.doc_id, d.title, d.url, d.published_at,
+                   ts_headline('english', coalesce(nullif(d.body, ''), d.title),
+                               to_tsquery('english', :query), :headline_options) AS snippet,
+                   ranked.rank
+            FROM (
+                SELECT matches.id, matches.rank FROM (
+                    SELECT id, ts_rank_cd(search_vector, to_tsquery('english', :query)) AS rank
+                    FROM search_documents
+                    WHERE search_vector @@ to_tsquery('english', :query) {type_filter}
+                ) AS matches
+                {keyset}
+                ORDER BY matches.rank DESC, matches.id DESC
+                LIMIT :limit
+            ) AS ranked
+            JOIN search_documents d ON d.id = ranked.id
+            ORDER BY ranked.rank DESC, ranked.id DESC
+        """).columns(*_RESULT_COLUMNS, column("rank", Float))
+        return [dict(row) for row in (await db.execute(stmt, params)).mappings().all()]
+
+    async def _upsert(self, db: AsyncSession, docs: List[Dict[str, Any]]) -> None:
+        dialect_insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(self.model).values(docs)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.doc_type, self.model.doc_id],
+            set_={key: stmt.excluded[key] for key in ("title", "tags", "body", "url", "published_at")},
+        )
+        await db.execute(stmt)
+
+
+search_document = CRUDSearchDocument(SearchDocument)
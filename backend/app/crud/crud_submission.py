@@ -0,0 +1,76 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.future import select
+from typing import Any, List, Optional
+from datetime import datetime, timezone
+
+from app.crud.base import CRUDBase, ModelType
+from app.core.urls import normalize_url
+
+ACTIVE_STATUSES = ("pending", "processing")
+
+
+class CRUDSubmission(CRUDBase[ModelType, None, None]):  # Built by the submission services
+    """
+    Submissions analysed in the background (resource links, news). While one is
+    pending or processing, its normalized URL sits in the unique `active_url`
+    column, which reserves the URL for one analysis at a time; finishing frees it.
+    """
+    # Column holding the submitter's user id.
+    owner_column: str
+    # Column holding the id of the row the submission created.
+    result_column: str
+
+    def owner_id(self, submission: ModelType) -> int:
+        return getattr(submission, self.owner_column)
+
+    async def reserve(self, db: AsyncSession, *, url: str, owner_id: int, **values: Any) -> Optional[ModelType]:
+        """
+        Stores a pending submission for `url`. Returns None when the URL is
+        (in any spelling) already being analysed (the unique `active_url`).
+        """
+        submission = self.model(
+            url=url, active_url=normalize_url(url), status="pending", **{self.owner_column: owner_id}, **values
+        )
+        db.add(submission)
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            return None
+        await db.refresh(submission)
+        return submission
+
+    async def get_active_by_url(self, db: AsyncSession, *, url: str) -> Optional[ModelType]:
+        result = await db.execute(select(self.model).where(self.model.active_url == normalize_url(url)))
+        return result.scalars().first()
+
+    async def get_by_status(self, db: AsyncSession, *, statuses: tuple = ACTIVE_STATUSES) -> List[ModelType]:
+        result = await db.execute(
+            select(self.model).where(self.model.status.in_(statuses)).order_by(self.model.created_at)
+        )
+        return result.scalars().all()
+
+    async def mark_processing(self, db: AsyncSession, *, db_obj: ModelType) -> ModelType:
+        db_obj.status = "processing"
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def finish(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        result_id: Optional[Any] = None,
+        error: Optional[str] = None,
+    ) -> ModelType:
+        """Completes the submission with the row it created (or fails it when `error` is set) and frees its URL."""
+        db_obj.status = "failed" if error else "completed"
+        db_obj.error = error
+        setattr(db_obj, self.result_column, result_id)
+        db_obj.active_url = None
+        db_obj.finished_at = datetime.now(timezone.utc)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
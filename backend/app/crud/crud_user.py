@@ -1,11 +1,13 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Optional, Any
+from typing import Optional, Any, List, Tuple
 
+from app.core import pagination
 from app.db.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import get_password_hash, verify_password
 from app.crud.base import CRUDBase
+from app.crud.crud_news_feed import news_feed
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
@@ -25,6 +27,18 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         await db.refresh(db_obj)
         return db_obj
 
+    async def get_page(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[User], Optional[str]]:
+        """Users by ascending id. With a `cursor`, `skip` is ignored."""
+        stmt = select(self.model).order_by(self.model.id).limit(limit + 1)
+        if cursor:
+            stmt = stmt.where(pagination.after((self.model.id,), pagination.decode_cursor(cursor, 1)))
+        else:
+            stmt = stmt.offset(skip)
+        items = (await db.execute(stmt)).scalars().all()
+        return items[:limit], pagination.next_cursor(items, limit, lambda user: (user.id,))
+
     async def authenticate(
         self, db: AsyncSession, *, email: str, password: str
     ) -> Optional[User]:
@@ -63,7 +77,12 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
             
-        return await super().update(db, db_obj=db_obj, obj_in=update_data)
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=update_data, commit=False)
+        if {"full_name", "avatar_path", "website_url"} & update_data.keys():
+            # Submitter display fields are denormalized into the news feed.
+            await news_feed.refresh_submitter(db, user=db_obj)
+        await db.commit()
+        return db_obj
 
 user = CRUDUser(User)
 
@@ -9,9 +9,19 @@ from app.db.models.user import User # noqa
 from app.db.models.item import Item # noqa
 from app.db.models.project import Project  # noqa
 from app.db.models.blog_post import BlogPost # noqa
-from app.db.models.news_item import NewsItem # noqa
+from app.db.models.news_item import NewsItem, NewsItemContent # noqa
 from app.db.models.contact import ContactMessage # noqa
 from app.db.models.resource_link import ResourceLink # noqa
+from app.db.models.ingestion import IngestionRun, IngestionEvent # noqa
+from app.db.models.backfill import BackfillJob # noqa
+from app.db.models.news_feed import NewsFeedEntry # noqa
+from app.db.models.collection_version import CollectionVersion # noqa
+from app.db.models.news_sector import NewsItemSector, SectorCount # noqa
+from app.db.models.search_document import SearchDocument # noqa
+from app.db.models.resource_link_tag import ResourceLinkTag # noqa
+from app.db.models.resource_submission import ResourceSubmission # noqa
+from app.db.models.news_submission import NewsSubmission # noqa
+from app.db.models.idempotency_key import IdempotencyKey # noqa
 
 # Ya NO definimos la clase Base aquí
 # class Base(DeclarativeBase):
@@ -10,6 +10,7 @@ from app.core.config import settings # Import settings
 from app.db import initial_data
 from app.db.models.project import Project # Import the model
 from app.db.models.blog_post import BlogPost # Import BlogPost model
+from app.crud.crud_blog import render_post
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -95,6 +96,7 @@ async def init_db(db: AsyncSession) -> None:
                 
                 try:
                     db_post = BlogPost(**model_data) 
+                    render_post(db_post)
                     posts_to_add.append(db_post)
                 except Exception as e:
                     logger.error(f"Error creating BlogPost model instance for ID {post_id}: {e}", exc_info=True)
@@ -1,8 +1,18 @@
 from .user import User
 from .resource_link import ResourceLink
 from .blog_post import BlogPost
-from .news_item import NewsItem
+from .news_item import NewsItem, NewsItemContent
 from .item import Item
 from .contact import ContactMessage
 from .project import Project
-from .resource_vote import ResourceVote 
\ No newline at end of file
+from .resource_vote import ResourceVote 
+from .ingestion import IngestionRun, IngestionEvent
+from .backfill import BackfillJob
+from .news_feed import NewsFeedEntry
+from .collection_version import CollectionVersion
+from .news_sector import NewsItemSector, SectorCount
+from .search_document import SearchDocument
+from .resource_link_tag import ResourceLinkTag
+from .resource_submission import ResourceSubmission
+from .news_submission import NewsSubmission
+from .idempotency_key import IdempotencyKey
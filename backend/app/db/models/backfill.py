@@ -0,0 +1,60 @@
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from typing import Optional
+from datetime import datetime, timezone
+import uuid
+
+from app.db.base_class import Base
+from app.db.models.news_item import GUID
+
+
+class BackfillJob(Base):
+    """
+    Resumable re-enrichment of existing news items. `last_news_item_id` is the
+    keyset checkpoint: it is committed together with each chunk of updates.
+    """
+    __tablename__ = "backfill_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # pending | running | paused | completed | failed | cancelled
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending", index=True)
+    target_prompt_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    published_since: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    published_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    batch_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    max_items: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    last_news_item_id: Mapped[Optional[uuid.UUID]] = mapped_column(GUID, nullable=True)
+    total_candidates: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    skipped: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_by_user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    @property
+    def progress(self) -> float:
+        if not self.total_candidates:
+            return 1.0 if self.status == "completed" else 0.0
+        return round(min(1.0, self.processed / self.total_candidates), 4)
+
+    @property
+    def items_per_minute(self) -> Optional[float]:
+        if not self.started_at or not self.processed:
+            return None
+        started_at = self.started_at if self.started_at.tzinfo else self.started_at.replace(tzinfo=timezone.utc)
+        end = self.finished_at or datetime.now(timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+        minutes = (end - started_at).total_seconds() / 60
+        return round(self.processed / minutes, 2) if minutes > 0 else None
+
+    def __repr__(self):
+        return f"<BackfillJob(id={self.id}, status='{self.status}', processed={self.processed}/{self.total_candidates})>"
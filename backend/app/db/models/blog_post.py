@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Date
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Date, Index, JSON
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import date
 from uuid import uuid4
 
@@ -9,6 +9,10 @@ from app.db.base_class import Base
 
 class BlogPost(Base):
     __tablename__ = "blog_posts"
+    __table_args__ = (
+        # Serves the (published_date, id) keyset order of the blog list.
+        Index("ix_blog_posts_published_date_id", "published_date", "id"),
+    )
 
     id = Column(String, primary_key=True, index=True, default=lambda: str(uuid4()))
     title = Column(String, index=True, nullable=False)
@@ -23,5 +27,10 @@ class BlogPost(Base):
     linkedin_post_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default='published', index=True)
 
+    # Derived from `content` at write time (crud_blog.render_post), never edited directly.
+    content_html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    toc: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSON, nullable=True)
+    word_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
     author = relationship("User", back_populates="blog_posts")
     # category: Mapped[Optional[str]] = mapped_column(String(100)) 
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy import String, DateTime, BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from datetime import datetime
+
+from app.db.base_class import Base
+
+
+class CollectionVersion(Base):
+    """
+    Write counter per cached collection ("news", "blog", ...). Bumped right after
+    every commit that wrote to the collection's tables; ETags are derived from it.
+    """
+    __tablename__ = "collection_versions"
+
+    namespace: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<CollectionVersion(namespace='{self.namespace}', version={self.version})>"
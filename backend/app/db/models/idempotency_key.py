@@ -0,0 +1,29 @@
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from typing import Optional
+from datetime import datetime
+
+from app.db.base_class import Base
+
+
+class IdempotencyKey(Base):
+    """
+    The stored outcome of a POST sent with an `Idempotency-Key` header, per
+    user. `status_code` is NULL while the first request is still running; a
+    retry with the same key then gets the stored response instead of running
+    the request again. Rows older than IDEMPOTENCY_KEY_TTL_HOURS are purged.
+    """
+    __tablename__ = "idempotency_keys"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # SHA-256 of method, path and body: the same key with another request is refused.
+    request_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    response_body: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    response_headers: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON object
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyKey(user_id={self.user_id}, key='{self.key}', status_code={self.status_code})>"
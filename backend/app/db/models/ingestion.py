@@ -0,0 +1,74 @@
+from sqlalchemy import String, Text, DateTime, Integer, Float, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+from typing import Optional, List
+from datetime import datetime
+
+from app.db.base_class import Base
+
+
+class IngestionRun(Base):
+    """One execution of the news ingestion pipeline, with per-stage wall time totals."""
+    __tablename__ = "ingestion_runs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    trigger: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="running", index=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    articles_fetched: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    articles_processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    articles_stored: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    articles_dropped: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Stage totals in milliseconds
+    fetch_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    extract_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    llm_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    image_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    insert_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    prompt_tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completion_tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Estimated prompt tokens avoided by condensing article text
+    input_tokens_saved: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    events: Mapped[List["IngestionEvent"]] = relationship(
+        "IngestionEvent", back_populates="run", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self):
+        return f"<IngestionRun(id={self.id}, status='{self.status}', stored={self.articles_stored})>"
+
+
+class IngestionEvent(Base):
+    """Outcome of a single article within an ingestion run."""
+    __tablename__ = "ingestion_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey("ingestion_runs.id", ondelete="CASCADE"), nullable=False, index=True)
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    outcome: Mapped[str] = mapped_column(String(20), nullable=False)  # stored | dropped
+    drop_reason: Mapped[Optional[str]] = mapped_column(String(32), nullable=True, index=True)
+    provider: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+
+    extract_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    llm_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    image_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    prompt_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    completion_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    input_tokens_saved: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    relevance_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    credibility_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    run: Mapped["IngestionRun"] = relationship("IngestionRun", back_populates="events")
+
+    def __repr__(self):
+        return f"<IngestionEvent(run_id={self.run_id}, outcome='{self.outcome}', drop_reason='{self.drop_reason}')>"
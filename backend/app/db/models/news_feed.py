@@ -0,0 +1,58 @@
+from sqlalchemy import String, Text, DateTime, Integer, Float, Boolean, JSON, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Optional, List, Dict, Any
+import datetime
+import uuid
+
+from app.db.base_class import Base
+from app.db.models.news_item import GUID
+
+
+class NewsFeedEntry(Base):
+    """
+    Denormalized read model of `news_items` for the news list: card fields,
+    submitter display fields and a stored `promotion_level`, so a page is a
+    single range scan on (publishedAt, id). Kept in sync by `crud.news_feed`.
+    """
+    __tablename__ = "news_feed"
+    __table_args__ = (
+        Index("ix_news_feed_published_at_id", "publishedAt", "id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(GUID, ForeignKey("news_items.id", ondelete="CASCADE"), primary_key=True)
+    title: Mapped[str] = mapped_column(String(512), nullable=False)
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    imageUrl: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
+    sourceName: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    sourceId: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    sectors: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
+    relevance_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    is_community: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    publishedAt: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Submitter display fields (copied from `user`)
+    submitted_by_user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    submitter_full_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    submitter_avatar_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    submitter_website_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+
+    # 0: normal, 1: >3.5, 2: >4.0 + top 20% of the current week
+    promotion_level: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    @property
+    def submitted_by(self) -> Optional[Dict[str, Any]]:
+        """Same shape as `UserPublic`, so `NewsItemRead` can be built from a feed row."""
+        if self.submitted_by_user_id is None:
+            return None
+        return {
+            "id": self.submitted_by_user_id,
+            "full_name": self.submitter_full_name,
+            "avatar_path": self.submitter_avatar_path,
+            "website_url": self.submitter_website_url,
+        }
+
+    def __repr__(self):
+        return f"<NewsFeedEntry(title='{self.title[:50]}...', promotion_level={self.promotion_level})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ARRAY, Float, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ARRAY, Float, Boolean, ForeignKey, Index
 # from sqlalchemy.dialects.sqlite import DATETIME # No es necesario si usamos DateTime(timezone=True)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List, Any # Añadir List y Any
@@ -47,6 +47,10 @@ class GUID(TypeDecorator):
 
 class NewsItem(Base):
     __tablename__ = "news_items"
+    __table_args__ = (
+        # Serves the (updated_at, id) order of the bulk export.
+        Index("ix_news_items_updated_at_id", "updated_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(GUID, primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(512), index=True, nullable=False)
@@ -60,6 +64,10 @@ class NewsItem(Base):
     # Campos enriquecidos por IA
     relevance_rating: Mapped[Optional[int]] = mapped_column(Integer, nullable=True) # Calificación de 1 a 5
     sectors: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
+    # Proveedor que generó el resumen: gemini | mistral | local (pendiente de re-enriquecer)
+    enrichment_source: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True)
+    # Versión del prompt de evaluación con la que se enriqueció (NULL = local o anterior al versionado)
+    prompt_version: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
 
     # Nuevas columnas añadidas
     sourceName: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -80,6 +88,10 @@ class NewsItem(Base):
         foreign_keys=[submitted_by_user_id]
     )
 
+    content: Mapped[Optional["NewsItemContent"]] = relationship(
+        "NewsItemContent", back_populates="news_item", uselist=False, cascade="all, delete-orphan"
+    )
+
     def __repr__(self):
         return f"<NewsItem(title='{self.title[:50]}...', sourceName='{self.sourceName}', publishedAt='{self.publishedAt}')>"
 
@@ -94,4 +106,15 @@ class NewsItem(Base):
     # REMOVE THE FOLLOWING DUPLICATED/OBSOLETE Additional columns:
     # relevance_score: Mapped[Optional[int]] = mapped_column(Integer)
     # time_category: Mapped[Optional[str]] = mapped_column(String)
-    # sectors: Mapped[Optional[dict]] = mapped_column(JSON) 
\ No newline at end of file
+    # sectors: Mapped[Optional[dict]] = mapped_column(JSON) 
+
+
+class NewsItemContent(Base):
+    """Extracted article text, kept so news items can be re-enriched without re-fetching."""
+    __tablename__ = "news_item_contents"
+
+    news_item_id: Mapped[uuid.UUID] = mapped_column(GUID, ForeignKey("news_items.id", ondelete="CASCADE"), primary_key=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    extracted_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    news_item: Mapped["NewsItem"] = relationship("NewsItem", back_populates="content")
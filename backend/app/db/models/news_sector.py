@@ -0,0 +1,39 @@
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+import datetime
+import uuid
+
+from app.db.base_class import Base
+from app.db.models.news_item import GUID
+
+
+class NewsItemSector(Base):
+    """
+    One row per (canonical sector, news item), with the item's `publishedAt`
+    copied in so a sector's newest items are one range scan on
+    ix_news_item_sectors_sector_published. Kept in sync by `crud.news_sector`.
+    """
+    __tablename__ = "news_item_sectors"
+    __table_args__ = (
+        Index("ix_news_item_sectors_sector_published", "sector", "published_at", "news_item_id"),
+    )
+
+    news_item_id: Mapped[uuid.UUID] = mapped_column(
+        GUID, ForeignKey("news_items.id", ondelete="CASCADE"), primary_key=True
+    )
+    sector: Mapped[str] = mapped_column(String(100), primary_key=True)
+    published_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<NewsItemSector(sector='{self.sector}', news_item_id='{self.news_item_id}')>"
+
+
+class SectorCount(Base):
+    """Number of news items per canonical sector, adjusted on every sector index write."""
+    __tablename__ = "sector_counts"
+
+    sector: Mapped[str] = mapped_column(String(100), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
+
+    def __repr__(self):
+        return f"<SectorCount(sector='{self.sector}', count={self.count})>"
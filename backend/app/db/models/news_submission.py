@@ -0,0 +1,40 @@
+from sqlalchemy import String, Text, DateTime, Integer, Boolean, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from typing import Optional
+from datetime import datetime
+import uuid
+
+from app.db.base_class import Base
+from app.db.models.news_item import GUID
+
+
+class NewsSubmission(Base):
+    """
+    A news URL submitted by a user and analysed in the background. Transient
+    failures (unreachable page, no LLM available) are retried automatically up
+    to NEWS_SUBMISSION_MAX_ATTEMPTS times; a failed submission that is
+    `retryable` can also be retried by its author.
+    """
+    __tablename__ = "news_submissions"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    # The normalized URL while the submission is pending or processing, NULL
+    # afterwards: the unique index reserves a URL for one analysis at a time.
+    active_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True, unique=True)
+    # pending | processing | completed | failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending", index=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    retryable: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    next_attempt_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    news_item_id: Mapped[Optional[uuid.UUID]] = mapped_column(GUID, ForeignKey("news_items.id", ondelete="SET NULL"), nullable=True)
+    submitted_by_user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<NewsSubmission(id='{self.id}', status='{self.status}', attempts={self.attempts}, url='{self.url}')>"
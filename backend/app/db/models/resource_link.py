@@ -1,18 +1,32 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer, BigInteger, Index
+from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
 from sqlalchemy.sql import func
 from typing import Optional, List
 import uuid
 from datetime import datetime
 
+from app.core.urls import normalize_url, url_hash
 from app.db.base_class import Base
 
 class ResourceLink(Base):
     __tablename__ = "resource_links"
+    __table_args__ = (
+        # List order, unfiltered and per type (see app.core.resource_ranking).
+        Index("ix_resource_links_rank", "rank_key", "created_at", "id"),
+        Index("ix_resource_links_type_rank", "resource_type", "rank_key", "created_at", "id"),
+        # Serves the (updated_at, id) order of the bulk export.
+        Index("ix_resource_links_updated_at_id", "updated_at", "id"),
+        # Duplicate check on submission (`crud.resource_link.get_by_url`).
+        Index("ix_resource_links_url_hash", "url_hash", unique=True),
+    )
 
     id: Mapped[str] = mapped_column(String(100), primary_key=True, index=True, default=lambda: uuid.uuid4().hex)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    # Set from `url` on every write (see `_set_url_keys`); duplicate submissions are
+    # found through the unique `url_hash`. NULL only for duplicates that predate it.
+    url_normalized: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
+    url_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     ai_generated_description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     personal_note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     resource_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
@@ -24,13 +38,25 @@ class ResourceLink(Base):
     dislikes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now)
+    # Any change, including vote counts; exports filter on it (`updated_since`).
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=func.now(), onupdate=func.now(), nullable=True)
 
     author_id: Mapped[Optional[int]] = mapped_column(ForeignKey("user.id"), nullable=True)
     author: Mapped["User"] = relationship("User", back_populates="resource_links")
 
     is_pinned: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    # Pinned, "new" bucket and likes - dislikes in one sortable value, maintained by `crud.resource_link`.
+    rank_key: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
 
     resource_votes: Mapped[List["ResourceVote"]] = relationship("ResourceVote", back_populates="resource_link", cascade="all, delete-orphan")
 
+    @validates("url")
+    def _set_url_keys(self, key: str, url: str) -> str:
+        if url is not None:
+            url = str(url)
+            self.url_normalized = normalize_url(url)
+            self.url_hash = url_hash(url)
+        return url
+
     def __repr__(self):
         return f"<ResourceLink(title='{self.title}', url='{self.url}')>"
\ No newline at end of file
@@ -0,0 +1,24 @@
+from sqlalchemy import String, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class ResourceLinkTag(Base):
+    """
+    One row per (canonical tag, resource link), derived from the comma-separated
+    `resource_links.tags`. A tag filter is an index range read on
+    ix_resource_link_tags_tag_resource. Kept in sync by `crud.resource_link_tag`.
+    """
+    __tablename__ = "resource_link_tags"
+    __table_args__ = (
+        Index("ix_resource_link_tags_tag_resource", "tag", "resource_link_id"),
+    )
+
+    resource_link_id: Mapped[str] = mapped_column(
+        String(100), ForeignKey("resource_links.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    def __repr__(self):
+        return f"<ResourceLinkTag(tag='{self.tag}', resource_link_id='{self.resource_link_id}')>"
@@ -0,0 +1,39 @@
+from sqlalchemy import String, Text, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from typing import Optional
+from datetime import datetime
+import uuid
+
+from app.db.base_class import Base
+
+
+class ResourceSubmission(Base):
+    """
+    A resource link submitted by a user and analysed in the background. The
+    submit request returns as soon as the row exists; clients poll it until
+    it is completed (with `resource_link_id`) or failed (with `error`).
+    """
+    __tablename__ = "resource_submissions"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    # The normalized URL while the submission is pending or processing, NULL
+    # afterwards: the unique index reserves a URL for one analysis at a time.
+    active_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True, unique=True)
+    title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    personal_note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # pending | processing | completed | failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending", index=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    resource_link_id: Mapped[Optional[str]] = mapped_column(
+        String(100), ForeignKey("resource_links.id", ondelete="SET NULL"), nullable=True
+    )
+    author_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<ResourceSubmission(id='{self.id}', status='{self.status}', url='{self.url}')>"
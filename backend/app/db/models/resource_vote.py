@@ -1,8 +1,9 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, func, UniqueConstraint, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, func, UniqueConstraint, Index, Enum as SQLAlchemyEnum
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.db.base_class import Base
 import enum
 from datetime import datetime
+from typing import Optional
 
 class VoteType(enum.Enum):
     like = "like"
@@ -18,12 +19,16 @@ class ResourceVote(Base):
     vote_type: Mapped[VoteType] = mapped_column(SQLAlchemyEnum(VoteType), nullable=False)
     
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
+    # Changes when the vote is switched (like <-> dislike).
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=func.now(), onupdate=func.now(), nullable=True)
 
     user = relationship("User", back_populates="resource_votes")
     resource_link = relationship("ResourceLink", back_populates="resource_votes")
 
     __table_args__ = (
         UniqueConstraint('user_id', 'resource_link_id', name='_user_resource_uc'),
+        # Serves the (updated_at, id) order of the bulk export.
+        Index('ix_resource_votes_updated_at_id', 'updated_at', 'id'),
     )
 
     def __repr__(self):
@@ -0,0 +1,33 @@
+from sqlalchemy import String, Text, DateTime, Integer, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Optional
+import datetime
+
+from app.db.base_class import Base
+
+
+class SearchDocument(Base):
+    """
+    Denormalized text of every searchable item (news, resources, blog posts).
+    The full-text index over it is dialect-specific and created by
+    `app.core.search.create_search_schema`: an FTS5 table on SQLite, a
+    `search_vector` tsvector column with a GIN index on Postgres. Kept in sync
+    by `crud.search_document`.
+    """
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        Index("ix_search_documents_type_doc_id", "doc_type", "doc_id", unique=True),
+    )
+
+    # Integer key: it is the FTS5 rowid on SQLite.
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    doc_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    doc_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    title: Mapped[str] = mapped_column(String(512), nullable=False)
+    tags: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    body: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
+    published_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<SearchDocument(doc_type='{self.doc_type}', doc_id='{self.doc_id}')>"
@@ -373,7 +373,14 @@ async def seed_data(db: "AsyncSession"):
             if hasattr(initial_data, model_name):
                 data_list = getattr(initial_data, model_name)
                 await sync_model(db, model_name, data_list)
-                
+
+        # Seeded rows are added through the ORM, bypassing the derived-data sync in the CRUD layer.
+        await crud.news_feed.reconcile(db)
+        await crud.news_sector.rebuild(db)
+        await crud.resource_link_tag.rebuild(db)
+        await crud.resource_link.refresh_rank_keys(db)
+        await crud.blog_post.rerender(db, only_missing=False)  # Seeded posts may have new content
+        await crud.search_document.reconcile(db)
         await db.commit()
         logger.info("--- [SEED] Database seeding completed successfully.")
     except ImportError:
@@ -1,10 +1,11 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from collections.abc import AsyncGenerator
 import logging
 
 from app.core.config import settings
+from app.core.response_cache import install_invalidation_hooks
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,9 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Committed writes drop the cached API responses built from the written tables.
+install_invalidation_hooks(Session)
+
 # --- CREACIÓN DE LA SESIÓN SÍNCRONA ---
 SYNC_DATABASE_URL = str(settings.SQLALCHEMY_DATABASE_URI).replace("sqlite+aiosqlite", "sqlite")
 sync_engine = create_engine(
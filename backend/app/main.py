@@ -19,6 +19,7 @@ from fastapi import FastAPI, Depends, APIRouter, Request
 from fastapi.routing import APIRoute
 from starlette.routing import Mount
 from starlette.middleware.cors import CORSMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -38,10 +39,13 @@ logger = logging.getLogger(__name__)
 
 # --- Project Imports ---
 from app.api.main import api_router
+from app.api import idempotency
+from app.api.routes import feeds
 from app.core.config import settings
 from app.db.session import AsyncSessionLocal
 from app.db import seed_db, base  # noqa: F401
 from app.services.aggregated_news_service import fetch_and_store_news
+from app.services import backfill_service, feed_service, news_submission_service, resource_submission_service, youtube_service
 from app.services.blog_automation_service import (
     run_blog_draft_generation as blog_draft_generation_job,
 )
@@ -86,6 +90,45 @@ async def lifespan(app: FastAPI):
         next_run_time=datetime.now(timezone.utc) + timedelta(seconds=30), # Delay start
     )
 
+    # Re-rank the news feed's weekly promotion levels when a new week starts
+    scheduler.add_job(
+        run_news_feed_rerank_job,
+        "cron",
+        day_of_week="mon",
+        hour=0,
+        minute=0,
+        timezone="UTC",
+        id="news_feed_rerank_job",
+        replace_existing=True,
+    )
+
+    # Move resource links out of the "new" ranking bucket once they are a week old
+    scheduler.add_job(
+        run_resource_rank_rollover_job,
+        "interval",
+        hours=1,
+        id="resource_rank_rollover_job",
+        replace_existing=True,
+    )
+
+    # Forget stored Idempotency-Key responses once they are past their TTL
+    scheduler.add_job(
+        run_idempotency_key_purge_job,
+        "interval",
+        hours=1,
+        id="idempotency_key_purge_job",
+        replace_existing=True,
+    )
+
+    # Re-pull the metadata (thumbnails) of stored YouTube resource links, 50 videos per API call
+    scheduler.add_job(
+        run_youtube_refresh_job,
+        "interval",
+        hours=settings.YOUTUBE_REFRESH_INTERVAL_HOURS,
+        id="youtube_refresh_job",
+        replace_existing=True,
+    )
+
     scheduler.start()
     logger.info("APScheduler started with background jobs.")
 
@@ -110,14 +153,35 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error during database synchronization: {e}", exc_info=True)
 
+    # --- RSS/Atom feeds and sitemap: rebuilt after news or blog commits ---
+    feed_service.register()
+    asyncio.create_task(feed_service.regenerate())
+
     # --- Initial Background Tasks ---
     logger.info("Scheduling non-critical background tasks...")
     asyncio.create_task(load_initial_data_background())
+
+    # --- Resume re-enrichment backfills interrupted by a restart ---
+    try:
+        await backfill_service.resume_running_jobs()
+    except Exception as e:
+        logger.error(f"Error resuming backfill jobs: {e}", exc_info=True)
+
+    # --- Re-queue resource and news submissions interrupted by a restart ---
+    try:
+        await resource_submission_service.resume_active_submissions()
+        await news_submission_service.resume_active_submissions()
+    except Exception as e:
+        logger.error(f"Error resuming submissions: {e}", exc_info=True)
     
     yield
     
     logger.info("--- Application Shutting Down ---")
+    await resource_submission_service.analysis_queue.stop()
+    await news_submission_service.cancel_delayed_retries()
+    await news_submission_service.analysis_queue.stop()
     scheduler.shutdown(wait=True)
+    await youtube_service.close()
     logger.info("APScheduler shut down gracefully.")
 
 
@@ -165,11 +229,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 
 # --- API Routers ---
 app.include_router(api_router, prefix=settings.API_V1_STR)
+# Feeds and sitemap live at the site root, where readers and crawlers look for them.
+app.include_router(feeds.router, tags=["feeds"])
 
 
 # --- Root Endpoint ---
@@ -201,6 +268,47 @@ async def run_blog_draft_job():
         except Exception as e:
             logger.error(f"[JOB] Error during scheduled blog draft generation: {e}", exc_info=True)
 
+async def run_news_feed_rerank_job():
+    """Helper function to create a DB session for the weekly news feed re-rank."""
+    logger.info("--- [JOB] Re-ranking news feed promotion levels for the new week... ---")
+    async with AsyncSessionLocal() as session:
+        try:
+            await crud.news_feed.rerank(session)
+            await session.commit()
+        except Exception as e:
+            logger.error(f"[JOB] Error during news feed re-rank: {e}", exc_info=True)
+
+async def run_resource_rank_rollover_job():
+    """Helper function to create a DB session for the resource ranking rollover."""
+    async with AsyncSessionLocal() as session:
+        try:
+            moved = await crud.resource_link.roll_new_bucket(session)
+            await session.commit()
+            if moved:
+                logger.info(f"--- [JOB] {moved} resource links left the 'new' ranking bucket. ---")
+        except Exception as e:
+            logger.error(f"[JOB] Error during resource rank rollover: {e}", exc_info=True)
+
+async def run_idempotency_key_purge_job():
+    """Helper function to create a DB session for purging expired idempotency keys."""
+    async with AsyncSessionLocal() as session:
+        try:
+            purged = await idempotency.purge_expired_keys(session)
+            await session.commit()
+            if purged:
+                logger.info(f"--- [JOB] Purged {purged} expired idempotency keys. ---")
+        except Exception as e:
+            logger.error(f"[JOB] Error during idempotency key purge: {e}", exc_info=True)
+
+async def run_youtube_refresh_job():
+    """Helper function to create a DB session for refreshing stored YouTube resources."""
+    async with AsyncSessionLocal() as session:
+        try:
+            await youtube_service.refresh_stored_videos(session)
+            await session.commit()
+        except Exception as e:
+            logger.error(f"[JOB] Error during YouTube metadata refresh: {e}", exc_info=True)
+
 async def load_initial_data_background():
     """
     A background task to run non-critical startup operations
@@ -215,7 +323,7 @@ async def load_initial_data_background():
             logger.info("Executing one-time background task: fetch_and_store_news...")
             superuser = await crud.user.get_by_email(db=session, email=settings.FIRST_SUPERUSER)
             if superuser:
-                await fetch_and_store_news(db=session, user=superuser)
+                await fetch_and_store_news(db=session, user=superuser, trigger="startup")
             else:
                 logger.error("Could not fetch news on startup: Superuser not found.")
         except Exception as e:
@@ -4,6 +4,7 @@ from datetime import datetime, date
 from enum import Enum
 
 from .user import User
+from app.core.projection import Field as ProjectedField, Projection, column
 
 class BlogPostStatus(str, Enum):
     DRAFT = "draft"
@@ -64,15 +65,70 @@ class BlogPostInDBBase(BlogPostBase):
         from_attributes = True
 
 
+# Entry of a post's table of contents (its h2/h3 headings)
+class TocEntry(BaseModel):
+    level: int
+    id: str # Anchor of the heading in content_html
+    title: str
+
 # Properties returned to client
 class BlogPostRead(BlogPostInDBBase):
     author: Author # Usar el esquema de autor simplificado para la respuesta
+    content_html: Optional[str] = None # Pre-rendered at write time
+    toc: Optional[List[TocEntry]] = None
+    word_count: int = 0
+
+    @computed_field
+    @property
+    def url(self) -> str:
+        return f"/blog/{self.slug}"
+
+# Card of a post in the list: everything but the body
+class BlogPostSummary(BaseModel):
+    title: str
+    excerpt: Optional[str] = None # Generated from the content when not written by hand
+    tags: Optional[str] = None
+    image_url: Optional[HttpUrl | str] = None
+    linkedin_post_url: Optional[HttpUrl | str] = None
+    status: Optional[str] = 'published'
+    id: str
+    author_id: int
+    slug: str
+    published_date: date
+    last_modified_date: Optional[date] = None
+    word_count: int = 0
+    author: Author
 
     @computed_field
     @property
     def url(self) -> str:
         return f"/blog/{self.slug}"
 
+    class Config:
+        from_attributes = True
+
 # Properties to return to client in a list
 class BlogPostList(BaseModel):
-    items: List[BlogPostRead]
\ No newline at end of file
+    items: List[BlogPostSummary]
+    next_cursor: Optional[str] = None
+
+# `BlogPostSummary` as rendered from blog_posts rows, for the list fast path.
+BLOG_POST_PROJECTION = Projection({
+    "title": column("title"),
+    "excerpt": column("excerpt"),
+    "tags": column("tags"),
+    "image_url": column("image_url"),
+    "linkedin_post_url": column("linkedin_post_url"),
+    "status": column("status"),
+    "id": column("id"),
+    "author_id": column("author_id"),
+    "slug": column("slug"),
+    "published_date": column("published_date"),
+    "last_modified_date": column("last_modified_date"),
+    "word_count": ProjectedField(("word_count",), lambda row: row["word_count"] or 0),
+    "author": ProjectedField(
+        ("author_id", "author_full_name"),
+        lambda row: {"id": row["author_id"], "full_name": row["author_full_name"]},
+    ),
+    "url": ProjectedField(("slug",), lambda row: f"/blog/{row['slug']}"),
+})
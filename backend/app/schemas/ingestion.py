@@ -0,0 +1,93 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+from datetime import datetime
+
+
+class IngestionRunRead(BaseModel):
+    id: int
+    trigger: Optional[str] = None
+    status: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    articles_fetched: int = 0
+    articles_processed: int = 0
+    articles_stored: int = 0
+    articles_dropped: int = 0
+    fetch_ms: int = 0
+    extract_ms: int = 0
+    llm_ms: int = 0
+    image_ms: int = 0
+    insert_ms: int = 0
+    total_ms: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    input_tokens_saved: int = 0
+    error: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class IngestionStageStats(BaseModel):
+    stage: str
+    total_ms: int
+    avg_ms_per_run: float
+    share: float  # Fraction of the summed stage time
+
+
+class IngestionProviderStats(BaseModel):
+    articles: int
+    prompt_tokens: int
+    completion_tokens: int
+    input_tokens_saved: int
+    avg_llm_ms: float
+
+
+class IngestionStats(BaseModel):
+    since: datetime
+    runs: int
+    articles_fetched: int
+    articles_processed: int
+    articles_stored: int
+    articles_dropped: int
+    total_ms: int
+    prompt_tokens: int
+    completion_tokens: int
+    input_tokens_saved: int
+    stages: List[IngestionStageStats]
+    avg_article_ms: Dict[str, float]
+    drop_reasons: Dict[str, int]
+    providers: Dict[str, IngestionProviderStats]
+
+
+class BackfillJobCreate(BaseModel):
+    # Defaults to the current PROMPT_VERSION: re-enrich everything evaluated with an older prompt.
+    target_prompt_version: Optional[int] = Field(None, ge=1)
+    published_since: Optional[datetime] = None
+    published_until: Optional[datetime] = None
+    batch_size: Optional[int] = Field(None, ge=1, le=200)
+    max_items: Optional[int] = Field(None, ge=1)
+
+
+class BackfillJobRead(BaseModel):
+    id: int
+    status: str
+    target_prompt_version: int
+    published_since: Optional[datetime] = None
+    published_until: Optional[datetime] = None
+    batch_size: int
+    max_items: Optional[int] = None
+    total_candidates: int
+    processed: int
+    updated: int
+    skipped: int
+    failed: int
+    progress: float
+    items_per_minute: Optional[float] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,9 +1,10 @@
 from pydantic import BaseModel, HttpUrl, Field, field_validator
-from typing import Optional, List, Union
+from typing import Literal, Optional, List, Union
 from datetime import datetime
 import uuid
 import json
 from .user import UserPublic
+from app.core.projection import Field as ProjectedField, Projection, avatar_url, column, constant, http_url
 
 # Schema base para compartir atributos comunes
 class NewsItemBase(BaseModel):
@@ -18,6 +19,8 @@ class NewsItemBase(BaseModel):
     is_community: Optional[bool] = False
     relevance_rating: Optional[float] = Field(None, ge=0.0, le=5.0) # Calificación 0.0-5.0
     submitted_by_user_id: Optional[int] = None
+    enrichment_source: Optional[str] = None # gemini | mistral | local
+    prompt_version: Optional[int] = None
 
 # Schema para la subida de una noticia por parte de un usuario (solo URL)
 class NewsItemSubmit(BaseModel):
@@ -80,4 +83,64 @@ class NewsItem(NewsItemBase):
     submitted_by: Optional[UserPublic] = None 
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+# Estado de una noticia enviada por la comunidad, analizada en segundo plano
+class NewsSubmissionRead(BaseModel):
+    id: str
+    url: str
+    status: Literal["pending", "processing", "completed", "failed"]
+    attempts: int
+    error: Optional[str] = None # Last failure, shown to the user
+    retryable: bool = False # A failed submission that POST .../retry may revive
+    next_attempt_at: Optional[datetime] = None
+    news_item_id: Optional[uuid.UUID] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    news_item: Optional[NewsItemRead] = None # The created news item, once completed
+
+    class Config:
+        from_attributes = True
+
+
+def _sectors(row) -> Optional[List[str]]:
+    return NewsItemRead.parse_sectors_from_json_string(row["sectors"])
+
+
+def _submitted_by(row) -> Optional[dict]:
+    if row["submitted_by_user_id"] is None:
+        return None
+    return {
+        "id": row["submitted_by_user_id"],
+        "full_name": row["submitter_full_name"],
+        "avatar_path": row["submitter_avatar_path"],
+        "website_url": row["submitter_website_url"],
+        "avatar_url": avatar_url(row["submitter_avatar_path"]),
+    }
+
+
+# `NewsItemRead` as rendered from news_feed rows, for the list fast path.
+NEWS_FEED_PROJECTION = Projection({
+    "title": column("title"),
+    "url": http_url("url"),
+    "description": column("description"),
+    "imageUrl": http_url("imageUrl"),
+    "sectors": ProjectedField(("sectors",), _sectors),
+    "publishedAt": column("publishedAt"),
+    "sourceName": column("sourceName"),
+    "sourceId": column("sourceId"),
+    "is_community": column("is_community"),
+    "relevance_rating": column("relevance_rating"),
+    "submitted_by_user_id": column("submitted_by_user_id"),
+    "enrichment_source": constant(None),  # Not copied to the feed
+    "prompt_version": constant(None),
+    "id": column("id"),
+    "created_at": column("created_at"),
+    "updated_at": column("updated_at"),
+    "submitted_by": ProjectedField(
+        ("submitted_by_user_id", "submitter_full_name", "submitter_avatar_path", "submitter_website_url"),
+        _submitted_by,
+    ),
+    "promotion_level": column("promotion_level"),
+})
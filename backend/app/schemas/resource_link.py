@@ -1,8 +1,10 @@
 from pydantic import BaseModel, HttpUrl, Field, computed_field
-from typing import Optional, Any
+from typing import Optional, Any, Literal
 from datetime import datetime
 import uuid # Para el default_factory del ID en el schema si es necesario
 
+from app.core.projection import Field as ProjectedField, Projection, column
+
 # Shared properties
 class ResourceLinkBase(BaseModel):
     title: Optional[str] = None
@@ -56,6 +58,44 @@ class ResourceLinkRead(ResourceLinkInDBBase):
 # class ResourceLinkInDB(ResourceLinkInDBBase):
 #     pass 
 
+# `ResourceLinkRead` as rendered from resource_links rows, for the list fast path.
+RESOURCE_LINK_PROJECTION = Projection({
+    "title": column("title"),
+    "url": column("url"),
+    "ai_generated_description": column("ai_generated_description"),
+    "personal_note": column("personal_note"),
+    "resource_type": column("resource_type"),
+    "tags": column("tags"),
+    "thumbnail_url": column("thumbnail_url"),
+    "star_rating": ProjectedField(("star_rating",), lambda row: None if row["star_rating"] is None else float(row["star_rating"])),
+    "id": column("id"),
+    "created_at": column("created_at"),
+    "author_id": column("author_id"),
+    "is_pinned": ProjectedField(("is_pinned",), lambda row: bool(row["is_pinned"])),
+    "likes": ProjectedField(("likes",), lambda row: row["likes"] or 0),
+    "dislikes": ProjectedField(("dislikes",), lambda row: row["dislikes"] or 0),
+    "author_name": column("author_full_name"),
+})
+
+class ResourceTagCount(BaseModel):
+    tag: str # Canonical (lowercase) tag, usable as-is in the `tags` filter
+    count: int
+
 class ResourceLinkVoteResponse(BaseModel):
     message: str
-    resource: Optional[ResourceLinkRead] = None
\ No newline at end of file
+    likes: int
+    dislikes: int
+    user_vote: Literal["like", "dislike"]
+class ResourceSubmissionRead(BaseModel):
+    id: str
+    url: str
+    status: Literal["pending", "processing", "completed", "failed"]
+    error: Optional[str] = None # Why the submission was rejected, for the user
+    resource_link_id: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    resource: Optional[ResourceLinkRead] = None # The created resource link, once completed
+
+    class Config:
+        from_attributes = True
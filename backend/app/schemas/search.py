@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+from datetime import datetime
+
+
+class SearchResult(BaseModel):
+    type: Literal["news", "resource", "blog"]
+    id: str
+    title: str
+    url: Optional[str] = None  # Blog posts carry their slug
+    snippet: Optional[str] = None  # HTML-escaped, matches wrapped in <mark>
+    published_at: Optional[datetime] = None
+    score: float
+
+
+class SearchResults(BaseModel):
+    items: List[SearchResult]
+    next_cursor: Optional[str] = None
@@ -12,6 +12,7 @@ from sqlalchemy import JSON
 from app.core.config import settings
 from app.db.session import AsyncSessionLocal, async_engine # Added async_engine for potential direct use if needed
 from app.db.models.news_item import NewsItem # Import NewsItem model
+from app import crud
 from app.db.base import Base # To create tables if script is run standalone for the first time (optional)
 
 # Configure logging
@@ -126,6 +127,7 @@ async def auto_tag_news_sectors(db: AsyncSession, limit: Optional[int] = None):
     
     processed_count = 0
     updated_count = 0
+    changed_ids = [] # Items whose sectors changed since the last commit; their feed rows and sector index are re-synced
 
     for news_item in news_items_to_process:
         logger.info(f"Processing news ID: {news_item.id}, Title: {news_item.title}")
@@ -140,6 +142,7 @@ async def auto_tag_news_sectors(db: AsyncSession, limit: Optional[int] = None):
         if sectors: # Only update if Gemini returns something
             news_item.sectors = sectors
             db.add(news_item)
+            changed_ids.append(news_item.id)
             updated_count += 1
             logger.info(f"News ID: {news_item.id} updated with sectors: {sectors}")
         else:
@@ -163,6 +166,9 @@ async def auto_tag_news_sectors(db: AsyncSession, limit: Optional[int] = None):
         processed_count += 1
         if processed_count % 20 == 0: # Commit every 20 news items
             logger.info(f"Processed {processed_count} news items. Committing partial changes...")
+            await db.flush()
+            await crud.news_item.refresh_derived(db, ids=changed_ids)
+            changed_ids = []
             await db.commit()
             logger.info("Partial commit done.")
 
@@ -173,6 +179,8 @@ async def auto_tag_news_sectors(db: AsyncSession, limit: Optional[int] = None):
 
     if processed_count > 0 : # Final commit if anything was processed
         logger.info("Process finished. Making final commit...")
+        await db.flush()
+        await crud.news_item.refresh_derived(db, ids=changed_ids)
         await db.commit()
         logger.info(f"Final commit done. Total news processed: {processed_count}. Total news updated with new sectors: {updated_count}.")
     else:
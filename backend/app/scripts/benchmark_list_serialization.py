@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+# --- Adjust path to allow app imports ---
+# This allows the script to be run from the project root.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from typing import List
+
+from app import crud
+from app.core.projection import dump_json, response_adapter
+from app.db.session import AsyncSessionLocal
+from app.schemas.blog import BlogPostList, BLOG_POST_PROJECTION
+from app.schemas.news import NewsItemRead, NEWS_FEED_PROJECTION
+from app.schemas.resource_link import ResourceLinkRead, RESOURCE_LINK_PROJECTION
+
+# --- Logging Configuration ---
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+async def _entities_news(db, limit):
+    items, _ = await crud.news_feed.get_page(db, limit=limit)
+    adapter = response_adapter(List[NewsItemRead])
+    return adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+
+
+async def _rows_news(db, limit, fields=None):
+    rows, _ = await crud.news_feed.get_page_rows(db, columns=NEWS_FEED_PROJECTION.columns(fields), limit=limit)
+    return dump_json(NEWS_FEED_PROJECTION.render(rows, fields))
+
+
+async def _entities_resources(db, limit):
+    items, _ = await crud.resource_link.get_page(db, limit=limit)
+    adapter = response_adapter(List[ResourceLinkRead])
+    return adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+
+
+async def _rows_resources(db, limit, fields=None):
+    rows, _ = await crud.resource_link.get_page_rows(db, columns=RESOURCE_LINK_PROJECTION.columns(fields), limit=limit)
+    return dump_json(RESOURCE_LINK_PROJECTION.render(rows, fields))
+
+
+async def _entities_blog(db, limit):
+    items, next_cursor = await crud.blog_post.get_page(db, limit=limit)
+    adapter = response_adapter(BlogPostList)
+    return adapter.dump_json(adapter.validate_python({"items": items, "next_cursor": next_cursor}, from_attributes=True))
+
+
+async def _rows_blog(db, limit, fields=None):
+    rows, next_cursor = await crud.blog_post.get_page_rows(db, columns=BLOG_POST_PROJECTION.columns(fields), limit=limit)
+    return dump_json({"items": BLOG_POST_PROJECTION.render(rows, fields), "next_cursor": next_cursor})
+
+
+CASES = [
+    ("news", "entities + response_model", _entities_news),
+    ("news", "projection + orjson", _rows_news),
+    ("news", "projection, fields=id,title,url,publishedAt", lambda db, limit: _rows_news(db, limit, ("title", "url", "publishedAt", "id"))),
+    ("resources", "entities + response_model", _entities_resources),
+    ("resources", "projection + orjson", _rows_resources),
+    ("resources", "projection, fields=id,title,url", lambda db, limit: _rows_resources(db, limit, ("title", "url", "id"))),
+    ("blog", "entities + response_model", _entities_blog),
+    ("blog", "projection + orjson", _rows_blog),
+    ("blog", "projection, fields=id,title,slug,excerpt", lambda db, limit: _rows_blog(db, limit, ("title", "excerpt", "id", "slug"))),
+]
+
+
+async def run_benchmark(iterations: int, limit: int):
+    """
+    Builds each list response `iterations` times, the old way (ORM entities
+    validated through the response model) and through the column projections,
+    and reports CPU time per request. Read-only: runs against the configured DB.
+    """
+    logger.info(f"--- [START] List serialization benchmark: {iterations} requests of {limit} items per case ---")
+    async with AsyncSessionLocal() as db:
+        for collection, label, build in CASES:
+            body = await build(db, limit)  # Warm-up (adapters, statement caches)
+            db.expunge_all()
+            cpu_start, wall_start = time.process_time(), time.perf_counter()
+            for _ in range(iterations):
+                await build(db, limit)
+                db.expunge_all()  # Like a fresh request session: no identity-map reuse
+            cpu_ms = (time.process_time() - cpu_start) * 1000 / iterations
+            wall_ms = (time.perf_counter() - wall_start) * 1000 / iterations
+            logger.info(
+                f"{collection:<10} {label:<45} cpu {cpu_ms:7.2f} ms/req  wall {wall_ms:7.2f} ms/req  body {len(body):>8} bytes"
+            )
+    logger.info("--- [END] Benchmark finished. ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark list endpoint serialization paths.")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.iterations, args.limit))
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import os
+import sys
+import uuid
+from datetime import timedelta
+
+# --- Adjust path to allow app imports ---
+# This allows the script to be run from the project root.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import delete
+
+from app.api.main import api_router
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.models.user import User
+from app.db.session import AsyncSessionLocal
+
+# --- Logging Configuration ---
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+EMAIL_DOMAIN = "admin-check.invalid"
+
+# Superuser-only GET routes: a superuser gets 200, a regular user 403.
+ADMIN_ROUTES = [
+    "/ingestion/stats",
+    "/ingestion/runs",
+    "/ingestion/backfills",
+    "/exports/news",
+    "/exports/resources?format=csv",
+    "/exports/votes",
+]
+
+
+async def run_check() -> bool:
+    """
+    Calls every route in ADMIN_ROUTES in-process, once as a temporary superuser
+    and once as a temporary regular user, and checks the status codes. The
+    temporary users are removed afterwards.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as db:
+        admin = User(email=f"{run_id}-admin@{EMAIL_DOMAIN}", hashed_password="!", full_name="Admin check", is_superuser=True, is_active=True)
+        regular = User(email=f"{run_id}-user@{EMAIL_DOMAIN}", hashed_password="!", full_name="User check", is_superuser=False, is_active=True)
+        db.add_all([admin, regular])
+        await db.commit()
+        user_ids = [admin.id, regular.id]
+        tokens = {
+            200: create_access_token(admin.id, expires_delta=timedelta(minutes=5)),
+            403: create_access_token(regular.id, expires_delta=timedelta(minutes=5)),
+        }
+
+    app = FastAPI()
+    app.include_router(api_router, prefix=settings.API_V1_STR)
+    ok = True
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://check") as client:
+            for path in ADMIN_ROUTES:
+                for expected, token in tokens.items():
+                    response = await client.get(f"{settings.API_V1_STR}{path}", headers={"Authorization": f"Bearer {token}"})
+                    passed = response.status_code == expected
+                    ok = ok and passed
+                    logger.info(f"GET {path} as {'superuser' if expected == 200 else 'regular user'}: {response.status_code} ({'OK' if passed else f'expected {expected}'})")
+        return ok
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(User).where(User.id.in_(user_ids)))
+            await db.commit()
+        logger.info("--- [END] Temporary users removed. ---")
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(run_check()) else 1)
@@ -7,6 +7,7 @@ import os
 
 from app.db.session import AsyncSessionLocal
 from app.db.models.blog_post import BlogPost
+from app.crud.crud_blog import render_post
 from app.db.models.user import User
 
 CSV_PATH = os.path.join(os.path.dirname(__file__), "blog_posts.csv")
@@ -49,6 +50,7 @@ async def import_posts():
                     author_id=AUTHOR_ID,
                     published_date=datetime.strptime(published_date, "%Y-%m-%d").date() if published_date else None
                 )
+                render_post(post)
                 session.add(post)
             await session.commit()
             print("Importación completada.")
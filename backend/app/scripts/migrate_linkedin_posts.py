@@ -14,7 +14,7 @@ from app.db.session import AsyncSessionLocal, async_engine
 from app.db.models.user import User
 from app.db.models.blog_post import BlogPost # Needed to check for existing slugs
 from app.schemas.blog import BlogPostCreate
-from app.crud.crud_blog import create_blog_post, get_blog_post_by_slug, slugify # Import slugify
+from app.crud.crud_blog import create_blog_post, get_blog_post_by_slug, slugify, render_post # Import slugify
 
 # Data extracted from frontend/src/lib/linkedin-posts-data.ts
 raw_linkedin_posts: List[Dict[str, Any]] = [
@@ -226,6 +226,7 @@ async def main():
                 published_date=published_dt_obj # Use the publication date from the original post
                 # last_modified_date will be updated automatically if configured in the model
             )
+            render_post(db_blog_post)
             
             db.add(db_blog_post)
             await db.commit()
@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+# --- Adjust path to allow app imports ---
+# This allows the script to be run from the project root.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from sqlalchemy import delete, func, select
+
+from app import crud
+from app.crud.crud_resource_vote import VoteLimitError
+from app.db.models.resource_link import ResourceLink
+from app.db.models.resource_vote import ResourceVote, VoteType
+from app.db.models.user import User
+from app.db.session import AsyncSessionLocal
+
+# --- Logging Configuration ---
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+EMAIL_DOMAIN = "vote-stress.invalid"
+
+
+async def _vote(user_id: int, resource_id: str, vote_type: VoteType) -> str:
+    """One vote in its own session, like one HTTP request. Returns the outcome."""
+    async with AsyncSessionLocal() as db:
+        try:
+            await crud.resource_vote.vote_on_resource(db, user_id=user_id, resource_id=resource_id, vote_type=vote_type)
+            return "ok"
+        except VoteLimitError:
+            return "limited"
+        except PermissionError:
+            return "rejected"
+
+
+async def run_stress_test(users: int, switchers: int) -> bool:
+    """
+    Hammers one temporary resource link with concurrent votes: every user likes
+    it twice at once (a double click), then `switchers` of them switch to
+    dislike, also twice at once. Checks that exactly one request of each pair
+    counted and that the stored counters match the vote rows. The temporary
+    users and link are removed afterwards.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as db:
+        user_rows = [
+            User(email=f"{run_id}-{i}@{EMAIL_DOMAIN}", hashed_password="!", full_name=f"Vote stress {i}")
+            for i in range(users)
+        ]
+        resource = ResourceLink(
+            title=f"Vote stress {run_id}", url=f"https://{EMAIL_DOMAIN}/{run_id}", created_at=datetime.now(timezone.utc)
+        )
+        db.add_all([*user_rows, resource])
+        await db.commit()
+        user_ids = [user.id for user in user_rows]
+        resource_id = resource.id
+
+    try:
+        logger.info(f"--- [START] {users} users liking resource {resource_id} twice each, concurrently ---")
+        outcomes = Counter(await asyncio.gather(
+            *(_vote(user_id, resource_id, VoteType.like) for user_id in user_ids for _ in range(2))
+        ))
+        logger.info(f"Likes: {dict(outcomes)}")
+        switch_outcomes = Counter(await asyncio.gather(
+            *(_vote(user_id, resource_id, VoteType.dislike) for user_id in user_ids[:switchers] for _ in range(2))
+        ))
+        logger.info(f"Switches to dislike: {dict(switch_outcomes)}")
+
+        async with AsyncSessionLocal() as db:
+            likes, dislikes = (await db.execute(
+                select(ResourceLink.likes, ResourceLink.dislikes).where(ResourceLink.id == resource_id)
+            )).one()
+            votes = dict((await db.execute(
+                select(ResourceVote.vote_type, func.count())
+                .where(ResourceVote.resource_link_id == resource_id)
+                .group_by(ResourceVote.vote_type)
+            )).all())
+        expected = (users - switchers, switchers)
+        stored_votes = (votes.get(VoteType.like, 0), votes.get(VoteType.dislike, 0))
+        ok = (likes, dislikes) == stored_votes == expected and outcomes["ok"] == users and switch_outcomes["ok"] == switchers
+        logger.info(f"Counters {likes}/{dislikes}, vote rows {stored_votes[0]}/{stored_votes[1]}, expected {expected[0]}/{expected[1]}: {'OK' if ok else 'MISMATCH'}")
+        return ok
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(ResourceVote).where(ResourceVote.resource_link_id == resource_id))
+            await db.execute(delete(ResourceLink).where(ResourceLink.id == resource_id))
+            await db.execute(delete(User).where(User.id.in_(user_ids)))
+            await db.commit()
+        logger.info("--- [END] Temporary users and resource removed. ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent vote stress test on one resource link.")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--switchers", type=int, default=10, help="Users that switch their like to a dislike (keep below half to avoid auto-delete)")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(run_stress_test(args.users, args.switchers)) else 1)
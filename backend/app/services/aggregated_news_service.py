@@ -8,13 +8,15 @@ import json
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from tenacity import RetryError
-from sqlalchemy.exc import IntegrityError
 
 from app.core.config import settings
 from app.crud.crud_news import news_item as news
 from app.db.models.user import User
 from app.schemas.news import NewsItemCreate
-from app.services.gemini_service import GeminiService
+from app.services.gemini_service import GeminiService, llm_providers_available
+from app.services.local_enrichment_service import enrich_locally
+from app.services.news_persistence_service import NewsItemBatchWriter
+from app.services.ingestion_metrics_service import ArticleTrace, DropReason, IngestionRecorder
 from app.utils import is_valid_url, parse_datetime_flexible, is_valid_image_url
 
 logging.basicConfig(level=logging.INFO)
@@ -128,14 +130,15 @@ async def _fetch_from_hacker_news(client: httpx.AsyncClient, queries: List[str])
     return []
 
 async def _process_and_store_article(
-    db: AsyncSession, 
     article: Dict[str, Any], 
-    user: User,
-    gemini_service: GeminiService
+    gemini_service: GeminiService,
+    writer: NewsItemBatchWriter,
+    trace: ArticleTrace
 ):
     """
     Processes a single article, enriches it with AI, filters it based on quality gates,
-    and stores it in the database if it passes.
+    and hands it to the batch writer if it passes. The outcome and stage timings are
+    recorded on `trace`.
     """
     url = article.get("url")
     title = article.get("title")
@@ -145,27 +148,41 @@ async def _process_and_store_article(
     # 1. PRE-FILTERING: Basic data validation
     if not all([url, title, source_name]) or not is_valid_url(url) or title == "[Removed]":
         logger.debug(f"Skipping article with missing essential data or invalid URL: {title}")
+        trace.drop(DropReason.INVALID)
         return
 
     try:
         # 2. ENRICHMENT: Get content and then analyze it
-        content = await gemini_service.get_content_from_url(url=url)
+        with trace.stage("extract"):
+            content = await gemini_service.get_content_from_url(url=url)
         if not content:
             logger.warning(f"Could not get content for article: {title}. Skipping.")
+            trace.drop(DropReason.NO_CONTENT)
             return
 
-        enriched_data = await gemini_service.evaluate_and_summarize_content(
-            title=title,
-            content=content
-        )
+        with trace.stage("llm"):
+            enriched_data = None
+            if llm_providers_available():
+                enriched_data = await gemini_service.evaluate_and_summarize_content(
+                    title=title,
+                    content=content
+                )
+            # Degraded mode: no quota left on any provider, summarize locally and re-enrich later.
+            if not enriched_data and settings.LOCAL_ENRICHMENT_FALLBACK:
+                enriched_data = enrich_locally(title, content)
+                if enriched_data:
+                    logger.info(f"Enriched article locally (no LLM available): '{title}'")
 
         if not enriched_data:
             logger.warning(f"Could not generate details for article: {title}")
+            trace.drop(DropReason.LLM_FAILED)
             return
+        trace.record_analysis(enriched_data)
             
         # --- Validation Step ---
         if not enriched_data.get("summary"):
             logger.warning(f"Skipping article due to missing summary: '{title}'")
+            trace.drop(DropReason.MISSING_SUMMARY)
             return
 
         # 3. POST-FILTERING: AI-based quality gates
@@ -175,31 +192,38 @@ async def _process_and_store_article(
         # New Filter: Check if Gemini thinks it's related
         if not is_related:
             logger.info(f"Skipping article not related to AI/Tech: '{title}'")
+            trace.drop(DropReason.NOT_TECH)
             return
 
         # New Filter: Check Gemini's rating
         if relevance_rating < 2.5:
             logger.info(f"Skipping article with low relevance rating ({relevance_rating}/5): '{title}'")
+            trace.drop(DropReason.LOW_RELEVANCE)
             return
         
         # New Filter: Check credibility score to avoid "fake news" or low-quality content
         credibility_score = enriched_data.get("credibility_score", 5.0) # Default to high credibility if key is missing
         if credibility_score < 2.5:
             logger.info(f"Skipping article with low credibility score ({credibility_score}/5): '{title}'")
+            trace.drop(DropReason.LOW_CREDIBILITY)
             return
 
         # 4. DATA PREPARATION & IMAGE VALIDATION
         final_image_url = enriched_data.get("thumbnail_url_suggestion") or image_url_raw
 
         # --- Image Validation Step ---
-        if final_image_url and not await is_valid_image_url(final_image_url):
-            logger.info(f"Skipping article due to invalid or too small image: {title} ({final_image_url})")
-            final_image_url = None # Set to None if invalid
+        if final_image_url:
+            with trace.stage("image"):
+                image_ok = await is_valid_image_url(final_image_url)
+            if not image_ok:
+                logger.info(f"Skipping article due to invalid or too small image: {title} ({final_image_url})")
+                final_image_url = None # Set to None if invalid
         
         published_at_str = article.get("publishedAt")
         published_at_dt = parse_datetime_flexible(published_at_str)
         if not published_at_dt:
             logger.warning(f"Could not parse date {published_at_str} for article {title}. Skipping.")
+            trace.drop(DropReason.BAD_DATE)
             return
 
         news_item_data = NewsItemCreate(
@@ -213,50 +237,58 @@ async def _process_and_store_article(
             sectors=enriched_data.get("tags", []),
             is_community=False,
             relevance_rating=relevance_rating,
-            submitted_by_user_id=None # These are automated, not from a user
+            submitted_by_user_id=None, # These are automated, not from a user
+            enrichment_source=enriched_data.get("provider"),
+            prompt_version=enriched_data.get("prompt_version")
         )
 
-        await news.create(
-            db, 
-            obj_in=news_item_data
-        )
-        logger.info(f"Successfully stored article: {title}")
+        # The stored URL is the normalized one, so the trace must match it.
+        trace.url = str(news_item_data.url)
+        trace.accepted = True
+        await writer.add(news_item_data, content=content)
+        logger.info(f"Accepted article for storage: {title}")
 
-    except IntegrityError:
-        logger.info(f"Article '{title}' with URL '{url}' already exists. Skipping.")
-        await db.rollback() # Rollback the failed transaction
     except ValueError as e:
         logger.warning(f"Skipping article '{title}' due to validation error: {e}")
+        trace.drop(DropReason.INVALID)
     except RetryError as e:
         logger.error(f"API Error after retries for article '{title}': {e}")
+        trace.drop(DropReason.LLM_FAILED)
     except Exception as e:
         logger.error(f"Unexpected error processing article '{title}': {e}", exc_info=True)
+        trace.drop(DropReason.ERROR)
 
 
-async def fetch_and_store_news(db: AsyncSession, user: User):
+async def fetch_and_store_news(db: AsyncSession, user: User, trigger: str = "scheduled"):
     """
     Fetches news from various sources, processes them sequentially, and stores them in the database.
+    Each run is recorded in the ingestion ledger (`ingestion_runs` / `ingestion_events`).
     """
     queries = [
         "artificial intelligence", "machine learning", "large language models",
         "AI ethics", "robotics", "neural networks"
     ]
+
+    recorder = IngestionRecorder(trigger=trigger)
+    await recorder.start(db)
     
     all_articles = []
-    async with httpx.AsyncClient(headers=BROWSER_HEADERS, timeout=30.0, follow_redirects=True) as client:
-        fetch_tasks = [
-            # _fetch_from_gnews(client, queries), # Temporarily disabled due to 403 Forbidden error
-            _fetch_from_event_registry(client, queries),
-            _fetch_from_hacker_news(client, queries),
-        ]
-        
-        results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, list):
-                all_articles.extend(result)
-            elif isinstance(result, Exception):
-                logger.error(f"An API call failed during fetch: {result}", exc_info=True)
+    with recorder.stage("fetch"):
+        async with httpx.AsyncClient(headers=BROWSER_HEADERS, timeout=30.0, follow_redirects=True) as client:
+            fetch_tasks = [
+                # _fetch_from_gnews(client, queries), # Temporarily disabled due to 403 Forbidden error
+                _fetch_from_event_registry(client, queries),
+                _fetch_from_hacker_news(client, queries),
+            ]
+            
+            results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+            
+            for result in results:
+                if isinstance(result, list):
+                    all_articles.extend(result)
+                elif isinstance(result, Exception):
+                    logger.error(f"An API call failed during fetch: {result}", exc_info=True)
+    recorder.articles_fetched = len(all_articles)
 
     # --- Deduplication on fetched articles before processing ---
     # To handle cases where different sources return the same article in one batch
@@ -268,7 +300,14 @@ async def fetch_and_store_news(db: AsyncSession, user: User):
             unique_articles_in_batch.append(article)
             seen_urls_in_batch.add(url)
     
-    logger.info(f"Total articles fetched: {len(all_articles)}. Processing {len(unique_articles_in_batch)} unique articles from this batch.")
+    # --- Skip URLs that are already stored, before any extraction or LLM work ---
+    existing_urls = await news.get_existing_urls(db, urls=seen_urls_in_batch)
+    if existing_urls:
+        for url in existing_urls:
+            recorder.start_article(url).drop(DropReason.DUPLICATE)
+        unique_articles_in_batch = [a for a in unique_articles_in_batch if a.get("url") not in existing_urls]
+
+    logger.info(f"Total articles fetched: {len(all_articles)}. Processing {len(unique_articles_in_batch)} unique articles from this batch ({len(existing_urls)} already stored).")
     
     # --- Sequential Processing ---
     # Instantiate the Gemini service once for the whole batch
@@ -276,20 +315,31 @@ async def fetch_and_store_news(db: AsyncSession, user: User):
         gemini_service = GeminiService()
     except ValueError as e:
         logger.error(f"Could not initialize Gemini Service, aborting news fetch: {e}")
+        await recorder.finish(db, inserted_urls=set(), status="failed", error=str(e))
         return
 
+    writer = NewsItemBatchWriter(db)
     processed_count = 0
     for i, article in enumerate(unique_articles_in_batch, 1):
+        trace = recorder.start_article(article.get("url"))
         try:
             # We now pass the service instance to the processing function
-            await _process_and_store_article(db, article, user, gemini_service)
+            await _process_and_store_article(article, gemini_service, writer, trace)
             processed_count += 1
         except Exception as e:
             logger.error(f"Failed to process article {article.get('title')}: {e}", exc_info=True)
+            trace.drop(DropReason.ERROR)
         
-        # Avoid hitting API rate limits too quickly
-        if i % 5 == 0:
+        # Avoid hitting API rate limits too quickly (no pause needed when enriching locally)
+        if i % 5 == 0 and llm_providers_available():
             logger.info(f"Processed article {i}/{len(unique_articles_in_batch)}. Waiting 5 seconds...")
             await asyncio.sleep(5)
 
-    logger.info(f"News fetching and storing process completed. Stored {processed_count} new articles.")
+    await writer.flush()
+    recorder.add_time("insert", writer.elapsed_ms)
+    await recorder.finish(db, inserted_urls=writer.inserted_urls, failed_urls=writer.failed_urls)
+
+    logger.info(
+        f"News fetching and storing process completed. Processed {processed_count} articles: "
+        f"{writer.inserted} stored, {writer.skipped} skipped as duplicates, {writer.failed} failed."
+    )
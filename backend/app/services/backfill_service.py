@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.crud_backfill import backfill_job as crud_backfill
+from app.crud.crud_news import news_item as news
+from app.db.models.backfill import BackfillJob
+from app.db.models.news_item import NewsItemContent
+from app.db.session import AsyncSessionLocal
+from app.services.gemini_service import GeminiService, llm_providers_available
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before re-checking when every LLM provider is cooling down.
+PROVIDER_WAIT_SECONDS = 60
+
+# job_id -> running task. A job whose status stays "running" across a restart is resumed from its checkpoint.
+_active_tasks: Dict[int, asyncio.Task] = {}
+
+
+class _RateLimiter:
+    """Spaces calls evenly so a job never exceeds `calls_per_minute`."""
+
+    def __init__(self, calls_per_minute: int):
+        self.interval = 60.0 / max(1, calls_per_minute)
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _candidate_filters(job: BackfillJob) -> Dict[str, Any]:
+    return {
+        "target_prompt_version": job.target_prompt_version,
+        "published_since": job.published_since,
+        "published_until": job.published_until,
+    }
+
+
+async def create_job(db: AsyncSession, job: BackfillJob) -> BackfillJob:
+    """Counts the candidates, stores the job as running and starts it."""
+    job.total_candidates = await news.count_reenrichment_candidates(db, **_candidate_filters(job))
+    if job.max_items:
+        job.total_candidates = min(job.total_candidates, job.max_items)
+    job.status = "running"
+    job.started_at = datetime.now(timezone.utc)
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    start_job(job.id)
+    return job
+
+
+def start_job(job_id: int) -> bool:
+    """Starts the runner task for a job unless it is already running in this process."""
+    task = _active_tasks.get(job_id)
+    if task and not task.done():
+        return False
+    task = asyncio.create_task(_run_job(job_id))
+    _active_tasks[job_id] = task
+    task.add_done_callback(lambda _: _active_tasks.pop(job_id, None))
+    return True
+
+
+async def resume_running_jobs() -> None:
+    """Restarts jobs left in the "running" state by a previous process, from their checkpoint."""
+    async with AsyncSessionLocal() as db:
+        jobs = await crud_backfill.get_by_status(db, status="running")
+    for job in jobs:
+        logger.info(f"[Backfill] Resuming job {job.id} after {job.processed}/{job.total_candidates} items.")
+        start_job(job.id)
+
+
+async def _reenrich_item(
+    item: Dict[str, Any],
+    gemini_service: GeminiService,
+    limiter: _RateLimiter,
+    semaphore: asyncio.Semaphore,
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """Returns (outcome, column values, freshly fetched content) for one news item."""
+    async with semaphore:
+        try:
+            content = item["content"]
+            fetched_content = None
+            if not content:
+                content = fetched_content = await gemini_service.get_content_from_url(url=item["url"])
+            if not content:
+                return "skipped", None, None
+
+            await limiter.wait()
+            analysis = await gemini_service.evaluate_and_summarize_content(title=item["title"], content=content)
+            if not analysis or not analysis.get("summary"):
+                return "failed", None, fetched_content
+
+            values = {
+                "id": item["id"],
+                "description": analysis["summary"],
+                "relevance_rating": analysis.get("relevance_rating"),
+                "sectors": analysis.get("tags", []),
+                "enrichment_source": analysis.get("provider"),
+                "prompt_version": analysis.get("prompt_version"),
+            }
+            return "updated", values, fetched_content
+        except Exception as e:
+            logger.error(f"[Backfill] Error re-enriching news item {item['id']}: {e}", exc_info=True)
+            return "failed", None, None
+
+
+async def _finish(db: AsyncSession, job: BackfillJob, status: str, error: Optional[str] = None) -> None:
+    job.status = status
+    job.error = error
+    job.finished_at = datetime.now(timezone.utc)
+    await db.commit()
+    logger.info(f"[Backfill] Job {job.id} {status}: {job.updated} updated, {job.skipped} skipped, {job.failed} failed.")
+
+
+async def _run_job(job_id: int) -> None:
+    """
+    Processes a job chunk by chunk. Each chunk's updates, stored contents and the
+    new checkpoint are committed in one transaction, so a crash or restart loses
+    at most the chunk in flight. The job status is re-read before every chunk,
+    which is how pause and cancel take effect.
+    """
+    gemini_service = GeminiService()
+    limiter = _RateLimiter(settings.BACKFILL_MAX_CALLS_PER_MINUTE)
+    semaphore = asyncio.Semaphore(max(1, settings.BACKFILL_CONCURRENCY))
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            job = await crud_backfill.get(db, id=job_id)
+            if job is None or job.status != "running":
+                return
+            if not settings.GEMINI_API_KEY and not settings.MISTRAL_API_KEY:
+                await _finish(db, job, "failed", "No LLM provider is configured.")
+                return
+
+            remaining = job.batch_size
+            if job.max_items:
+                remaining = min(remaining, job.max_items - job.processed)
+                if remaining <= 0:
+                    await _finish(db, job, "completed")
+                    return
+
+            if not llm_providers_available():
+                wait = True
+            else:
+                wait = False
+                page = await news.get_reenrichment_page(
+                    db, after_id=job.last_news_item_id, limit=remaining, **_candidate_filters(job)
+                )
+                if not page:
+                    await _finish(db, job, "completed")
+                    return
+
+        if wait:
+            logger.info(f"[Backfill] Job {job_id}: all LLM providers are cooling down, waiting {PROVIDER_WAIT_SECONDS}s.")
+            await asyncio.sleep(PROVIDER_WAIT_SECONDS)
+            continue
+
+        results = await asyncio.gather(
+            *(_reenrich_item(item, gemini_service, limiter, semaphore) for item in page)
+        )
+
+        async with AsyncSessionLocal() as db:
+            try:
+                job = await crud_backfill.get(db, id=job_id)
+                if job is None:
+                    return
+                updates = [values for outcome, values, _ in results if outcome == "updated"]
+                contents = [
+                    {"news_item_id": item["id"], "content": fetched}
+                    for item, (_, _, fetched) in zip(page, results)
+                    if fetched
+                ]
+                await news.bulk_update_enrichment(db, rows=updates)
+                if contents:
+                    await db.execute(insert(NewsItemContent), contents)
+                job.last_news_item_id = page[-1]["id"]
+                job.processed += len(page)
+                job.updated += len(updates)
+                job.skipped += sum(1 for outcome, _, _ in results if outcome == "skipped")
+                job.failed += sum(1 for outcome, _, _ in results if outcome == "failed")
+                await db.commit()
+                logger.info(f"[Backfill] Job {job_id}: {job.processed}/{job.total_candidates} items processed.")
+            except Exception as e:
+                logger.error(f"[Backfill] Job {job_id} failed writing a chunk: {e}", exc_info=True)
+                await db.rollback()
+                job = await crud_backfill.get(db, id=job_id)
+                if job is not None:
+                    await _finish(db, job, "failed", str(e))
+                return
@@ -0,0 +1,173 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Set, Tuple
+
+from app.services.local_enrichment_service import STOPWORDS
+
+# Rough chars-per-token ratio for English prose with the Gemini/Mistral tokenizers.
+CHARS_PER_TOKEN = 4
+# Paragraphs at the top of the article kept verbatim (the lead), budget permitting.
+LEAD_PARAGRAPHS = 2
+# Word-set Jaccard similarity above which a sentence counts as a near-duplicate.
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'“(])")
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#\-]*")
+_BOILERPLATE_RE = re.compile(
+    r"\b(cookies?|subscribe|newsletter|sign up|sign in|log in|share (this|on)|follow us|click here|"
+    r"read more|related (articles|posts|stories)|advertisement|sponsored|all rights reserved|"
+    r"privacy policy|terms of (use|service)|comments?\b.*\b(below|policy)|you may also like|recommended for you)\b",
+    re.IGNORECASE,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Fast local token estimate; good enough for budgeting, no tokenizer round-trip."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+@dataclass
+class CondensedContent:
+    text: str
+    input_tokens: int
+    output_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.input_tokens - self.output_tokens)
+
+
+def _words(text: str) -> Set[str]:
+    return {w for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS}
+
+
+def _is_navigation_fragment(paragraph: str) -> bool:
+    """Menus, bylines, share bars, 'related' lists: short lines without sentence punctuation, or boilerplate."""
+    if _BOILERPLATE_RE.search(paragraph) and len(paragraph) < 300:
+        return True
+    return len(paragraph.split()) < 8 and paragraph[-1:] not in ".!?:\"'”"
+
+
+def _split_paragraphs(text: str) -> List[str]:
+    return [" ".join(p.split()) for p in re.split(r"\n+", text) if p.strip()]
+
+
+def _hard_split(sentence: str, max_chars: int) -> List[str]:
+    """Cuts a sentence longer than `max_chars` (tables, code, unpunctuated text) into pieces at word boundaries."""
+    if len(sentence) <= max_chars:
+        return [sentence]
+    pieces: List[str] = []
+    current = ""
+    for word in sentence.split():
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = ""
+        current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _truncate(text: str, token_budget: int, input_tokens: int) -> CondensedContent:
+    truncated = text[: token_budget * CHARS_PER_TOKEN]
+    return CondensedContent(text=truncated, input_tokens=input_tokens, output_tokens=estimate_tokens(truncated))
+
+
+def condense(text: str, token_budget: int) -> CondensedContent:
+    """
+    Shrinks extracted article text to at most `token_budget` estimated tokens:
+    drops navigation/boilerplate fragments and near-duplicate sentences, keeps
+    the lead paragraphs, then fills the remaining budget with the sentences that
+    carry the most rare (in-document) terms, emitted in their original order.
+    Sentences too long to fit the budget on their own are cut into pieces first;
+    if nothing usable survives, the text is simply truncated.
+    """
+    text = text or ""
+    input_tokens = estimate_tokens(text)
+    if input_tokens <= token_budget:
+        return CondensedContent(text=text, input_tokens=input_tokens, output_tokens=input_tokens)
+
+    # 1. Sentences in document order, tagged with their paragraph, without fragments or duplicates.
+    sentences: List[Tuple[int, str, Set[str]]] = []
+    seen_exact: Set[str] = set()
+    kept_word_sets: List[Set[str]] = []
+    # A piece costs its tokens plus one for the separator.
+    max_sentence_chars = max(1, (token_budget - 1) * CHARS_PER_TOKEN)
+    for paragraph_index, paragraph in enumerate(_split_paragraphs(text)):
+        if _is_navigation_fragment(paragraph):
+            continue
+        for raw_sentence in _SENTENCE_SPLIT_RE.split(paragraph):
+            for sentence in _hard_split(raw_sentence.strip(), max_sentence_chars):
+                words = _words(sentence)
+                if not words:
+                    continue
+                key = " ".join(sorted(words))
+                if key in seen_exact:
+                    continue
+                if any(
+                    len(words & other) / len(words | other) >= NEAR_DUPLICATE_THRESHOLD
+                    for other in kept_word_sets
+                    if abs(len(other) - len(words)) <= len(words) // 2
+                ):
+                    continue
+                seen_exact.add(key)
+                kept_word_sets.append(words)
+                sentences.append((paragraph_index, sentence, words))
+
+    if not sentences:
+        return _truncate(text, token_budget, input_tokens)
+
+    # 2. The lead (first paragraphs that survived filtering) goes in first.
+    lead_paragraphs = sorted({p for p, _, _ in sentences})[:LEAD_PARAGRAPHS]
+    selected: Set[int] = set()
+    used = 0
+    for i, (paragraph_index, sentence, _) in enumerate(sentences):
+        if paragraph_index not in lead_paragraphs:
+            continue
+        cost = estimate_tokens(sentence) + 1
+        if used + cost > token_budget:
+            break
+        selected.add(i)
+        used += cost
+
+    # 3. Rank the rest by information: rare in-document terms per sqrt(length).
+    document_frequency = Counter(word for _, _, words in sentences for word in words)
+    total = len(sentences)
+
+    def information(item: Tuple[int, Tuple[int, str, Set[str]]]) -> float:
+        _, (_, sentence, words) = item
+        weight = sum(math.log((1 + total) / document_frequency[w]) for w in words)
+        return weight / math.sqrt(max(1, len(sentence.split())))
+
+    candidates = [(i, s) for i, s in enumerate(sentences) if i not in selected]
+    for i, (_, sentence, _) in sorted(candidates, key=information, reverse=True):
+        cost = estimate_tokens(sentence) + 1
+        if used + cost > token_budget:
+            continue
+        selected.add(i)
+        used += cost
+
+    if not selected:
+        return _truncate(text, token_budget, input_tokens)
+
+    # 4. Re-assemble in document order, keeping paragraph breaks.
+    parts: List[str] = []
+    last_paragraph = None
+    for i in sorted(selected):
+        paragraph_index, sentence, _ = sentences[i]
+        if last_paragraph is not None and paragraph_index != last_paragraph:
+            parts.append("\n")
+        elif parts:
+            parts.append(" ")
+        parts.append(sentence)
+        last_paragraph = paragraph_index
+    condensed = "".join(parts)
+    return CondensedContent(text=condensed, input_tokens=input_tokens, output_tokens=estimate_tokens(condensed))
@@ -0,0 +1,194 @@
+import asyncio
+import io
+import logging
+import re
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import httpx
+from bs4 import BeautifulSoup
+from pydantic import BaseModel, Field
+
+from app.services import github_service, youtube_service
+
+logger = logging.getLogger(__name__)
+
+# Characters of body text (README, abstract, PDF pages) handed to the LLM.
+MAX_TEXT_CHARS = 12000
+# PDFs larger than this are left to the generic scrape, which will fail on them.
+MAX_PDF_BYTES = 10 * 1024 * 1024
+MAX_PDF_PAGES = 15
+
+USER_AGENT = "Mozilla/5.0 (compatible; ivanintech-bot/1.0; +https://ivanintech.com)"
+
+
+class ResourceContent(BaseModel):
+    """What a domain extractor knows about a URL, in the same shape for every source."""
+    source: str  # github | youtube | arxiv | pdf
+    url: str
+    title: Optional[str] = None
+    description: Optional[str] = None
+    text: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    tags: List[str] = Field(default_factory=list)
+
+    def to_prompt(self) -> str:
+        """The content sent to the LLM: title, topics, description and the (trimmed) body text."""
+        parts = []
+        if self.title:
+            parts.append(f"Title: {self.title}")
+        if self.tags:
+            parts.append(f"Topics: {', '.join(self.tags)}")
+        if self.description:
+            parts.append(self.description)
+        if self.text:
+            parts.append(self.text[:MAX_TEXT_CHARS])
+        return "\n\n".join(parts)
+
+
+Extractor = Callable[[str], Awaitable[Optional[ResourceContent]]]
+
+
+async def _extract_github(url: str) -> Optional[ResourceContent]:
+    owner_repo = github_service.extract_owner_repo_from_url(url)
+    if not owner_repo:
+        return None
+    owner, repo_name = owner_repo
+    repo, readme = await asyncio.gather(
+        github_service.get_repository(owner, repo_name),
+        github_service.get_readme_content(owner, repo_name),
+    )
+    if repo is None:
+        return None  # Not a repository (github.com/features/..., a user page): scrape it instead
+    tags = list(repo.topics)
+    if repo.language and repo.language not in tags:
+        tags.append(repo.language)
+    return ResourceContent(
+        source="github",
+        url=url,
+        title=repo.full_name,
+        description=f"{repo.description or ''} ({repo.stargazers_count} stars, {repo.forks_count} forks)".strip(),
+        text=readme,
+        thumbnail_url=f"https://opengraph.githubassets.com/1/{owner}/{repo_name}",
+        tags=tags,
+    )
+
+
+async def _extract_youtube(url: str) -> Optional[ResourceContent]:
+    details = await youtube_service.get_youtube_resource_details(url)
+    if details is None:
+        return None
+    return ResourceContent(
+        source="youtube",
+        url=url,
+        title=details.title,
+        description=f"YouTube {details.kind}.",
+        text=details.description,
+        thumbnail_url=details.thumbnail_url,
+        tags=details.tags,
+    )
+
+
+_ARXIV_ID_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/([^?#]+?)(?:\.pdf)?/?(?:[?#]|$)", re.IGNORECASE)
+
+
+async def _extract_arxiv(url: str) -> Optional[ResourceContent]:
+    match = _ARXIV_ID_RE.search(url)
+    if not match:
+        return None
+    # The abstract page, also for /pdf/ links: title, authors and abstract without parsing the paper.
+    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+        response = await client.get(f"https://arxiv.org/abs/{match.group(1)}", headers={"User-Agent": USER_AGENT})
+        response.raise_for_status()
+    soup = BeautifulSoup(response.text, "html.parser")
+
+    def meta(name: str) -> List[str]:
+        return [tag["content"] for tag in soup.find_all("meta", attrs={"name": name}) if tag.get("content")]
+
+    titles, abstracts = meta("citation_title"), meta("citation_abstract")
+    if not titles or not abstracts:
+        return None
+    authors = meta("citation_author")
+    return ResourceContent(
+        source="arxiv",
+        url=url,
+        title=titles[0],
+        description=f"arXiv paper by {', '.join(authors[:8])}{' et al.' if len(authors) > 8 else ''}." if authors else "arXiv paper.",
+        text=abstracts[0],
+    )
+
+
+def _pdf_text_sync(data: bytes) -> Tuple[Optional[str], Optional[str]]:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        logger.warning("pypdf is not installed: PDF resources fall back to the generic scrape.")
+        return None, None
+    reader = PdfReader(io.BytesIO(data))
+    title = reader.metadata.title if reader.metadata else None
+    pages = []
+    for page in reader.pages[:MAX_PDF_PAGES]:
+        pages.append(page.extract_text() or "")
+        if sum(len(text) for text in pages) >= MAX_TEXT_CHARS:
+            break
+    text = re.sub(r"[ \t]+", " ", "\n".join(pages)).strip()
+    return title, text or None
+
+
+async def pdf_text(data: bytes) -> Optional[str]:
+    """Text of the first pages of a PDF, or None when it has none (scanned) or cannot be read."""
+    try:
+        _, text = await asyncio.to_thread(_pdf_text_sync, data)
+        return text
+    except Exception as e:
+        logger.warning(f"Could not read PDF text: {e}")
+        return None
+
+
+async def _extract_pdf(url: str) -> Optional[ResourceContent]:
+    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with client.stream("GET", url, headers={"User-Agent": USER_AGENT}) as response:
+            response.raise_for_status()
+            chunks, size = [], 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > MAX_PDF_BYTES:
+                    logger.info(f"PDF at {url} is larger than {MAX_PDF_BYTES} bytes; not extracting it.")
+                    return None
+                chunks.append(chunk)
+    data = b"".join(chunks)
+    if not data.startswith(b"%PDF"):
+        return None
+    title, text = await asyncio.to_thread(_pdf_text_sync, data)
+    if not text:
+        return None
+    return ResourceContent(source="pdf", url=url, title=title or None, description="PDF document.", text=text)
+
+
+# Checked in order; the first pattern matching the URL picks the extractor.
+EXTRACTORS: List[Tuple[re.Pattern, Extractor]] = [
+    (re.compile(r"^https?://(?:www\.)?github\.com/[^/?#]+/[^/?#]+", re.IGNORECASE), _extract_github),
+    (re.compile(r"^https?://(?:(?:www|m)\.)?(?:youtube\.com|youtu\.be)/", re.IGNORECASE), _extract_youtube),
+    (re.compile(r"^https?://(?:www\.|export\.)?arxiv\.org/(?:abs|pdf)/", re.IGNORECASE), _extract_arxiv),
+    (re.compile(r"^https?://[^?#]+\.pdf(?:[?#]|$)", re.IGNORECASE), _extract_pdf),
+]
+
+
+async def extract(url: str) -> Optional[ResourceContent]:
+    """
+    Structured content for URLs a domain extractor knows (GitHub repositories,
+    YouTube videos and channels, arXiv papers, PDFs), read from their APIs or
+    the raw document instead of a rendered page. None when no extractor
+    applies or it found nothing: the caller then scrapes the page.
+    """
+    for pattern, extractor in EXTRACTORS:
+        if not pattern.match(url):
+            continue
+        try:
+            content = await extractor(url)
+        except Exception as e:
+            logger.warning(f"{extractor.__name__} failed for {url}: {e}")
+            return None
+        if content is not None:
+            logger.info(f"Extracted {url} with the {content.source} extractor ({len(content.to_prompt())} chars).")
+        return content
+    return None
@@ -0,0 +1,271 @@
+import asyncio
+import hashlib
+import logging
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from email.utils import format_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.response_cache import add_commit_listener
+from app.crud.crud_blog import blog_post as crud_blog_post
+from app.crud.crud_news_feed import news_feed as crud_news_feed
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+NEWS_FEED = "news.xml"
+BLOG_FEED = "blog.xml"
+SITEMAP = "sitemap.xml"
+
+MEDIA_TYPES = {
+    NEWS_FEED: "application/rss+xml; charset=utf-8",
+    BLOG_FEED: "application/atom+xml; charset=utf-8",
+    SITEMAP: "application/xml; charset=utf-8",
+}
+
+# Files to rebuild when a response-cache namespace changes.
+NAMESPACE_FEEDS: Dict[str, Set[str]] = {
+    "news": {NEWS_FEED},
+    "blog": {BLOG_FEED, SITEMAP},
+}
+
+# Protocol limit of a single sitemap file.
+SITEMAP_MAX_URLS = 50000
+SITEMAP_PAGES = ("/", "/blog", "/noticias", "/recursos", "/portfolio", "/sobre-mi", "/contacto")
+
+
+def _frontend_url(path: str) -> str:
+    return f"{settings.FRONTEND_HOST.rstrip('/')}{path}"
+
+
+def _feed_url(name: str) -> str:
+    path = f"/{name}" if name == SITEMAP else f"/feeds/{name}"
+    return f"{str(settings.SERVER_HOST).rstrip('/')}{path}"
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    """Timezone-aware datetime for datetimes and dates (SQLite returns naive UTC values)."""
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _sub(parent: ET.Element, tag: str, text: Optional[str] = None, **attrs: str) -> ET.Element:
+    element = ET.SubElement(parent, tag, attrs)
+    if text is not None:
+        element.text = text
+    return element
+
+
+def _serialize(root: ET.Element) -> bytes:
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+async def build_news_feed(db: AsyncSession) -> bytes:
+    """RSS 2.0 of the latest news. Links point at the original articles."""
+    rows, _ = await crud_news_feed.get_page_rows(
+        db,
+        columns=["id", "title", "url", "description", "sectors", "publishedAt"],
+        limit=settings.FEED_MAX_ITEMS,
+    )
+    rss = ET.Element("rss", {"version": "2.0", "xmlns:atom": "http://www.w3.org/2005/Atom"})
+    channel = _sub(rss, "channel")
+    _sub(channel, "title", f"{settings.PROJECT_NAME} - Noticias")
+    _sub(channel, "link", _frontend_url("/noticias"))
+    _sub(channel, "description", "Últimas noticias sobre inteligencia artificial y tecnología.")
+    _sub(channel, "language", "es")
+    _sub(channel, "atom:link", href=_feed_url(NEWS_FEED), rel="self", type="application/rss+xml")
+    # Derived from the data, not the clock, so an unchanged feed keeps its bytes (and ETag).
+    if rows:
+        _sub(channel, "lastBuildDate", format_datetime(_as_datetime(rows[0]["publishedAt"]), usegmt=True))
+    for row in rows:
+        item = _sub(channel, "item")
+        _sub(item, "title", row["title"])
+        _sub(item, "link", row["url"])
+        _sub(item, "guid", str(row["id"]), isPermaLink="false")
+        if row["description"]:
+            _sub(item, "description", row["description"])
+        _sub(item, "pubDate", format_datetime(_as_datetime(row["publishedAt"]), usegmt=True))
+        for sector in row["sectors"] or []:
+            _sub(item, "category", sector)
+    return _serialize(rss)
+
+
+async def build_blog_feed(db: AsyncSession) -> bytes:
+    """Atom feed of the latest published posts, with their pre-rendered HTML."""
+    rows, _ = await crud_blog_post.get_page_rows(
+        db,
+        columns=[
+            "id", "slug", "title", "excerpt", "content_html", "tags",
+            "published_date", "last_modified_date", "author_full_name",
+        ],
+        limit=settings.FEED_MAX_ITEMS,
+        status="published",
+    )
+    feed = ET.Element("feed", xmlns="http://www.w3.org/2005/Atom")
+    _sub(feed, "title", f"{settings.PROJECT_NAME} - Blog")
+    _sub(feed, "id", _frontend_url("/blog"))
+    _sub(feed, "link", href=_frontend_url("/blog"), rel="alternate", type="text/html")
+    _sub(feed, "link", href=_feed_url(BLOG_FEED), rel="self", type="application/atom+xml")
+    updated = [_as_datetime(row["last_modified_date"] or row["published_date"]) for row in rows]
+    _sub(feed, "updated", max(updated, default=datetime(1970, 1, 1, tzinfo=timezone.utc)).isoformat())
+    _sub(_sub(feed, "author"), "name", settings.PROJECT_NAME)
+    for row, entry_updated in zip(rows, updated):
+        url = _frontend_url(f"/blog/{row['slug']}")
+        entry = _sub(feed, "entry")
+        _sub(entry, "title", row["title"])
+        _sub(entry, "id", url)
+        _sub(entry, "link", href=url, rel="alternate", type="text/html")
+        _sub(entry, "published", _as_datetime(row["published_date"]).isoformat())
+        _sub(entry, "updated", entry_updated.isoformat())
+        if row["author_full_name"]:
+            _sub(_sub(entry, "author"), "name", row["author_full_name"])
+        for tag in (row["tags"] or "").split(","):
+            if tag.strip():
+                _sub(entry, "category", term=tag.strip())
+        if row["excerpt"]:
+            _sub(entry, "summary", row["excerpt"])
+        if row["content_html"]:
+            _sub(entry, "content", row["content_html"], type="html")
+    return _serialize(feed)
+
+
+async def build_sitemap(db: AsyncSession) -> bytes:
+    """Sitemap of the frontend's static pages and every published post."""
+    rows, _ = await crud_blog_post.get_page_rows(
+        db,
+        columns=["slug", "published_date", "last_modified_date"],
+        limit=SITEMAP_MAX_URLS - len(SITEMAP_PAGES),
+        status="published",
+    )
+    urlset = ET.Element("urlset", xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
+    for path in SITEMAP_PAGES:
+        _sub(_sub(urlset, "url"), "loc", _frontend_url(path))
+    for row in rows:
+        url = _sub(urlset, "url")
+        _sub(url, "loc", _frontend_url(f"/blog/{row['slug']}"))
+        lastmod: date = row["last_modified_date"] or row["published_date"]
+        _sub(url, "lastmod", lastmod.isoformat())
+    return _serialize(urlset)
+
+
+BUILDERS: Dict[str, Callable[[AsyncSession], Awaitable[bytes]]] = {
+    NEWS_FEED: build_news_feed,
+    BLOG_FEED: build_blog_feed,
+    SITEMAP: build_sitemap,
+}
+
+
+@dataclass(frozen=True)
+class FeedFile:
+    body: bytes
+    etag: str
+    last_modified: datetime
+    mtime_ns: int
+
+
+class FeedStore:
+    """
+    The generated files, written atomically to `directory` and kept in memory.
+    A hit costs one stat(): the copy in memory is reloaded only when the file
+    was rewritten (e.g. by another worker process).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._files: Dict[str, FeedFile] = {}
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def get(self, name: str) -> Optional[FeedFile]:
+        try:
+            stat = os.stat(self._path(name))
+        except FileNotFoundError:
+            return None
+        cached = self._files.get(name)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns:
+            return cached
+        with open(self._path(name), "rb") as f:
+            body = f.read()
+        return self._remember(name, body, stat)
+
+    def write(self, name: str, body: bytes) -> bool:
+        """Replaces the file unless its content is unchanged (so its ETag and Last-Modified stay). Returns whether it was written."""
+        current = self.get(name)
+        if current is not None and current.body == body:
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self._path(name)}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, self._path(name))
+        self._remember(name, body, os.stat(self._path(name)))
+        return True
+
+    def _remember(self, name: str, body: bytes, stat: os.stat_result) -> FeedFile:
+        feed_file = FeedFile(
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()}"',
+            last_modified=datetime.fromtimestamp(int(stat.st_mtime), tz=timezone.utc),
+            mtime_ns=stat.st_mtime_ns,
+        )
+        self._files[name] = feed_file
+        return feed_file
+
+
+feed_store = FeedStore(settings.FEEDS_DIR)
+
+# Files waiting for the debounced regeneration, and the task that will run it.
+_dirty: Set[str] = set()
+_regeneration_task: Optional[asyncio.Task] = None
+
+
+async def regenerate(names: Optional[Iterable[str]] = None) -> None:
+    """Rebuilds the given files (all of them by default) from the database."""
+    names = sorted(names) if names is not None else list(BUILDERS)
+    async with AsyncSessionLocal() as db:
+        for name in names:
+            try:
+                if feed_store.write(name, await BUILDERS[name](db)):
+                    logger.info(f"Feed {name} regenerated.")
+            except Exception as e:
+                logger.error(f"Error regenerating feed {name}: {e}", exc_info=True)
+
+
+async def _regenerate_when_quiet() -> None:
+    while _dirty:
+        await asyncio.sleep(settings.FEEDS_REGENERATE_DELAY_SECONDS)
+        names = set(_dirty)
+        _dirty.clear()
+        await regenerate(names)
+
+
+def schedule_regeneration(namespaces: Set[str]) -> None:
+    """
+    Commit listener: marks the files built from the changed collections and
+    rebuilds them after FEEDS_REGENERATE_DELAY_SECONDS, so a burst of writes
+    (an ingestion run) costs one regeneration.
+    """
+    global _regeneration_task
+    names = set().union(*(NAMESPACE_FEEDS.get(namespace, set()) for namespace in namespaces))
+    if not names:
+        return
+    _dirty.update(names)
+    if _regeneration_task is None or _regeneration_task.done():
+        try:
+            _regeneration_task = asyncio.get_running_loop().create_task(_regenerate_when_quiet())
+        except RuntimeError:
+            # No event loop (sync code): picked up by the next scheduled run or startup.
+            pass
+
+
+def register() -> None:
+    add_commit_listener(schedule_regeneration)
@@ -14,6 +14,7 @@ import trafilatura
 # Importar multiprocessing y la API síncrona de Playwright
 import asyncio
 import multiprocessing
+import time
 from queue import Empty as QueueEmpty
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
@@ -21,7 +22,10 @@ from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeo
 from mistralai.client import MistralClient
 
 from app.core.config import settings
-from app.services import youtube_service
+from app.core.single_flight import SingleFlight
+from app.core.urls import normalize_url
+from app.services import content_extractors, youtube_service
+from app.services.content_condenser import condense
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +69,38 @@ def playwright_extractor_process(url: str, result_queue: multiprocessing.Queue):
         result_queue.put(None)
 
 
+# Versión del prompt de evaluación. Increméntala al cambiar `complete_prompt` para que
+# los backfills de re-enriquecimiento puedan seleccionar las noticias evaluadas con versiones anteriores.
+PROMPT_VERSION = 1
+
+# Page downloads in flight, by normalized URL: an ingestion run, a resource and a
+# news submission asking for the same page at once download it once.
+_content_fetches: SingleFlight[Optional[str]] = SingleFlight("content-fetch")
+
+
+# --- Circuit breaker por proveedor ---
+# Cuando un proveedor agota su cuota se salta durante LLM_PROVIDER_COOLDOWN_SECONDS,
+# para que la ingesta no pague los reintentos y timeouts en cada artículo.
+_provider_cooldown_until: Dict[str, float] = {}
+
+
+def _provider_available(provider: str) -> bool:
+    return time.monotonic() >= _provider_cooldown_until.get(provider, 0.0)
+
+
+def _trip_provider(provider: str, reason: str) -> None:
+    _provider_cooldown_until[provider] = time.monotonic() + settings.LLM_PROVIDER_COOLDOWN_SECONDS
+    logger.warning(f"LLM provider '{provider}' disabled for {settings.LLM_PROVIDER_COOLDOWN_SECONDS}s: {reason}")
+
+
+def llm_providers_available() -> bool:
+    """True if at least one configured LLM provider is not cooling down."""
+    return (
+        (bool(settings.GEMINI_API_KEY) and _provider_available("gemini"))
+        or (bool(settings.MISTRAL_API_KEY) and _provider_available("mistral"))
+    )
+
+
 class GeminiService:
     def __init__(self):
         self.gemini_model = None
@@ -121,7 +157,11 @@ class GeminiService:
         Obtiene el contenido de una URL con un enfoque de múltiples capas.
         1. Intento rápido con httpx.
         2. Fallback a renderizado de navegador completo con Playwright en un PROCESO separado.
+        Concurrent calls for the same normalized URL share one download.
         """
+        return await _content_fetches.do(normalize_url(url), lambda: self._fetch_content_from_url(url))
+
+    async def _fetch_content_from_url(self, url: str) -> Optional[str]:
         # 1. Intento Rápido con HTTPX
         try:
             headers = {
@@ -130,7 +170,12 @@ class GeminiService:
             async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
                 response = await client.get(url, headers=headers)
                 response.raise_for_status()
-                html_content = response.text
+
+            if "application/pdf" in response.headers.get("content-type", ""):
+                # A browser would not render it either: read the text layer or give up.
+                text_content = await content_extractors.pdf_text(response.content)
+                return text_content[:25000] if text_content else None
+            html_content = response.text
             
             text_content = trafilatura.extract(html_content, include_comments=False, include_tables=False, no_fallback=True)
             
@@ -156,7 +201,20 @@ class GeminiService:
         """
         Analyzes content using Gemini and falls back to Mistral if needed.
         This is the main analysis method.
+
+        The content is first condensed to LLM_CONTENT_TOKEN_BUDGET estimated tokens;
+        the estimated savings are reported as `usage["input_tokens_saved"]`.
         """
+        condensed = condense(content or "", settings.LLM_CONTENT_TOKEN_BUDGET)
+        if condensed.tokens_saved:
+            logger.debug(f"Condensed content for '{title}': ~{condensed.input_tokens} -> ~{condensed.output_tokens} tokens.")
+        parsed_data = await self._evaluate_with_providers(title, condensed.text)
+        if parsed_data:
+            usage = parsed_data.setdefault("usage", {})
+            usage["input_tokens_saved"] = condensed.tokens_saved
+        return parsed_data
+
+    async def _evaluate_with_providers(self, title: str, content: str) -> Optional[Dict[str, Any]]:
         # Cleaned and unified prompt, now with credibility check
         complete_prompt = (
             "You are an expert analyst. Analyze the article and return ONLY a valid JSON object with the following keys:\\n"
@@ -174,6 +232,9 @@ class GeminiService:
             if not self.gemini_model:
                 logger.error("Gemini model not initialized. Attempting fallback to Mistral.")
                 return await self._analyze_with_mistral(title, content, complete_prompt)
+            if not _provider_available("gemini"):
+                logger.debug(f"Gemini is cooling down after quota exhaustion. Using Mistral for '{title}'.")
+                return await self._analyze_with_mistral(title, content, complete_prompt)
                 
             response = await self.gemini_model.generate_content_async(complete_prompt)
             
@@ -184,13 +245,22 @@ class GeminiService:
             
             if json_start_index != -1 and json_end_index != -1 and json_end_index > json_start_index:
                 json_str = cleaned_response_text[json_start_index:json_end_index+1]
-                return json.loads(json_str)
+                parsed_data = json.loads(json_str)
+                usage_metadata = getattr(response, "usage_metadata", None)
+                parsed_data["provider"] = "gemini"
+                parsed_data["prompt_version"] = PROMPT_VERSION
+                parsed_data["usage"] = {
+                    "prompt_tokens": getattr(usage_metadata, "prompt_token_count", None),
+                    "completion_tokens": getattr(usage_metadata, "candidates_token_count", None),
+                }
+                return parsed_data
             else:
                 logger.error(f"Could not find a valid JSON object in Gemini response for '{title}'. Full response: '{response.text}'")
                 return await self._analyze_with_mistral(title, content, complete_prompt)
 
         except ResourceExhausted:
             logger.warning(f"Gemini API quota likely exceeded for article '{title}'. Attempting fallback to Mistral.")
+            _trip_provider("gemini", "quota exhausted")
             return await self._analyze_with_mistral(title, content, complete_prompt)
         except Exception as e:
             logger.error(f"An unexpected error occurred with Gemini for article '{title}': {e}", exc_info=True)
@@ -201,13 +271,20 @@ class GeminiService:
         if not self.mistral_client:
             logger.error("Mistral fallback called but client is not available (no API key).")
             return None
+        if not _provider_available("mistral"):
+            logger.debug(f"Mistral is cooling down after a failed call. Skipping analysis of '{title}'.")
+            return None
 
         logger.info(f"Falling back to Mistral API for article: {title}")
         try:
-            chat_response = self.mistral_client.chat(
-                model="mistral-small-latest",
-                messages=[{"role": "user", "content": complete_prompt}]
-            )
+            try:
+                chat_response = self.mistral_client.chat(
+                    model="mistral-small-latest",
+                    messages=[{"role": "user", "content": complete_prompt}]
+                )
+            except Exception as e:
+                _trip_provider("mistral", str(e))
+                raise
             response_text = chat_response.choices[0].message.content
             
             logger.debug(f"RAW MISTRAL RESPONSE for '{title}': {response_text}")
@@ -231,6 +308,13 @@ class GeminiService:
                 logger.info(f"Neutralized placeholder 'example.com' image from Mistral for article '{title}'.")
                 parsed_data['thumbnail_url_suggestion'] = None
 
+            usage = getattr(chat_response, "usage", None)
+            parsed_data["provider"] = "mistral"
+            parsed_data["prompt_version"] = PROMPT_VERSION
+            parsed_data["usage"] = {
+                "prompt_tokens": getattr(usage, "prompt_tokens", None),
+                "completion_tokens": getattr(usage, "completion_tokens", None),
+            }
             return parsed_data
 
         except Exception as e:
@@ -369,8 +453,9 @@ async def generate_resource_details(
     """
     gemini = GeminiService()
 
-    # 1. Get content using the robust, multi-layered method
-    content = await gemini.get_content_from_url(url)
+    # 1. Get content: structured for GitHub, YouTube, arXiv and PDFs, otherwise the robust, multi-layered scrape
+    extracted = await content_extractors.extract(url)
+    content = extracted.to_prompt() if extracted else await gemini.get_content_from_url(url)
     if not content:
         logger.error(f"Failed to retrieve content from URL: {url}")
         raise ValueError("Could not retrieve content from the URL.")
@@ -386,7 +471,7 @@ async def generate_resource_details(
     # 3. Analyze content with Gemini
     try:
         details = await gemini.evaluate_and_summarize_content(
-            title=user_title,
+            title=user_title or (extracted.title if extracted else None),
             content=content
         )
 
@@ -394,9 +479,10 @@ async def generate_resource_details(
             logger.warning(f"URL {url} deemed not relevant or analysis failed.")
             raise ValueError("The content of the URL is not considered relevant to AI or could not be analyzed.")
 
-        # Aquí podrías añadir lógica adicional para el thumbnail si es necesario
-        # Por ahora, nos enfocamos en el refactor.
-        
+        # The extractor's thumbnail (video frame, repository card) beats the AI's guess.
+        if extracted and extracted.thumbnail_url:
+            details["thumbnail_url_suggestion"] = extracted.thumbnail_url
+
         return details
 
     except Exception as e:
@@ -155,6 +155,62 @@ async def get_file_content(owner: str, repo_name: str, file_path: str, token: Op
         logger.error(f"Unexpected error fetching file content for {owner}/{repo_name}/{file_path}: {e}", exc_info=True)
         return None
 
+async def get_repository(owner: str, repo_name: str, token: Optional[str] = None) -> Optional[GitHubRepo]:
+    """Fetches the metadata (description, topics, language, stars) of a single repository."""
+    api_url = f"https://api.github.com/repos/{owner}/{repo_name}"
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if token or settings.GITHUB_TOKEN:
+        headers["Authorization"] = f"token {token or settings.GITHUB_TOKEN}"
+
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(api_url, headers=headers)
+            response.raise_for_status()
+            return GitHubRepo.model_validate(response.json())
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            logger.info(f"Repository not found: {owner}/{repo_name}")
+        else:
+            logger.error(f"HTTP error fetching repository {owner}/{repo_name}: {e.response.status_code} - {e.response.text}")
+        return None
+    except httpx.RequestError as e:
+        logger.error(f"Request error fetching repository {owner}/{repo_name}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error fetching repository {owner}/{repo_name}: {e}", exc_info=True)
+        return None
+
+async def get_readme_content(owner: str, repo_name: str, token: Optional[str] = None) -> Optional[str]:
+    """Fetches the README of a repository as raw text; GitHub picks the file (README.md, README.rst...)."""
+    api_url = f"https://api.github.com/repos/{owner}/{repo_name}/readme"
+    headers = {"Accept": "application/vnd.github.raw"}
+    if token or settings.GITHUB_TOKEN:
+        headers["Authorization"] = f"token {token or settings.GITHUB_TOKEN}"
+
+    try:
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            response = await client.get(api_url, headers=headers)
+            response.raise_for_status()
+            return response.text
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            logger.info(f"README not found: {owner}/{repo_name}")
+        else:
+            logger.error(f"HTTP error fetching README for {owner}/{repo_name}: {e.response.status_code} - {e.response.text}")
+        return None
+    except httpx.RequestError as e:
+        logger.error(f"Request error fetching README for {owner}/{repo_name}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error fetching README for {owner}/{repo_name}: {e}", exc_info=True)
+        return None
+
+def construct_full_gif_url(gif_url: str, owner: str, repo_name: str, branch: Optional[str] = None) -> str:
+    """Turns an image path found in a README into an absolute raw.githubusercontent.com URL."""
+    if gif_url.startswith(("http://", "https://")):
+        return gif_url
+    return f"https://raw.githubusercontent.com/{owner}/{repo_name}/{branch or 'main'}/{gif_url.removeprefix('./').lstrip('/')}"
+
 # Utility function to extract owner and repo name from URL
 def extract_owner_repo_from_url(github_url: str) -> Optional[tuple[str, str]]:
     """Extracts owner and repository name from a GitHub URL."""
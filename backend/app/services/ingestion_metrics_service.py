@@ -0,0 +1,190 @@
+import enum
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.ingestion import IngestionEvent, IngestionRun
+
+logger = logging.getLogger(__name__)
+
+# Stages timed per article; "fetch" and "insert" are timed once per run.
+ARTICLE_STAGES = ("extract", "llm", "image")
+RUN_STAGES = ("fetch", "insert")
+
+
+class DropReason(str, enum.Enum):
+    INVALID = "invalid"
+    DUPLICATE = "duplicate"
+    NO_CONTENT = "no_content"
+    LLM_FAILED = "llm_failed"
+    MISSING_SUMMARY = "missing_summary"
+    NOT_TECH = "not_tech"
+    LOW_RELEVANCE = "low_relevance"
+    LOW_CREDIBILITY = "low_credibility"
+    BAD_DATE = "bad_date"
+    INSERT_FAILED = "insert_failed"
+    ERROR = "error"
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
+
+
+@dataclass
+class ArticleTrace:
+    """Timings and outcome of a single article as it moves through the pipeline."""
+    url: str
+    timings: Dict[str, int] = field(default_factory=dict)
+    provider: Optional[str] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    input_tokens_saved: Optional[int] = None
+    relevance_rating: Optional[float] = None
+    credibility_score: Optional[float] = None
+    drop_reason: Optional[DropReason] = None
+    accepted: bool = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0) + _elapsed_ms(start)
+
+    def drop(self, reason: DropReason) -> None:
+        self.drop_reason = reason
+
+    def record_analysis(self, analysis: Dict[str, Any]) -> None:
+        """Copies provider, token usage and scores from an LLM analysis result."""
+        self.provider = analysis.get("provider")
+        usage = analysis.get("usage") or {}
+        self.prompt_tokens = usage.get("prompt_tokens")
+        self.completion_tokens = usage.get("completion_tokens")
+        self.input_tokens_saved = usage.get("input_tokens_saved")
+        self.relevance_rating = analysis.get("relevance_rating")
+        self.credibility_score = analysis.get("credibility_score")
+
+
+class IngestionRecorder:
+    """
+    Collects run-level and per-article metrics in memory during an ingestion run
+    and writes them to `ingestion_runs` / `ingestion_events` at the end, so the
+    ledger costs two writes per run rather than one per article.
+    """
+
+    def __init__(self, trigger: Optional[str] = None):
+        self.trigger = trigger
+        self.run_id: Optional[int] = None
+        self.articles_fetched = 0
+        self.timings: Dict[str, int] = {}
+        self.traces: List[ArticleTrace] = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0) + _elapsed_ms(start)
+
+    def add_time(self, name: str, ms: int) -> None:
+        self.timings[name] = self.timings.get(name, 0) + ms
+
+    def start_article(self, url: str) -> ArticleTrace:
+        trace = ArticleTrace(url=url or "")
+        self.traces.append(trace)
+        return trace
+
+    async def start(self, db: AsyncSession) -> None:
+        try:
+            run = IngestionRun(trigger=self.trigger, status="running")
+            db.add(run)
+            await db.commit()
+            self.run_id = run.id
+        except Exception as e:
+            logger.error(f"Could not create ingestion run record: {e}", exc_info=True)
+            await db.rollback()
+
+    async def finish(
+        self,
+        db: AsyncSession,
+        *,
+        inserted_urls: Set[str],
+        failed_urls: Optional[Set[str]] = None,
+        status: str = "completed",
+        error: Optional[str] = None,
+    ) -> None:
+        """Resolves final outcomes and persists the run summary and its events."""
+        if self.run_id is None:
+            return
+
+        failed_urls = failed_urls or set()
+        for trace in self.traces:
+            if trace.drop_reason is None and trace.accepted and trace.url not in inserted_urls:
+                if trace.url in failed_urls:
+                    trace.drop_reason = DropReason.INSERT_FAILED
+                else:
+                    # Accepted but not returned by the INSERT: lost a race with a concurrent insert.
+                    trace.drop_reason = DropReason.DUPLICATE
+
+        stored = [t for t in self.traces if t.drop_reason is None and t.url in inserted_urls]
+        dropped = [t for t in self.traces if t.drop_reason is not None]
+        for trace in self.traces:
+            for name in ARTICLE_STAGES:
+                self.add_time(name, trace.timings.get(name, 0))
+
+        events = [
+            {
+                "run_id": self.run_id,
+                "url": trace.url[:2048],
+                "outcome": "dropped" if trace.drop_reason else "stored",
+                "drop_reason": trace.drop_reason.value if trace.drop_reason else None,
+                "provider": trace.provider,
+                "extract_ms": trace.timings.get("extract"),
+                "llm_ms": trace.timings.get("llm"),
+                "image_ms": trace.timings.get("image"),
+                "prompt_tokens": trace.prompt_tokens,
+                "completion_tokens": trace.completion_tokens,
+                "input_tokens_saved": trace.input_tokens_saved,
+                "relevance_rating": trace.relevance_rating,
+                "credibility_score": trace.credibility_score,
+            }
+            for trace in self.traces
+            if trace.drop_reason is not None or trace.url in inserted_urls
+        ]
+
+        try:
+            run = await db.get(IngestionRun, self.run_id)
+            if run is None:
+                return
+            run.status = status
+            run.error = error
+            run.finished_at = datetime.now(timezone.utc)
+            run.articles_fetched = self.articles_fetched
+            run.articles_processed = len(self.traces)
+            run.articles_stored = len(stored)
+            run.articles_dropped = len(dropped)
+            for name in RUN_STAGES + ARTICLE_STAGES:
+                setattr(run, f"{name}_ms", self.timings.get(name, 0))
+            run.total_ms = _elapsed_ms(self._started)
+            run.prompt_tokens = sum(t.prompt_tokens or 0 for t in self.traces)
+            run.completion_tokens = sum(t.completion_tokens or 0 for t in self.traces)
+            run.input_tokens_saved = sum(t.input_tokens_saved or 0 for t in self.traces)
+            if events:
+                await db.execute(insert(IngestionEvent), events)
+            await db.commit()
+            logger.info(
+                f"Ingestion run {self.run_id} recorded: {len(stored)} stored, {len(dropped)} dropped, "
+                f"stage ms={ {name: self.timings.get(name, 0) for name in RUN_STAGES + ARTICLE_STAGES} }"
+            )
+        except Exception as e:
+            logger.error(f"Could not record ingestion run {self.run_id}: {e}", exc_info=True)
+            await db.rollback()
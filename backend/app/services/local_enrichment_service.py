@@ -0,0 +1,209 @@
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Marks analyses produced without an LLM, so they can be re-enriched later.
+LOCAL_PROVIDER = "local"
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'“(])")
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#\-]*[a-z0-9+#]|[a-z]")
+
+MAX_SENTENCES = 80
+MIN_SENTENCE_CHARS = 40
+MAX_SENTENCE_CHARS = 400
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have having
+he her here hers herself him himself his how i if in into is it its itself just like many may me might more
+most much must my myself new no nor not now of off on once one only or other our ours ourselves out over own
+said same says she should so some such than that the their theirs them themselves then there these they this
+those through to too two under until up upon us very was we were what when where which while who whom why
+will with would you your yours yourself yourselves year years still even well get got make made way use used
+""".split())
+
+# Curated vocabulary: sector tag -> keywords (lowercase, single words or phrases).
+SECTOR_VOCABULARY: Dict[str, List[str]] = {
+    "ai": ["artificial intelligence", "ai", "agi", "ai model", "ai models", "generative ai", "genai"],
+    "machine learning": ["machine learning", "ml", "deep learning", "neural network", "neural networks",
+                         "training data", "fine-tuning", "fine-tune", "reinforcement learning", "transformer",
+                         "transformers", "embeddings", "inference"],
+    "llm": ["llm", "llms", "large language model", "large language models", "gpt", "chatgpt", "claude",
+            "gemini", "llama", "mistral", "prompt", "prompts", "chatbot", "chatbots", "rag"],
+    "robotics": ["robot", "robots", "robotics", "humanoid", "autonomous", "drone", "drones", "self-driving"],
+    "computer vision": ["computer vision", "image recognition", "object detection", "diffusion", "image generation",
+                        "video generation", "facial recognition"],
+    "software development": ["software", "developer", "developers", "programming", "python", "javascript",
+                             "typescript", "rust", "open source", "open-source", "github", "api", "apis",
+                             "framework", "library", "code", "coding", "copilot"],
+    "cloud": ["cloud", "aws", "azure", "google cloud", "kubernetes", "serverless", "data center", "data centers"],
+    "hardware": ["gpu", "gpus", "nvidia", "chip", "chips", "semiconductor", "semiconductors", "tpu", "amd", "intel"],
+    "cybersecurity": ["security", "cybersecurity", "vulnerability", "vulnerabilities", "malware", "ransomware",
+                      "breach", "exploit", "phishing"],
+    "ai ethics": ["ethics", "ethical", "bias", "regulation", "ai act", "safety", "alignment", "privacy",
+                  "copyright", "misinformation", "deepfake", "deepfakes"],
+    "research": ["research", "researchers", "paper", "study", "benchmark", "benchmarks", "arxiv", "dataset",
+                 "datasets"],
+    "business": ["startup", "startups", "funding", "investment", "acquisition", "valuation", "revenue",
+                 "enterprise", "market"],
+    "healthcare": ["healthcare", "medical", "medicine", "drug discovery", "diagnosis", "patients", "clinical"],
+}
+
+# Sectors whose hits count as "technology" for the is_related_to_tech gate.
+_CORE_TECH_SECTORS = frozenset({
+    "ai", "machine learning", "llm", "robotics", "computer vision",
+    "software development", "cloud", "hardware", "cybersecurity",
+})
+
+
+def _build_keyword_index() -> Dict[str, Dict[str, List[str]]]:
+    """Splits the vocabulary into single-word and phrase lookups."""
+    words: Dict[str, List[str]] = {}
+    phrases: Dict[str, List[str]] = {}
+    for sector, keywords in SECTOR_VOCABULARY.items():
+        for keyword in keywords:
+            target = phrases if " " in keyword else words
+            target.setdefault(keyword, []).append(sector)
+    return {"words": words, "phrases": phrases}
+
+
+_KEYWORD_INDEX = _build_keyword_index()
+
+
+def _tokenize(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def split_sentences(text: str) -> List[str]:
+    """Splits text into candidate summary sentences, dropping fragments and boilerplate lines."""
+    sentences = []
+    for block in re.split(r"\n\s*\n|\n", text):
+        block = " ".join(block.split())
+        if not block:
+            continue
+        for sentence in _SENTENCE_SPLIT_RE.split(block):
+            sentence = sentence.strip()
+            if MIN_SENTENCE_CHARS <= len(sentence) <= MAX_SENTENCE_CHARS and sentence[-1:] in ".!?\"'”)":
+                sentences.append(sentence)
+        if len(sentences) >= MAX_SENTENCES:
+            break
+    return sentences[:MAX_SENTENCES]
+
+
+def _tfidf_matrix(token_lists: List[List[str]]) -> np.ndarray:
+    """Row-normalized TF-IDF matrix (sentences x vocabulary)."""
+    vocabulary: Dict[str, int] = {}
+    for tokens in token_lists:
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    matrix = np.zeros((len(token_lists), max(1, len(vocabulary))), dtype=np.float64)
+    for row, tokens in enumerate(token_lists):
+        for token, count in Counter(tokens).items():
+            matrix[row, vocabulary[token]] = 1.0 + math.log(count)
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    idf = np.log((1.0 + len(token_lists)) / (1.0 + document_frequency)) + 1.0
+    matrix *= idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _pagerank(similarity: np.ndarray, personalization: np.ndarray, damping: float = 0.85,
+              max_iter: int = 100, tol: float = 1.0e-6) -> np.ndarray:
+    n = similarity.shape[0]
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    # Sentences with no similar neighbours jump according to the personalization vector.
+    transition = np.where(row_sums > 0, similarity / np.where(row_sums == 0, 1.0, row_sums), personalization)
+    scores = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        updated = (1.0 - damping) * personalization + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tol:
+            return updated
+        scores = updated
+    return scores
+
+
+def summarize_extractive(text: str, title: Optional[str] = None, max_sentences: int = 3) -> Optional[str]:
+    """
+    TextRank-style extractive summary: sentences are ranked by PageRank over their
+    TF-IDF cosine similarity graph (biased towards the title and the lead), and the
+    best `max_sentences` are returned in their original order.
+    """
+    sentences = split_sentences(text or "")
+    if not sentences:
+        return None
+    if len(sentences) <= max_sentences:
+        return " ".join(sentences)
+
+    token_lists = [[t for t in _tokenize(s) if t not in STOPWORDS] for s in sentences]
+    title_tokens = [t for t in _tokenize(title or "") if t not in STOPWORDS]
+    matrix = _tfidf_matrix(token_lists + [title_tokens])
+    sentence_vectors, title_vector = matrix[:-1], matrix[-1]
+
+    similarity = sentence_vectors @ sentence_vectors.T
+    np.fill_diagonal(similarity, 0.0)
+
+    # Personalization: small lead bias plus similarity to the title.
+    positions = np.arange(len(sentences), dtype=np.float64)
+    personalization = 1.0 / (1.0 + positions) + sentence_vectors @ title_vector
+    personalization /= personalization.sum()
+
+    scores = _pagerank(similarity, personalization)
+    best = sorted(np.argsort(-scores)[:max_sentences])
+    return " ".join(sentences[i] for i in best)
+
+
+def tag_sectors(title: str, text: str, max_tags: int = 5) -> Dict[str, int]:
+    """Counts vocabulary hits per sector; title hits weigh three times body hits."""
+    counts: Counter = Counter()
+    for weight, chunk in ((3, title or ""), (1, text or "")):
+        tokens = _tokenize(chunk)
+        for token in tokens:
+            for sector in _KEYWORD_INDEX["words"].get(token, ()):
+                counts[sector] += weight
+        joined = " " + " ".join(tokens) + " "
+        for phrase, sectors in _KEYWORD_INDEX["phrases"].items():
+            hits = joined.count(f" {phrase} ")
+            if hits:
+                for sector in sectors:
+                    counts[sector] += weight * hits
+    return dict(counts.most_common(max_tags))
+
+
+def enrich_locally(title: str, content: str) -> Optional[Dict[str, Any]]:
+    """
+    Builds an analysis dict with the same shape as the LLM ones, using only local
+    computation. Scores are conservative heuristics: relevance comes from vocabulary
+    coverage and never exceeds 4.0, credibility is a neutral 3.0.
+    """
+    summary = summarize_extractive(content, title=title)
+    if not summary:
+        return None
+
+    sector_hits = tag_sectors(title, content)
+    tech_hits = sum(hits for sector, hits in sector_hits.items() if sector in _CORE_TECH_SECTORS)
+    title_sectors = tag_sectors(title, "")
+
+    relevance = 1.0 + min(1.5, 0.5 * len(sector_hits)) + min(1.0, tech_hits / 10.0)
+    if title_sectors:
+        relevance += 0.5
+    relevance = round(min(4.0, relevance), 1)
+
+    return {
+        "title": title,
+        "summary": summary,
+        "relevance_rating": relevance,
+        "tags": [sector for sector in sector_hits if sector_hits[sector] >= 2][:5] or list(sector_hits)[:2],
+        "is_related_to_tech": tech_hits >= 3,
+        "thumbnail_url_suggestion": None,
+        "credibility_score": 3.0,
+        "provider": LOCAL_PROVIDER,
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0},
+        "locally_generated": True,
+    }
@@ -0,0 +1,83 @@
+import logging
+import time
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.crud_news import news_item as news
+from app.db.models.news_item import NewsItemContent
+from app.schemas.news import NewsItemCreate
+
+logger = logging.getLogger(__name__)
+
+
+class NewsItemBatchWriter:
+    """
+    Persistence stage for the ingestion pipeline.
+
+    Accepted articles are buffered and written in batches with a single
+    multi-row `INSERT ... ON CONFLICT (url) DO NOTHING` per batch, so there is
+    one commit per batch instead of one commit (and refresh) per article, and
+    duplicates are skipped by the database instead of through a rollback.
+    The extracted text of inserted items is stored in the same transaction so
+    they can be re-enriched later without fetching the article again.
+    """
+
+    def __init__(self, db: AsyncSession, *, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = max(1, batch_size or settings.NEWS_INSERT_BATCH_SIZE)
+        self._buffer: List[NewsItemCreate] = []
+        self._contents: Dict[str, str] = {}
+        self.inserted = 0
+        self.skipped = 0
+        self.failed = 0
+        self.inserted_urls: Set[str] = set()
+        self.failed_urls: Set[str] = set()
+        self.elapsed_ms = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    async def add(self, item: NewsItemCreate, content: Optional[str] = None) -> None:
+        """Buffers an accepted item (and its extracted text), flushing when the batch is full."""
+        self._buffer.append(item)
+        if content:
+            self._contents[str(item.url)] = content
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Writes the buffered items in one statement and commits. Returns the number inserted."""
+        if not self._buffer:
+            return 0
+        batch, self._buffer = self._buffer, []
+        contents, self._contents = self._contents, {}
+        start = time.perf_counter()
+        try:
+            inserted_rows = await news.insert_many_ignore_duplicates(self.db, objs_in=batch)
+            content_rows = [
+                {"news_item_id": item_id, "content": contents[url]}
+                for item_id, url in inserted_rows
+                if url in contents
+            ]
+            if content_rows:
+                await self.db.execute(insert(NewsItemContent), content_rows)
+            await self.db.commit()
+        except Exception as e:
+            logger.error(f"Error persisting a batch of {len(batch)} news items: {e}", exc_info=True)
+            await self.db.rollback()
+            self.failed += len(batch)
+            self.failed_urls.update(str(item.url) for item in batch)
+            return 0
+        finally:
+            self.elapsed_ms += int((time.perf_counter() - start) * 1000)
+
+        inserted_count = len(inserted_rows)
+        self.inserted += inserted_count
+        self.skipped += len(batch) - inserted_count
+        self.inserted_urls.update(url for _, url in inserted_rows)
+        logger.info(f"Persisted news batch: {inserted_count} inserted, {len(batch) - inserted_count} skipped as duplicates.")
+        return inserted_count
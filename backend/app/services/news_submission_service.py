@@ -0,0 +1,173 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Set
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.task_queue import QueueFullError, TaskQueue
+from app.crud.crud_news import news_item as crud_news
+from app.crud.crud_news_submission import news_submission as crud_submission
+from app.db.models.news_item import NewsItem
+from app.db.models.news_submission import NewsSubmission
+from app.db.session import AsyncSessionLocal
+from app.schemas.news import NewsItemCreate
+from app.services.gemini_service import GeminiService, llm_providers_available
+from app.utils import is_valid_image_url
+
+logger = logging.getLogger(__name__)
+
+MIN_RELEVANCE_RATING = 2.5
+
+# Content downloads and LLM calls of community news submissions run here, outside the requests.
+analysis_queue = TaskQueue(
+    "news-analysis",
+    workers=settings.NEWS_SUBMISSION_WORKERS,
+    max_size=settings.NEWS_SUBMISSION_QUEUE_SIZE,
+)
+# Retries waiting out their backoff before re-entering the queue; cancelled on shutdown.
+_delayed_tasks: Set[asyncio.Task] = set()
+
+
+class SubmissionRejectedError(Exception):
+    """The content will not become a news item; retrying would not change that."""
+
+
+class SubmissionRetryError(Exception):
+    """The analysis could not run this time (page unreachable, no LLM available); worth retrying."""
+
+
+def enqueue(submission_id: str) -> None:
+    """Queues the analysis of a stored submission. Raises QueueFullError when the backlog is at its limit."""
+    analysis_queue.submit(lambda: process_submission(submission_id))
+
+
+def _enqueue_later(submission_id: str, delay: float) -> None:
+    async def wait_and_enqueue() -> None:
+        await asyncio.sleep(delay)
+        while True:
+            try:
+                enqueue(submission_id)
+                return
+            except QueueFullError:
+                await asyncio.sleep(settings.NEWS_SUBMISSION_RETRY_DELAY_SECONDS)
+
+    task = asyncio.get_running_loop().create_task(wait_and_enqueue())
+    _delayed_tasks.add(task)
+    task.add_done_callback(_delayed_tasks.discard)
+
+
+async def cancel_delayed_retries() -> None:
+    """Cancels the retries still waiting out their backoff (resume_active_submissions picks them up on startup)."""
+    tasks = list(_delayed_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff: the base delay after the first attempt, doubled after each further one."""
+    return settings.NEWS_SUBMISSION_RETRY_DELAY_SECONDS * 2 ** (attempts - 1)
+
+
+async def process_submission(submission_id: str) -> None:
+    """
+    One attempt at analysing a pending submission and creating its news item.
+    Transient failures are retried with backoff until NEWS_SUBMISSION_MAX_ATTEMPTS.
+    """
+    async with AsyncSessionLocal() as db:
+        submission = await crud_submission.get(db, id=submission_id)
+        if submission is None or submission.status not in ("pending", "processing"):
+            return
+        await crud_submission.start_attempt(db, db_obj=submission)
+        url, attempts = submission.url, submission.attempts  # A rollback below expires the instance
+        try:
+            news_item = await _analyze_and_create(db, submission)
+        except SubmissionRejectedError as e:
+            logger.info(f"[NewsSubmission {submission_id}] Rejected {url}: {e}")
+            await crud_submission.finish(db, db_obj=submission, error=str(e))
+            return
+        except SubmissionRetryError as e:
+            error = str(e)
+        except Exception as e:
+            logger.error(f"[NewsSubmission {submission_id}] Error processing {url}: {e}", exc_info=True)
+            await db.rollback()
+            error = "An unexpected error occurred while processing the URL."
+        else:
+            await crud_submission.finish(db, db_obj=submission, result_id=news_item.id)
+            logger.info(f"[NewsSubmission {submission_id}] News item '{news_item.title}' created from {url}.")
+            return
+
+        if attempts < settings.NEWS_SUBMISSION_MAX_ATTEMPTS:
+            delay = retry_delay(attempts)
+            logger.info(f"[NewsSubmission {submission_id}] Attempt {attempts} failed ({error}); retrying in {delay:.0f}s.")
+            await crud_submission.schedule_retry(
+                db, db_obj=submission, error=error, at=datetime.now(timezone.utc) + timedelta(seconds=delay)
+            )
+            _enqueue_later(submission_id, delay)
+        else:
+            logger.warning(f"[NewsSubmission {submission_id}] Giving up on {url} after {attempts} attempts: {error}")
+            await crud_submission.finish(db, db_obj=submission, error=error, retryable=True)
+
+
+async def _analyze_and_create(db: AsyncSession, submission: NewsSubmission) -> NewsItem:
+    url = submission.url
+    existing_item = await crud_news.get_by_url(db=db, url=url)
+    if existing_item is not None:
+        if existing_item.submitted_by_user_id == submission.submitted_by_user_id:
+            return existing_item  # Created by this submission before an interruption
+        raise SubmissionRejectedError("This URL has already been submitted.")
+
+    gemini_service = GeminiService()
+    content = await gemini_service.get_content_from_url(url)
+    if not content:
+        raise SubmissionRetryError("Could not retrieve content from the URL.")
+
+    if not llm_providers_available():
+        raise SubmissionRetryError("The AI analysis service is currently unavailable.")
+    # The page title is not known yet: the URL stands in for it and the model proposes one.
+    analysis = await gemini_service.evaluate_and_summarize_content(title=url, content=content)
+    if not analysis:
+        raise SubmissionRetryError("The content could not be analyzed.")
+
+    if (
+        not analysis.get("summary")
+        or not analysis.get("is_related_to_tech", False)
+        or analysis.get("relevance_rating", 0) < MIN_RELEVANCE_RATING
+    ):
+        logger.info(f"URL {url} deemed not relevant.")
+        raise SubmissionRejectedError("The content of the URL is not considered relevant to AI or could not be analyzed.")
+
+    image_url = analysis.get("thumbnail_url_suggestion")
+    if image_url and not await is_valid_image_url(image_url):
+        image_url = None
+
+    news_item_data = NewsItemCreate(
+        title=analysis.get("title") or url,
+        url=url,
+        description=analysis["summary"],
+        relevance_rating=analysis.get("relevance_rating"),
+        sectors=analysis.get("tags", []),
+        imageUrl=image_url,
+        is_community=True,
+        submitted_by_user_id=submission.submitted_by_user_id,
+        publishedAt=datetime.now(timezone.utc),
+        enrichment_source=analysis.get("provider"),
+        prompt_version=analysis.get("prompt_version"),
+    )
+    return await crud_news.create(db=db, obj_in=news_item_data)
+
+
+async def resume_active_submissions() -> None:
+    """Queues again the submissions left pending or processing by a previous process, keeping their retry delays."""
+    async with AsyncSessionLocal() as db:
+        submissions = await crud_submission.get_by_status(db)
+    now = datetime.now(timezone.utc)
+    for submission in submissions:
+        next_attempt_at = submission.next_attempt_at
+        if next_attempt_at is not None and next_attempt_at.tzinfo is None:
+            next_attempt_at = next_attempt_at.replace(tzinfo=timezone.utc)  # SQLite returns naive UTC values
+        _enqueue_later(submission.id, max(0.0, (next_attempt_at - now).total_seconds()) if next_attempt_at else 0.0)
+    if submissions:
+        logger.info(f"Resumed {len(submissions)} news submissions.")
@@ -0,0 +1,137 @@
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import HttpUrl
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.quota import QuotaTicket, quotas
+from app.core.task_queue import QueueFullError, TaskQueue
+from app.crud.crud_resource_link import resource_link as crud_resource_link
+from app.crud.crud_resource_submission import resource_submission as crud_submission
+from app.db.models.resource_link import ResourceLink
+from app.db.models.resource_submission import ResourceSubmission
+from app.db.session import AsyncSessionLocal
+from app.schemas.resource_link import ResourceLinkCreate
+from app.services import gemini_service
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_MESSAGE = "This resource has already been added. Thank you for your contribution."
+
+# Page downloads, Playwright and LLM calls of submitted resources run here, outside the requests.
+analysis_queue = TaskQueue(
+    "resource-analysis",
+    workers=settings.RESOURCE_ANALYSIS_WORKERS,
+    max_size=settings.RESOURCE_ANALYSIS_QUEUE_SIZE,
+)
+
+
+class SubmissionError(Exception):
+    """The submission cannot become a resource link; the message is shown to its author."""
+
+
+def enqueue(submission_id: str, ticket: Optional[QuotaTicket] = None) -> None:
+    """Queues the analysis of a stored submission. Raises QueueFullError when the backlog is at its limit."""
+    analysis_queue.submit(lambda: process_submission(submission_id, ticket))
+
+
+async def process_submission(submission_id: str, ticket: Optional[QuotaTicket] = None) -> None:
+    """
+    Analyses a pending submission and creates its resource link. A failed
+    submission gives back its quota slot, as nothing was added.
+    """
+    async with AsyncSessionLocal() as db:
+        submission = await crud_submission.get(db, id=submission_id)
+        if submission is None or submission.status not in ("pending", "processing"):
+            return
+        await crud_submission.mark_processing(db, db_obj=submission)
+        url = submission.url  # A rollback below expires the instance
+        try:
+            resource = await _analyze_and_create(db, submission)
+        except SubmissionError as e:
+            error = str(e)
+        except Exception as e:
+            logger.error(f"[Submission {submission_id}] Error analysing {url}: {e}", exc_info=True)
+            await db.rollback()
+            error = "Internal server error creating resource link."
+        else:
+            await crud_submission.finish(db, db_obj=submission, result_id=resource.id)
+            logger.info(f"[Submission {submission_id}] Resource link {resource.id} created for {url}")
+            return
+        logger.info(f"[Submission {submission_id}] Rejected {url}: {error}")
+        await crud_submission.finish(db, db_obj=submission, error=error)
+    if ticket is not None:
+        await quotas.release(ticket)
+
+
+async def _analyze_and_create(db: AsyncSession, submission: ResourceSubmission) -> ResourceLink:
+    existing = await crud_resource_link.get_by_url(db, url=submission.url)
+    if existing is not None:
+        if existing.author_id == submission.author_id:
+            return existing  # Created by this submission before an interruption
+        raise SubmissionError(DUPLICATE_MESSAGE)
+
+    # --- Validation and enrichment with Gemini ---
+    try:
+        logger.debug(f"Calling gemini_service for URL: {submission.url}")
+        generated_details = await gemini_service.generate_resource_details(
+            url=submission.url,
+            user_title=submission.title,
+            user_personal_note=submission.personal_note,
+        )
+        logger.debug(f"Received Gemini details: {generated_details}")
+    except ValueError as e:
+        # The content is not relevant or the JSON is invalid
+        logger.warning(f"Gemini validation failed for {submission.url}: {e}")
+        raise SubmissionError(str(e))
+    except Exception as e:
+        logger.error(f"Error calling gemini_service.generate_resource_details for {submission.url}: {e}", exc_info=True)
+        raise SubmissionError("The AI analysis service is currently unavailable.")
+
+    if not generated_details:
+        raise SubmissionError("Could not generate resource details.")
+
+    db_obj_data = {"url": submission.url, "title": submission.title, "personal_note": submission.personal_note}
+    db_obj_data = {key: value for key, value in db_obj_data.items() if value is not None}
+    db_obj_data.update(generated_details)
+
+    # Convert tags to string if it's a list
+    if isinstance(db_obj_data.get("tags"), list):
+        db_obj_data["tags"] = ", ".join(db_obj_data["tags"])
+
+    db_obj_data["created_at"] = datetime.now(timezone.utc)
+
+    # Validate and assign thumbnail_url
+    thumbnail_url_suggestion = db_obj_data.get("thumbnail_url_suggestion")
+    if thumbnail_url_suggestion:
+        try:
+            HttpUrl(thumbnail_url_suggestion)
+            db_obj_data["thumbnail_url"] = thumbnail_url_suggestion
+        except Exception:
+            logger.warning(f"AI suggested thumbnail URL is not valid: {thumbnail_url_suggestion}.")
+            db_obj_data["thumbnail_url"] = None
+
+    db_obj_in = ResourceLinkCreate(**db_obj_data)
+    logger.info(f"Final data to create ResourceLink (after Gemini): Title: '{db_obj_in.title}', Type: {db_obj_in.resource_type}")
+    try:
+        return await crud_resource_link.create_with_author(db=db, obj_in=db_obj_in, author_id=submission.author_id)
+    except IntegrityError:  # Another spelling of the URL was stored while this one was being analysed
+        await db.rollback()
+        raise SubmissionError(DUPLICATE_MESSAGE)
+
+
+async def resume_active_submissions() -> None:
+    """Queues again the submissions left pending or processing by a previous process."""
+    async with AsyncSessionLocal() as db:
+        submissions = await crud_submission.get_by_status(db)
+    for submission in submissions:
+        try:
+            enqueue(submission.id)
+        except QueueFullError:
+            logger.warning(f"Analysis queue full: {submission.id} and later submissions stay pending until the next restart.")
+            break
+    if submissions:
+        logger.info(f"Resumed {len(submissions)} resource submissions.")
@@ -1,17 +1,21 @@
 import logging
 import re
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List, Tuple
 
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from pydantic import BaseModel
+import httpx
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.crud.crud_resource_link import resource_link as crud_resource_link
 
 logger = logging.getLogger(__name__)
 
-YOUTUBE_API_SERVICE_NAME = "youtube"
-YOUTUBE_API_VERSION = "v3"
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+# Most ids `videos.list` accepts in one call (one quota unit whatever the count).
+MAX_IDS_PER_CALL = 50
+MAX_CACHE_ENTRIES = 5000
 
 class YouTubeResource(BaseModel):
     id: str
@@ -19,40 +23,104 @@ class YouTubeResource(BaseModel):
     description: str
     thumbnail_url: str
     kind: str # 'video' or 'channel'
+    tags: List[str] = Field(default_factory=list)
 
-def get_youtube_resource_details(url: str) -> Optional[YouTubeResource]:
+# Pooled client for the Data API, created on first use and closed on shutdown (`close`).
+_client: Optional[httpx.AsyncClient] = None
+# (kind, id) -> (expires at, details or None when YouTube does not know it)
+_cache: Dict[Tuple[str, str], Tuple[float, Optional[YouTubeResource]]] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(base_url=YOUTUBE_API_URL, timeout=15.0)
+    return _client
+
+
+async def close() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _cache_get(kind: str, key: str) -> Tuple[bool, Optional[YouTubeResource]]:
+    entry = _cache.get((kind, key))
+    if entry is None or entry[0] < time.monotonic():
+        return False, None
+    return True, entry[1]
+
+
+def _cache_put(kind: str, key: str, resource: Optional[YouTubeResource]) -> None:
+    if len(_cache) >= MAX_CACHE_ENTRIES:
+        _cache.pop(next(iter(_cache)))  # Oldest insertion first
+    _cache.pop((kind, key), None)
+    _cache[(kind, key)] = (time.monotonic() + settings.YOUTUBE_CACHE_TTL_SECONDS, resource)
+
+
+async def _api_get(resource: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    response = await _get_client().get(f"/{resource}", params={**params, "key": settings.YOUTUBE_API_KEY})
+    response.raise_for_status()
+    return response.json().get("items", [])
+
+
+async def get_youtube_resource_details(url: str) -> Optional[YouTubeResource]:
     """
     Gets the details of a YouTube resource (video or channel) from a URL.
+    Answers are cached for YOUTUBE_CACHE_TTL_SECONDS, misses included.
     """
     if not settings.YOUTUBE_API_KEY:
         logger.warning("YOUTUBE_API_KEY is not configured. YouTube service will not work.")
         return None
 
     try:
-        youtube = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=settings.YOUTUBE_API_KEY)
-
         # Identify if it's a video or a channel and extract the ID
         video_id = _extract_video_id(url)
         channel_id = _extract_channel_id(url)
 
         if video_id:
-            return _get_video_details(youtube, video_id)
+            return (await get_videos([video_id])).get(video_id)
         elif channel_id:
-            return _get_channel_details(youtube, channel_id)
+            return await _get_channel_details(channel_id)
         else:
             logger.info(f"The URL does not appear to be a valid YouTube video or channel: {url}")
             return None
 
-    except HttpError as e:
-        logger.error(f"YouTube API error: {e.content}", exc_info=True)
+    except httpx.HTTPStatusError as e:
+        logger.error(f"YouTube API error: {e.response.status_code} - {e.response.text}")
         # If it's a quota error, we might want to handle it differently
-        if e.resp.status == 403:
+        if e.response.status_code == 403:
             logger.error("YouTube API 403 error: Check quota or API Key configuration.")
         return None
     except Exception as e:
         logger.error(f"Unexpected error in YouTube service: {e}", exc_info=True)
         return None
 
+async def get_videos(video_ids: List[str], *, use_cache: bool = True) -> Dict[str, YouTubeResource]:
+    """
+    Details of the given videos, keyed by id; unknown (deleted, private) videos
+    are left out. Ids not in the cache are fetched MAX_IDS_PER_CALL per call.
+    Raises httpx errors.
+    """
+    found: Dict[str, YouTubeResource] = {}
+    missing: List[str] = []
+    for video_id in dict.fromkeys(video_ids):
+        hit, resource = _cache_get("video", video_id) if use_cache else (False, None)
+        if not hit:
+            missing.append(video_id)
+        elif resource is not None:
+            found[video_id] = resource
+
+    for start in range(0, len(missing), MAX_IDS_PER_CALL):
+        batch = missing[start:start + MAX_IDS_PER_CALL]
+        items = await _api_get("videos", {"part": "snippet", "id": ",".join(batch)})
+        fetched = {item["id"]: _video_from_item(item) for item in items}
+        for video_id in batch:
+            _cache_put("video", video_id, fetched.get(video_id))
+        found.update(fetched)
+    return found
+
 def _extract_video_id(url: str) -> Optional[str]:
     """Extracts the video ID from a YouTube URL more robustly."""
     # Unified pattern that covers various YouTube URL formats
@@ -69,44 +137,39 @@ def _extract_channel_id(url: str) -> Optional[str]:
         'handle': r"(?:youtube\.com\/)(@[\w.-]+)",
         'channel_id': r"(?:youtube\.com\/channel\/)(UC[\w-]+)",
     }
-    
+
     match = re.search(patterns['handle'], url)
     if match: return match.group(1)
 
     match = re.search(patterns['channel_id'], url)
     if match: return match.group(1)
-    
+
     # Fallback for legacy /c/name URLs
     match = re.search(r"(?:youtube\.com\/c\/)([\w-]+)", url)
     if match: return match.group(1)
 
     return None
 
-def _get_video_details(youtube, video_id: str) -> Optional[YouTubeResource]:
-    """Gets the details of a specific video."""
-    request = youtube.videos().list(
-        part="snippet",
-        id=video_id
-    )
-    response = request.execute()
-    
-    if not response.get("items"):
-        return None
-
-    video_item = response["items"][0]["snippet"]
+def _video_from_item(item: Dict[str, Any]) -> YouTubeResource:
+    video_item = item["snippet"]
     thumbnail = video_item["thumbnails"].get("standard", video_item["thumbnails"].get("high", {}))
     return YouTubeResource(
-        id=video_id,
+        id=item["id"],
         title=video_item["title"],
         description=video_item["description"],
         thumbnail_url=thumbnail.get("url"),
-        kind="video"
+        kind="video",
+        tags=video_item.get("tags", []),
     )
 
-def _get_channel_details(youtube, channel_identifier: str) -> Optional[YouTubeResource]:
+async def _get_channel_details(channel_identifier: str) -> Optional[YouTubeResource]:
     """Gets the details of a specific channel using its ID, handle, or custom URL."""
+    hit, cached = _cache_get("channel", channel_identifier)
+    if hit:
+        return cached
+
     request_params = {'part': "snippet"}
-    
+
     if channel_identifier.startswith('@'):
         request_params['forHandle'] = channel_identifier.replace('@', '')
     elif channel_identifier.startswith('UC'):
@@ -115,21 +178,44 @@ def _get_channel_details(youtube, channel_identifier: str) -> Optional[YouTubeRe
         # For old custom URLs, search by username (ID)
         request_params['forUsername'] = channel_identifier
 
-    request = youtube.channels().list(**request_params)
-    response = request.execute()
+    items = await _api_get("channels", request_params)
 
-    if not response.get("items"):
+    if not items:
         logger.warning(f"No channel found for identifier: {channel_identifier}")
+        _cache_put("channel", channel_identifier, None)
         return None
 
-    channel_item = response["items"][0]
+    channel_item = items[0]
     snippet = channel_item["snippet"]
     thumbnail = snippet["thumbnails"].get("high", snippet["thumbnails"].get("default", {}))
-    
-    return YouTubeResource(
+
+    resource = YouTubeResource(
         id=channel_item["id"],
         title=snippet["title"],
         description=snippet["description"],
         thumbnail_url=thumbnail.get("url"),
         kind="channel"
-    )
\ No newline at end of file
+    )
+    _cache_put("channel", channel_identifier, resource)
+    return resource
+
+async def refresh_stored_videos(db: AsyncSession) -> int:
+    """
+    Re-pulls the metadata of the videos behind stored resource links (bypassing
+    the cache, which it refills) and updates their thumbnails. Returns how many
+    links changed. Does not commit.
+    """
+    if not settings.YOUTUBE_API_KEY:
+        return 0
+    links = await crud_resource_link.get_youtube_links(db)
+    ids_by_link = {link_id: _extract_video_id(url) for link_id, url, _ in links}
+    videos = await get_videos([video_id for video_id in ids_by_link.values() if video_id], use_cache=False)
+
+    thumbnails = {}
+    for link_id, _, thumbnail_url in links:
+        video = videos.get(ids_by_link[link_id])
+        if video is not None and video.thumbnail_url and video.thumbnail_url != thumbnail_url:
+            thumbnails[link_id] = video.thumbnail_url
+    await crud_resource_link.set_thumbnails(db, thumbnails=thumbnails)
+    logger.info(f"[YouTube] Refreshed {len(videos)}/{len(links)} stored videos; {len(thumbnails)} thumbnails changed.")
+    return len(thumbnails)
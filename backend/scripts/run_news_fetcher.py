@@ -40,7 +40,7 @@ async def main():
                 return
 
             logger.info("Superusuario encontrado. Iniciando la obtención y almacenamiento de noticias.")
-            await fetch_and_store_news(db=session, user=superuser)
+            await fetch_and_store_news(db=session, user=superuser, trigger="manual")
             logger.info("Proceso de obtención de noticias completado con éxito.")
         except Exception as e:
             logger.error(f"Ocurrió un error durante la ejecución del fetcher: {e}", exc_info=True)
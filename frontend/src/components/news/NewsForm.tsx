@@ -1,7 +1,7 @@
 import React, { useState } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { toast } from 'sonner';
-import { submitNewsItem } from '@/services/newsService';
+import { submitNewsItem, waitForNewsSubmission } from '@/services/newsService';
 import type { NewsItemRead } from '@/types';
 
 interface NewsFormProps {
@@ -37,9 +37,10 @@ const NewsForm: React.FC<NewsFormProps> = ({ onNewsItemAdded }) => {
     setFormError(null);
 
     try {
-      const newNewsItem = await submitNewsItem(token, url);
+      const submission = await submitNewsItem(token, url);
       toast.success('¡Noticia enviada! Se está procesando y se añadirá a la lista si es relevante.');
       setUrl('');
+      const newNewsItem = await waitForNewsSubmission(token, submission.id);
       onNewsItemAdded(newNewsItem);
     } catch (err) {
       const error = err as Error & { response?: { data?: { detail?: string } } };
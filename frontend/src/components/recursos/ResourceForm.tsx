@@ -1,13 +1,15 @@
 import React, { useState } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { toast } from 'sonner';
-import type { ResourceLink } from '@/types'; // Importación unificada
+import type { ResourceLink, ResourceSubmission } from '@/types'; // Importación unificada
 import type { ResourceLinkCreate } from '@/types/api'; // Importación para el payload
 
 interface ResourceFormProps {
   onResourceAdded: (newResource: ResourceLink) => void; // Callback que ahora espera el nuevo recurso
 }
 
+const POLL_INTERVAL_MS = 2000;
+
 const ResourceForm: React.FC<ResourceFormProps> = ({ onResourceAdded }) => {
   const [url, setUrl] = useState('');
   const [isSubmitting, setIsSubmitting] = useState(false);
@@ -16,6 +18,26 @@ const ResourceForm: React.FC<ResourceFormProps> = ({ onResourceAdded }) => {
 
   const API_V1_URL = process.env.NEXT_PUBLIC_API_V1_URL || 'http://localhost:8000/api/v1';
 
+  // El análisis se hace en segundo plano: consultamos el envío hasta que termine.
+  const waitForSubmission = async (submissionId: string): Promise<ResourceLink> => {
+    for (;;) {
+      await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+      const response = await fetch(`${API_V1_URL}/resource-links/submissions/${submissionId}`, {
+        headers: { 'Authorization': `Bearer ${token}` },
+      });
+      const submission: ResourceSubmission = await response.json();
+      if (!response.ok) {
+        throw new Error((submission as any).detail || `Error ${response.status} al consultar el envío`);
+      }
+      if (submission.status === 'failed') {
+        throw new Error(submission.error || 'No se pudo añadir el recurso.');
+      }
+      if (submission.status === 'completed' && submission.resource) {
+        return submission.resource;
+      }
+    }
+  };
+
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
     if (!url.trim()) {
@@ -54,8 +76,9 @@ const ResourceForm: React.FC<ResourceFormProps> = ({ onResourceAdded }) => {
         throw new Error(responseData.detail || `Error ${response.status} al añadir el recurso`);
       }
       
-      const newResource: ResourceLink = responseData;
-      toast.success('¡Recurso enviado! Se ha añadido a la lista.');
+      toast.info('¡Recurso enviado! Lo estamos analizando...');
+      const newResource = await waitForSubmission((responseData as ResourceSubmission).id);
+      toast.success('Recurso analizado. Se ha añadido a la lista.');
       setUrl(''); 
       onResourceAdded(newResource); // Devolver el nuevo recurso
       
@@ -1,16 +1,18 @@
 import apiClient from '@/lib/api-client';
-import type { NewsItemRead, NewsItemSubmit } from '@/types';
+import type { NewsItemRead, NewsItemSubmit, NewsSubmission } from '@/types';
+
+const POLL_INTERVAL_MS = 3000;
 
 /**
- * Submits a new news item URL to the backend.
+ * Submits a new news item URL to the backend. It is processed in the background.
  * @param token The authentication token for the user.
  * @param url The URL of the news item to submit.
- * @returns The newly created news item.
+ * @returns The pending submission.
  */
-export const submitNewsItem = async (token: string, url: string): Promise<NewsItemRead> => {
+export const submitNewsItem = async (token: string, url: string): Promise<NewsSubmission> => {
   const payload: NewsItemSubmit = { url };
   
-  const response = await apiClient<NewsItemRead>('/news/submit', {
+  const response = await apiClient<NewsSubmission>('/news/submit', {
     method: 'POST',
     token: token,
     body: payload,
@@ -19,6 +21,25 @@ export const submitNewsItem = async (token: string, url: string): Promise<NewsIt
   return response;
 };
 
+/**
+ * Polls a news submission until it is processed.
+ * @param token The authentication token for the user.
+ * @param submissionId The ID returned by submitNewsItem.
+ * @returns The created news item; throws with the reason if it was rejected.
+ */
+export const waitForNewsSubmission = async (token: string, submissionId: string): Promise<NewsItemRead> => {
+  for (;;) {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    const submission = await apiClient<NewsSubmission>(`/news/submissions/${submissionId}`, { token });
+    if (submission.status === 'failed') {
+      throw new Error(submission.error || 'No se pudo procesar la noticia.');
+    }
+    if (submission.status === 'completed' && submission.news_item) {
+      return submission.news_item;
+    }
+  }
+};
+
 /**
  * Fetches news items from the API.
  * @param options Optional parameters like limit and skip.
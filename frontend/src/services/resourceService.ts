@@ -1,5 +1,5 @@
 import apiClient from '@/lib/api-client';
-import type { ResourceLink, ResourceLinkCreate } from '@/types';
+import type { ResourceLink, ResourceLinkCreate, ResourceSubmission } from '@/types';
 
 /**
  * Fetches all resource links.
@@ -9,13 +9,14 @@ export const getResourceLinks = async (): Promise<ResourceLink[]> => {
 };
 
 /**
- * Creates a new resource link.
+ * Submits a new resource link. It is analysed in the background: poll
+ * `/resource-links/submissions/{id}` until it is completed or failed.
  */
 export const createResourceLink = async (
   token: string,
   resourceData: ResourceLinkCreate
-): Promise<ResourceLink> => {
-  return apiClient<ResourceLink>('/resource-links/', {
+): Promise<ResourceSubmission> => {
+  return apiClient<ResourceSubmission>('/resource-links/', {
     method: 'POST',
     token,
     body: resourceData,
@@ -64,6 +64,22 @@ export interface NewsItemSubmit {
   url: string;
 }
 
+// Noticia enviada, procesada en segundo plano (NewsSubmissionRead del backend)
+export interface NewsSubmission {
+  id: string;
+  url: string;
+  status: 'pending' | 'processing' | 'completed' | 'failed';
+  attempts: number;
+  error?: string | null;
+  retryable: boolean;
+  next_attempt_at?: string | null;
+  news_item_id?: string | null;
+  created_at: string;
+  updated_at: string;
+  finished_at?: string | null;
+  news_item?: NewsItemRead | null;
+}
+
 export interface NewsItemCreate {
   title: string;
   url: string;
@@ -96,6 +112,19 @@ export interface ResourceLink {
   is_new?: boolean; // Se calculará en el frontend
 }
 
+// Envío de un recurso, analizado en segundo plano (ResourceSubmissionRead del backend)
+export interface ResourceSubmission {
+  id: string;
+  url: string;
+  status: 'pending' | 'processing' | 'completed' | 'failed';
+  error?: string | null;
+  resource_link_id?: string | null;
+  created_at: string;
+  updated_at: string;
+  finished_at?: string | null;
+  resource?: ResourceLink | null;
+}
+
 // Interfaz básica para el Usuario (para el frontend)
 export interface UserSession {
   id: number | string; // Podría ser int o string dependiendo de tu backend user ID